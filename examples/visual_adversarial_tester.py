@@ -61,10 +61,12 @@ class VisualPromptTester:
         else:
             raise ValueError(f"Unknown provider: {provider}")
         
+        # Attacked decks are compared against fresh baseline scores, never cached ones
         self.evaluator = PresentationEvaluator(
             api_key=api_key,
             model=model,
-            provider=provider
+            provider=provider,
+            use_cache=False
         )
         
         # Results storage
@@ -235,6 +235,11 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event"""
     logger.info("Shutting down OpenCanvas API server...")
+    
+    # Close the warm browsers used for Playwright conversions
+    from opencanvas.conversion.browser_pool import close_browser_pool, close_async_browser_pool
+    close_browser_pool()
+    await close_async_browser_pool()
 
 
 # Include routes
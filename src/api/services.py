@@ -14,7 +14,7 @@ from datetime import datetime
 
 from opencanvas.config import Config
 from opencanvas.generators.router import GenerationRouter
-from opencanvas.conversion.html_to_pdf import PresentationConverter
+from opencanvas.conversion.async_converter import AsyncPresentationConverter
 from opencanvas.evaluation.evaluator import PresentationEvaluator
 from .models import (
     GenerateResponse, ConvertResponse, EvaluateResponse, PipelineResponse,
@@ -159,21 +159,16 @@ class ConversionService:
                     error="Zoom factor must be between 0.1 and 3.0"
                 )
             
-            # Run conversion in thread pool
-            loop = asyncio.get_event_loop()
-            converter = PresentationConverter(
+            # Playwright conversions run on the event loop's browser pool,
+            # other methods in the thread pool
+            converter = AsyncPresentationConverter(
                 html_file=html_file,
                 output_dir=output_dir,
                 method=method,
                 zoom_factor=zoom_factor
             )
             
-            pdf_path = await loop.run_in_executor(
-                None,
-                converter.convert,
-                output_filename,
-                cleanup
-            )
+            pdf_path = await converter.convert(output_filename, cleanup)
             
             return ConvertResponse(
                 success=True,
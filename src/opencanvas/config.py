@@ -21,18 +21,103 @@ class Config:
     DEFAULT_THEME = os.getenv('DEFAULT_THEME', 'professional blue')
     DEFAULT_PURPOSE = os.getenv('DEFAULT_PURPOSE', 'general presentation')
     OUTPUT_DIR = Path(os.getenv('OUTPUT_DIR', 'output'))
+    CACHE_DIR = Path(os.getenv('OPENCANVAS_CACHE_DIR', Path.home() / '.cache' / 'opencanvas'))
     
     # Models
     CLAUDE_MODEL = os.getenv('CLAUDE_MODEL', 'claude-3-7-sonnet-20250219')
     CLAUDE_ASSESSMENT_MODEL = os.getenv('CLAUDE_ASSESSMENT_MODEL', 'claude-sonnet-4-20250514')
     
+    # LLM transport: 'direct' sends requests immediately, 'batch' groups them into message batches
+    LLM_TRANSPORT = os.getenv('LLM_TRANSPORT', 'direct')
+    LLM_BATCH_MAX_SIZE = int(os.getenv('LLM_BATCH_MAX_SIZE', '100'))
+    LLM_BATCH_MAX_WAIT_SECONDS = float(os.getenv('LLM_BATCH_MAX_WAIT_SECONDS', '5'))
+    LLM_BATCH_POLL_SECONDS = float(os.getenv('LLM_BATCH_POLL_SECONDS', '10'))
+    
+    # Shared Anthropic connection pool and retry policy
+    LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '20'))
+    LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('LLM_MAX_KEEPALIVE_CONNECTIONS', '20'))
+    LLM_KEEPALIVE_SECONDS = float(os.getenv('LLM_KEEPALIVE_SECONDS', '60'))
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '3'))
+    LLM_TIMEOUT_SECONDS = float(os.getenv('LLM_TIMEOUT_SECONDS', '600'))
+    
+    # Provider rate limits: "provider[/model]=RPM:TPM[:CONCURRENCY]" entries, 0 = unlimited
+    LLM_RATE_LIMITS = os.getenv('LLM_RATE_LIMITS', '')
+    
+    # Research settings (topic generation)
+    RESEARCH_DEADLINE_SECONDS = float(os.getenv('RESEARCH_DEADLINE_SECONDS', '45'))
+    RESEARCH_MAX_WORKERS = int(os.getenv('RESEARCH_MAX_WORKERS', '5'))
+    SCRAPE_CACHE_ENABLED = os.getenv('SCRAPE_CACHE_ENABLED', 'true').lower() == 'true'
+    SCRAPE_CACHE_TTL_HOURS = float(os.getenv('SCRAPE_CACHE_TTL_HOURS', '24'))
+    SCRAPE_CACHE_MAX_MB = float(os.getenv('SCRAPE_CACHE_MAX_MB', '100'))
+    SEARCH_CACHE_ENABLED = os.getenv('SEARCH_CACHE_ENABLED', 'true').lower() == 'true'
+    SEARCH_CACHE_MAX_MB = float(os.getenv('SEARCH_CACHE_MAX_MB', '20'))
+    
+    # Batch generation settings
+    BATCH_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '4'))
+    BATCH_MAX_RETRIES = int(os.getenv('BATCH_MAX_RETRIES', '2'))
+    
     # Conversion settings
     DEFAULT_ZOOM = float(os.getenv('DEFAULT_ZOOM', '1.2'))
     DEFAULT_CONVERSION_METHOD = os.getenv('DEFAULT_CONVERSION_METHOD', 'playwright')
     
+    # Incremental pipeline: validate and render slides while the deck is still streaming
+    INCREMENTAL_PIPELINE = os.getenv('INCREMENTAL_PIPELINE', 'false').lower() == 'true'
+    INCREMENTAL_RENDER = os.getenv('INCREMENTAL_RENDER', 'true').lower() == 'true'
+    
+    # Warm Chromium pool shared by all Playwright conversions in a process
+    BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '2'))
+    BROWSER_POOL_MAX_JOBS = int(os.getenv('BROWSER_POOL_MAX_JOBS', '50'))
+    # Concurrent pages per browser for async conversions
+    BROWSER_POOL_PAGES_PER_BROWSER = int(os.getenv('BROWSER_POOL_PAGES_PER_BROWSER', '8'))
+    # 'per_slide' prints and merges each slide as the deck shows it, 'single_pass' (opt-in) restyles
+    # the deck so one page.pdf call prints every slide, 'parallel' splits the slides across
+    # PARALLEL_CAPTURE_PAGES pages rendered concurrently
+    PLAYWRIGHT_RENDER_MODE = os.getenv('PLAYWRIGHT_RENDER_MODE', 'per_slide')
+    PARALLEL_CAPTURE_PAGES = int(os.getenv('PARALLEL_CAPTURE_PAGES', '4'))
+    # Content-addressed cache of conversion results (whole decks and single slides)
+    CONVERSION_CACHE_ENABLED = os.getenv('CONVERSION_CACHE_ENABLED', 'true').lower() == 'true'
+    CONVERSION_CACHE_MAX_MB = float(os.getenv('CONVERSION_CACHE_MAX_MB', '500'))
+    CONVERSION_CACHE_TTL_HOURS = float(os.getenv('CONVERSION_CACHE_TTL_HOURS', '168'))
+    # Screenshot-based PDFs: pages are JPEG-encoded on a worker pool as slides are captured
+    SCREENSHOT_ENCODE_WORKERS = int(os.getenv('SCREENSHOT_ENCODE_WORKERS', '2'))
+    SCREENSHOT_JPEG_QUALITY = int(os.getenv('SCREENSHOT_JPEG_QUALITY', '92'))
+    # Slide PNGs, thumbnails and a manifest from the same Playwright session as the PDF
+    RASTER_EXPORT_ENABLED = os.getenv('RASTER_EXPORT_ENABLED', 'false').lower() == 'true'
+    THUMBNAIL_WIDTH = int(os.getenv('THUMBNAIL_WIDTH', '480'))
+    THUMBNAIL_FORMAT = os.getenv('THUMBNAIL_FORMAT', 'webp')
+    THUMBNAIL_WORKERS = int(os.getenv('THUMBNAIL_WORKERS', '2'))
+    # Opt-in: remote images are downloaded into CACHE_DIR/assets and rendered from there
+    ASSET_PREFETCH_ENABLED = os.getenv('ASSET_PREFETCH_ENABLED', 'false').lower() == 'true'
+    # Downloaded images are re-fetched after this many hours; stale files are pruned (0 = keep forever)
+    ASSET_CACHE_TTL_HOURS = float(os.getenv('ASSET_CACHE_TTL_HOURS', '168'))
+    ASSET_MAX_WIDTH = int(os.getenv('ASSET_MAX_WIDTH', '1920'))
+    ASSET_PREFETCH_WORKERS = int(os.getenv('ASSET_PREFETCH_WORKERS', '8'))
+    ASSET_FETCH_TIMEOUT = float(os.getenv('ASSET_FETCH_TIMEOUT', '15'))
+    # Hard caps for readiness checks (fonts, image decoding, animations, network quiet)
+    PAGE_READY_TIMEOUT_MS = int(os.getenv('PAGE_READY_TIMEOUT_MS', '3000'))
+    SLIDE_READY_TIMEOUT_MS = int(os.getenv('SLIDE_READY_TIMEOUT_MS', '1000'))
+    NETWORK_QUIET_MS = int(os.getenv('NETWORK_QUIET_MS', '300'))
+    
     # Evaluation settings with smart defaults
     EVALUATION_PROVIDER = os.getenv('EVALUATION_PROVIDER', 'gemini')
     _EVALUATION_MODEL = os.getenv('EVALUATION_MODEL', 'gemini-2.5-flash')
+    # Issue the visual, content-free and content-required calls at the same time
+    EVALUATION_CONCURRENT = os.getenv('EVALUATION_CONCURRENT', 'true').lower() == 'true'
+    # Opt-in: results for identical documents, prompts and model are reused (TTL 0 = never expires).
+    # Evolution and adversarial runs pass use_cache=False: they compare scores across iterations
+    # and prompt changes, so every iteration must be scored afresh, never from stored results
+    EVALUATION_CACHE_ENABLED = os.getenv('EVALUATION_CACHE_ENABLED', 'false').lower() == 'true'
+    EVALUATION_CACHE_TTL_HOURS = float(os.getenv('EVALUATION_CACHE_TTL_HOURS', '168'))
+    EVALUATION_CACHE_MAX_MB = float(os.getenv('EVALUATION_CACHE_MAX_MB', '50'))
+    # Upload each PDF once through the provider's Files API and reference it by id (opt-in:
+    # uploads are stored in the provider account until deleted)
+    EVALUATION_FILE_UPLOADS = os.getenv('EVALUATION_FILE_UPLOADS', 'false').lower() == 'true'
+    # Uploads are reused for this long, then deleted from the provider (0 = keep until forgotten)
+    EVALUATION_FILE_TTL_HOURS = float(os.getenv('EVALUATION_FILE_TTL_HOURS', '24'))
+    # Presentations evaluated concurrently by evaluate-batch and the evolution loop
+    EVALUATION_BATCH_WORKERS = int(os.getenv('EVALUATION_BATCH_WORKERS', '8'))
+    # PDFs at least this large are memory-mapped instead of read into memory (0 = never)
+    PDF_MMAP_THRESHOLD_MB = float(os.getenv('PDF_MMAP_THRESHOLD_MB', '16'))
     
     @classmethod
     @property
@@ -1,5 +1,11 @@
 """HTML to PDF conversion module"""
 
 from opencanvas.conversion.html_to_pdf import PresentationConverter
+from opencanvas.conversion.async_converter import AsyncPresentationConverter
+from opencanvas.conversion.browser_pool import (
+    BrowserPool, AsyncBrowserPool, get_browser_pool, close_browser_pool,
+    get_async_browser_pool, close_async_browser_pool
+)
 
-__all__ = ['PresentationConverter']
\ No newline at end of file
+__all__ = ['PresentationConverter', 'AsyncPresentationConverter', 'BrowserPool', 'AsyncBrowserPool',
+           'get_browser_pool', 'close_browser_pool', 'get_async_browser_pool', 'close_async_browser_pool']
@@ -0,0 +1,262 @@
+"""
+Local prefetching of remote slide assets.
+
+Generated decks reference Unsplash/Pexels images by URL, so every render used
+to fetch them from the CDN while waiting for network idle. Before rendering,
+the converter now resolves every remote <img> source and CSS url() in the
+HTML, downloads them concurrently into a local asset store (files named by
+content hash), downscales images wider than the render resolution and points
+the HTML at the local copies. Later renders of any deck using the same URLs
+do not touch the network until their index entries expire (ASSET_CACHE_TTL_HOURS);
+prune() drops expired entries together with the files no entry refers to any
+more. URLs that cannot be fetched are left unchanged.
+"""
+
+import io
+import re
+import os
+import hashlib
+import tempfile
+import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+import requests
+from PIL import Image
+
+from opencanvas.config import Config
+from opencanvas.utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Remote <img src> values and CSS url() references (inline styles and <style> blocks)
+IMG_SRC_PATTERN = re.compile(r'''(<img\b[^>]*?\bsrc\s*=\s*["'])((?:https?:)?//[^"']+)(["'])''', re.IGNORECASE)
+CSS_URL_PATTERN = re.compile(r'''(url\(\s*(?:&quot;|["'])?)((?:https?:)?//(?:(?!&quot;)[^"')\s])+)((?:&quot;|["'])?\s*\))''',
+                             re.IGNORECASE)
+
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+    'image/svg+xml': '.svg',
+    'image/avif': '.avif',
+}
+PIL_FORMAT_EXTENSIONS = {'JPEG': '.jpg', 'PNG': '.png', 'WEBP': '.webp', 'GIF': '.gif'}
+
+
+def find_remote_assets(html: str) -> List[str]:
+    """Return the distinct remote image URLs referenced by <img> tags and CSS url()."""
+    urls = []
+    for pattern in (IMG_SRC_PATTERN, CSS_URL_PATTERN):
+        for match in pattern.finditer(html):
+            url = match.group(2).replace('&amp;', '&')
+            if url not in urls:
+                urls.append(url)
+    return urls
+
+
+def downscale_image(data: bytes, max_width: int) -> Tuple[bytes, Optional[str]]:
+    """
+    Shrink an image to at most max_width pixels wide.
+
+    Args:
+        data: Encoded image
+        max_width: Target width (0 to keep the original size)
+
+    Returns:
+        (data, extension) - the original bytes when the image is small enough,
+        animated or not decodable; extension is None if the format is unknown
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image_format = image.format
+            extension = PIL_FORMAT_EXTENSIONS.get(image_format)
+            if (not max_width or image.width <= max_width or getattr(image, 'is_animated', False)
+                    or image_format not in ('JPEG', 'PNG', 'WEBP')):
+                return data, extension
+
+            height = max(1, round(image.height * max_width / image.width))
+            resized = image.resize((max_width, height), Image.LANCZOS)
+            if image_format == 'JPEG' and resized.mode not in ('RGB', 'L'):
+                resized = resized.convert('RGB')
+            output = io.BytesIO()
+            options = {'quality': 85, 'optimize': True} if image_format in ('JPEG', 'WEBP') else {'optimize': True}
+            resized.save(output, format=image_format, **options)
+            return output.getvalue(), extension
+    except Exception:
+        return data, None
+
+
+class AssetPrefetcher:
+    """Downloads remote assets once and rewrites HTML to their local copies."""
+
+    def __init__(self, cache_dir=None, max_width: Optional[int] = None, max_workers: Optional[int] = None,
+                 timeout: Optional[float] = None, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            cache_dir: Asset store directory (defaults to <CACHE_DIR>/assets)
+            max_width: Downscale images wider than this (defaults to ASSET_MAX_WIDTH, 0 to keep sizes)
+            max_workers: Concurrent downloads (defaults to ASSET_PREFETCH_WORKERS)
+            timeout: Per-download timeout in seconds (defaults to ASSET_FETCH_TIMEOUT)
+            ttl_seconds: How long a fetched URL is reused (defaults to ASSET_CACHE_TTL_HOURS, 0 = forever)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = Config.ASSET_CACHE_TTL_HOURS * 3600
+        cache_dir = Path(cache_dir or Config.CACHE_DIR / "assets")
+        self.files_dir = cache_dir / "files"
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        self.index = DiskCache(cache_dir / "index", default_ttl=ttl_seconds or None)
+        self.max_width = Config.ASSET_MAX_WIDTH if max_width is None else max_width
+        self.max_workers = max_workers or Config.ASSET_PREFETCH_WORKERS
+        self.timeout = timeout or Config.ASSET_FETCH_TIMEOUT
+
+        self._lock = threading.Lock()
+        self.downloads = 0
+        self.failures = 0
+
+    def _index_key(self, url: str) -> str:
+        return f"asset:{self.max_width}:{url}"
+
+    def lookup(self, url: str) -> Optional[Path]:
+        """Return the local copy of url if it was fetched before."""
+        record = self.index.get(self._index_key(url))
+        if record is None:
+            return None
+        path = self.files_dir / record['value']['file']
+        return path if path.exists() else None
+
+    def fetch(self, url: str) -> Optional[Path]:
+        """
+        Return a local copy of url, downloading it if needed.
+
+        Args:
+            url: Remote asset URL (protocol-relative URLs use https)
+
+        Returns:
+            Path to the local file, or None if the download failed
+        """
+        local_path = self.lookup(url)
+        if local_path is not None:
+            return local_path
+
+        try:
+            response = requests.get(url if not url.startswith('//') else f"https:{url}", timeout=self.timeout,
+                                    headers={'User-Agent': 'Mozilla/5.0 (OpenCanvas asset prefetch)'})
+            response.raise_for_status()
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+            logger.warning(f"⚠️ Could not prefetch {url}: {e}")
+            return None
+
+        data, extension = downscale_image(response.content, self.max_width)
+        if extension is None:
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            extension = (CONTENT_TYPE_EXTENSIONS.get(content_type)
+                         or mimetypes.guess_extension(content_type)
+                         or Path(url.split('?')[0]).suffix or '.bin')
+
+        local_path = self.files_dir / f"{hashlib.sha256(data).hexdigest()}{extension}"
+        # Held until the index refers to the file so prune() never sees it unreferenced
+        with self._lock:
+            if not local_path.exists():
+                fd, tmp_path = tempfile.mkstemp(dir=str(self.files_dir), suffix=".tmp")
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, local_path)
+
+            self.index.set(self._index_key(url), value={'file': local_path.name, 'size': len(data)})
+            self.downloads += 1
+        return local_path
+
+    def prune(self) -> int:
+        """
+        Drop expired index entries and delete the files no live entry refers to.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        with self._lock:
+            for record in self.index.records(include_expired=True):
+                if record['expired']:
+                    self.index.delete(record['key'])
+            referenced = {record['value']['file'] for record in self.index.records()}
+
+            for path in self.files_dir.iterdir():
+                if path.suffix == '.tmp' or path.name in referenced:
+                    continue
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+
+        if removed:
+            logger.info(f"🧹 Pruned {removed} expired assets from {self.files_dir}")
+        return removed
+
+    def prefetch(self, urls: Iterable[str]) -> Dict[str, Path]:
+        """
+        Fetch several assets concurrently.
+
+        Returns:
+            Dict mapping each successfully fetched URL to its local file
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            paths = list(executor.map(self.fetch, urls))
+        return {url: path for url, path in zip(urls, paths) if path is not None}
+
+    def localize_html(self, html: str) -> str:
+        """
+        Rewrite remote <img> and CSS url() references to local file:// copies.
+
+        Args:
+            html: Document markup
+
+        Returns:
+            Markup pointing at the local asset store (unchanged if nothing was fetched)
+        """
+        urls = find_remote_assets(html)
+        if not urls:
+            return html
+
+        local = self.prefetch(urls)
+        logger.info(f"📥 Prefetched {len(local)}/{len(urls)} remote assets")
+
+        def replace(match):
+            path = local.get(match.group(2).replace('&amp;', '&'))
+            if path is None:
+                return match.group(0)
+            return f"{match.group(1)}{path.absolute().as_uri()}{match.group(3)}"
+
+        html = IMG_SRC_PATTERN.sub(replace, html)
+        return CSS_URL_PATTERN.sub(replace, html)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return download, failure and index hit counts."""
+        return {'downloads': self.downloads, 'failures': self.failures,
+                'hits': self.index.hits, 'misses': self.index.misses}
+
+
+_prefetcher: Optional[AssetPrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_asset_prefetcher() -> AssetPrefetcher:
+    """Return the process-wide asset prefetcher."""
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = AssetPrefetcher()
+            _prefetcher.prune()
+        return _prefetcher
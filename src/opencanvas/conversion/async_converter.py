@@ -0,0 +1,209 @@
+"""
+Asyncio-native HTML to PDF conversion.
+
+AsyncPresentationConverter renders Playwright conversions with
+playwright.async_api on the event loop's AsyncBrowserPool, so a server can run
+many conversions concurrently on a few warm browsers instead of parking a
+thread per conversion in the default executor. Blocking steps (image
+compression, asset prefetching, cache lookups, PDF merging) run in the
+executor; conversion methods without an async implementation (Chrome
+headless, Selenium) and raster exports fall back to the synchronous converter
+in a worker thread.
+"""
+
+import os
+import asyncio
+import functools
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+
+from opencanvas.config import Config
+from opencanvas.conversion.browser_pool import get_async_browser_pool
+from opencanvas.conversion.conversion_cache import SLIDE_SOURCES_SCRIPT
+from opencanvas.conversion.html_to_pdf import (
+    PresentationConverter, PRINT_STYLES, REVEAL_SLIDES_SCRIPT, GOTO_SLIDE_SCRIPT,
+    single_pass_styles, split_slides
+)
+from opencanvas.conversion.readiness import async_wait_for_page, async_wait_for_slide
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPresentationConverter(PresentationConverter):
+    """PresentationConverter whose convert() is a coroutine."""
+
+    async def _in_thread(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def convert(self, output_filename: str = "presentation.pdf", cleanup: bool = True) -> str:
+        """
+        Convert the presentation without blocking the event loop.
+
+        Args:
+            output_filename: Output PDF filename
+            cleanup: Whether to cleanup temp files
+
+        Returns:
+            Path to generated PDF file
+        """
+        # Raster export captures slide images from the sync render job
+        if self.method != "playwright" or self.raster_export:
+            return await self._in_thread(
+                functools.partial(PresentationConverter.convert, self, output_filename, cleanup)
+            )
+
+        try:
+            self.degraded = []
+            cache_key = None
+            if self.cache:
+                cache_key = await self._in_thread(self.cache.document_key, self.html_file, self._cache_settings())
+                cached_path = self.output_dir / output_filename
+                if await self._in_thread(self.cache.restore, cache_key, cached_path):
+                    logger.info(f"♻️ Reusing cached conversion: {cached_path}")
+                    return str(cached_path)
+
+            pdf_path = await self.convert_with_playwright_async(output_filename)
+
+            if cache_key:
+                await self._in_thread(self._cache_result, cache_key, pdf_path)
+
+            logger.info(f"Conversion completed successfully with 16:9 format (1920x1080): {pdf_path}")
+            return pdf_path
+
+        except Exception as e:
+            logger.error(f"Conversion failed: {e}")
+            raise
+
+    async def convert_with_playwright_async(self, output_filename: str) -> str:
+        """Async counterpart of convert_with_playwright() using the event loop's browser pool."""
+        logger.info("Converting with async Playwright...")
+
+        pdf_path = self.output_dir / output_filename
+
+        html_file_to_use = await self._in_thread(self._prepare_html)
+
+        try:
+            pool = get_async_browser_pool()
+            if self.render_mode == "parallel":
+                await self._render_parallel_async(pool, html_file_to_use, pdf_path)
+            else:
+                await pool.run(lambda page: self._render_page_async(page, html_file_to_use, pdf_path))
+        finally:
+            self._cleanup_temp_html()
+
+        logger.info(f"PDF generated with async Playwright (16:9 format): {pdf_path}")
+        return str(pdf_path)
+
+    async def _load_async(self, page, html_file_to_use: Path) -> int:
+        """Load the deck for printing and return its slide count."""
+        await page.goto(f"file://{html_file_to_use.absolute()}", wait_until='networkidle')
+        await async_wait_for_page(page)
+        await page.emulate_media(media='print')
+        await page.add_style_tag(content=PRINT_STYLES)
+        return len(await page.query_selector_all('.slide'))
+
+    async def _slide_cache_keys_async(self, page, html_file_to_use: Path) -> Optional[List[str]]:
+        if not self.cache:
+            return None
+        try:
+            sources = await page.evaluate(SLIDE_SOURCES_SCRIPT)
+            # Reads the deck and hashes its assets: keep that off the event loop
+            return await self._in_thread(self._slide_keys_from_sources, sources, html_file_to_use)
+        except Exception as e:
+            logger.debug(f"Per-slide cache keys unavailable: {e}")
+            return None
+
+    async def _print_page_async(self, page, path: Path):
+        await page.pdf(path=str(path), **self._pdf_options())
+
+    async def _render_page_async(self, page, html_file_to_use: Path, pdf_path: Path):
+        """Load the presentation in a pooled page and print it to pdf_path."""
+        total_slides = await self._load_async(page, html_file_to_use)
+
+        if total_slides <= 1:
+            logger.info("Single slide detected, using single-page PDF generation")
+            await self._print_page_async(page, pdf_path)
+        elif self.render_mode == "single_pass":
+            logger.info(f"Multi-slide presentation detected ({total_slides} slides), rendering in a single pass")
+            await page.add_style_tag(content=single_pass_styles(9.0 * self.zoom_factor - 0.4))
+            await page.evaluate(REVEAL_SLIDES_SCRIPT)
+            await async_wait_for_page(page)
+            await self._print_page_async(page, pdf_path)
+        else:
+            logger.info(f"Multi-slide presentation detected ({total_slides} slides)")
+            slide_keys = await self._slide_cache_keys_async(page, html_file_to_use)
+            temp_pdfs = []
+            for slide_num in range(1, total_slides + 1):
+                if slide_num > 1:
+                    await page.keyboard.press('ArrowRight')
+                    await async_wait_for_slide(page)
+
+                temp_pdf_path = self._temp_slide_path(pdf_path, slide_num - 1)
+                if not await self._in_thread(self._restore_slide, slide_keys, slide_num - 1, temp_pdf_path):
+                    await self._print_page_async(page, temp_pdf_path)
+                    await self._in_thread(self._store_slide, slide_keys, slide_num - 1, temp_pdf_path)
+                temp_pdfs.append(str(temp_pdf_path))
+
+            await self._merge_async(temp_pdfs, pdf_path)
+
+    async def _render_parallel_async(self, pool, html_file_to_use: Path, pdf_path: Path):
+        """Print slides on several pooled pages at once and merge them in slide order."""
+        parts = max(1, Config.PARALLEL_CAPTURE_PAGES)
+        # Let every share finish before anything is merged or removed
+        results = await asyncio.gather(*[
+            pool.run(lambda page, part=part: self._render_share_async(page, html_file_to_use, pdf_path, part, parts))
+            for part in range(parts)
+        ], return_exceptions=True)
+        shares = [result for result in results if not isinstance(result, BaseException)]
+        try:
+            if len(shares) < len(results):
+                raise next(result for result in results if isinstance(result, BaseException))
+
+            rendered = sorted(item for share in shares for item in share)
+            if len(rendered) == 1 and rendered[0][0] is None:
+                return  # Single page deck, already printed to pdf_path
+
+            logger.info(f"Rendered {len(rendered)} slides on {parts} pages in parallel")
+            await self._in_thread(self._combine_pdfs, [path for _, path in rendered], str(pdf_path))
+        finally:
+            await self._in_thread(self._remove_slide_pdfs, [item for share in shares for item in share])
+
+    async def _render_share_async(self, page, html_file_to_use: Path, pdf_path: Path,
+                                  part: int, parts: int) -> List[Tuple[Optional[int], str]]:
+        """Load the deck in one page and print this page's share of the slides."""
+        total_slides = await self._load_async(page, html_file_to_use)
+        if total_slides <= 1:
+            if part > 0:
+                return []
+            await self._print_page_async(page, pdf_path)
+            return [(None, str(pdf_path))]
+
+        shares = split_slides(total_slides, parts)
+        if part >= len(shares):
+            return []
+
+        slide_keys = await self._slide_cache_keys_async(page, html_file_to_use)
+        rendered = []
+        try:
+            for index in shares[part]:
+                temp_pdf_path = self._temp_slide_path(pdf_path, index)
+                rendered.append((index, str(temp_pdf_path)))
+                if not await self._in_thread(self._restore_slide, slide_keys, index, temp_pdf_path):
+                    await page.evaluate(GOTO_SLIDE_SCRIPT, index)
+                    await async_wait_for_slide(page)
+                    await self._print_page_async(page, temp_pdf_path)
+                    await self._in_thread(self._store_slide, slide_keys, index, temp_pdf_path)
+        except Exception:
+            await self._in_thread(self._remove_slide_pdfs, rendered)
+            raise
+        return rendered
+
+    async def _merge_async(self, temp_pdfs: List[str], pdf_path: Path):
+        await self._in_thread(self._combine_pdfs, temp_pdfs, str(pdf_path))
+        for temp_pdf in temp_pdfs:
+            try:
+                os.remove(temp_pdf)
+            except OSError:
+                pass
@@ -0,0 +1,424 @@
+"""
+Shared pool of warm headless Chromium browsers.
+
+Launching Chromium costs one to two seconds, which used to be paid by every
+conversion. The pool keeps BROWSER_POOL_SIZE browsers alive for the whole
+process and hands each job a page in a new browser context, so cookies,
+storage of the shared file:// origin, the HTTP cache and permissions never
+carry over from one deck to the next (a context costs milliseconds, unlike a
+browser).
+Playwright's sync API is bound to the thread that started it, so every browser
+is owned by its own worker thread and jobs are callables executed there.
+A browser is relaunched when it has disconnected (crashed) and recycled after
+BROWSER_POOL_MAX_JOBS jobs to keep memory growth in check.
+
+AsyncBrowserPool is the asyncio counterpart used by AsyncPresentationConverter:
+its browsers live on the event loop, and each one serves up to
+BROWSER_POOL_PAGES_PER_BROWSER concurrent pages, so many conversions share a
+few browsers without occupying a thread each.
+"""
+
+import asyncio
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional
+import logging
+
+from opencanvas.config import Config
+
+try:
+    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Flags allowing slides to load local files (needed for extracted images)
+BROWSER_ARGS = [
+    '--allow-file-access-from-files',
+    '--disable-web-security',
+    '--allow-running-insecure-content'
+]
+
+
+class BrowserPool:
+    """Runs page jobs on a fixed set of long-lived browsers."""
+
+    def __init__(self, size: Optional[int] = None, max_jobs_per_browser: Optional[int] = None):
+        """
+        Initialize the pool (browsers are launched on first use or by warm()).
+
+        Args:
+            size: Number of browsers, each with its own worker thread
+            max_jobs_per_browser: Relaunch a browser after this many jobs (0 to never recycle)
+        """
+        self.size = size or Config.BROWSER_POOL_SIZE
+        self.max_jobs_per_browser = (Config.BROWSER_POOL_MAX_JOBS if max_jobs_per_browser is None
+                                     else max_jobs_per_browser)
+
+        self._jobs = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.launches = 0
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+
+    def submit(self, job: Callable[[Any], Any]) -> Future:
+        """
+        Queue a job for the next free browser.
+
+        Args:
+            job: Callable receiving a page in a new browser context; both are closed afterwards
+
+        Returns:
+            Future resolving to the job's return value
+        """
+        self._start_workers()
+        future = Future()
+        self._jobs.put((job, future))
+        return future
+
+    def run(self, job: Callable[[Any], Any]) -> Any:
+        """Run a job on a pooled browser and wait for its result."""
+        return self.submit(job).result()
+
+    def warm(self):
+        """Start the workers so browsers are launched before the first job arrives."""
+        self._start_workers()
+
+    def _start_workers(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed")
+            while len(self._workers) < self.size:
+                worker = threading.Thread(target=self._work, name=f"browser-pool-{len(self._workers) + 1}",
+                                          daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _start_playwright(self):
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright not available. Install with: pip install playwright && playwright install chromium")
+        return sync_playwright().start()
+
+    def _launch(self, playwright):
+        browser = playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        with self._lock:
+            self.launches += 1
+        return browser
+
+    @staticmethod
+    def _new_context(browser):
+        return browser.new_context(bypass_csp=True, ignore_https_errors=True)
+
+    def _work(self):
+        name = threading.current_thread().name
+        playwright = browser = None
+        jobs_on_browser = 0
+        startup_error = None
+
+        try:
+            playwright = self._start_playwright()
+            browser = self._launch(playwright)
+            logger.info(f"🌐 {name}: browser ready")
+        except Exception as e:
+            startup_error = e
+            logger.error(f"❌ {name}: could not launch browser: {e}")
+
+        try:
+            while True:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                job, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    if playwright is None:
+                        raise RuntimeError(f"Browser pool could not start Playwright: {startup_error}")
+
+                    # Health check and recycling
+                    if browser is None or not browser.is_connected() or (
+                            self.max_jobs_per_browser and jobs_on_browser >= self.max_jobs_per_browser):
+                        reason = "recycling" if browser is not None and browser.is_connected() else "relaunching"
+                        logger.info(f"🔄 {name}: {reason} browser after {jobs_on_browser} jobs")
+                        self._close_browser(browser)
+                        browser = None
+                        browser = self._launch(playwright)
+                        jobs_on_browser = 0
+
+                    context = self._new_context(browser)
+                    try:
+                        result = job(context.new_page())
+                    finally:
+                        jobs_on_browser += 1
+                        try:
+                            context.close()
+                        except Exception:
+                            pass
+                except Exception as e:
+                    with self._lock:
+                        self.jobs_failed += 1
+                    future.set_exception(e)
+                else:
+                    with self._lock:
+                        self.jobs_completed += 1
+                    future.set_result(result)
+        finally:
+            self._close_browser(browser)
+            if playwright is not None:
+                try:
+                    playwright.stop()
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _close_browser(browser):
+        if browser is None:
+            return
+        try:
+            browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool size, launches and job counts."""
+        with self._lock:
+            return {
+                'size': self.size,
+                'workers': len(self._workers),
+                'queued': self._jobs.qsize(),
+                'launches': self.launches,
+                'jobs_completed': self.jobs_completed,
+                'jobs_failed': self.jobs_failed,
+            }
+
+    def close(self, timeout: float = 30.0):
+        """Finish queued jobs, then shut every browser down."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._jobs.put(None)
+        for worker in workers:
+            worker.join(timeout)
+
+
+class _AsyncBrowser:
+    """One browser of an AsyncBrowserPool with its usage counters."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.active = 0
+        self.jobs = 0
+
+
+class AsyncBrowserPool:
+    """Runs async page jobs on a fixed set of long-lived browsers owned by one event loop."""
+
+    def __init__(self, size: Optional[int] = None, max_jobs_per_browser: Optional[int] = None,
+                 pages_per_browser: Optional[int] = None):
+        """
+        Initialize the pool (browsers are launched on first use or by warm()).
+
+        Args:
+            size: Number of browsers
+            max_jobs_per_browser: Relaunch a browser after this many jobs (0 to never recycle)
+            pages_per_browser: Concurrent pages per browser
+        """
+        self.size = size or Config.BROWSER_POOL_SIZE
+        self.max_jobs_per_browser = (Config.BROWSER_POOL_MAX_JOBS if max_jobs_per_browser is None
+                                     else max_jobs_per_browser)
+        self.pages_per_browser = pages_per_browser or Config.BROWSER_POOL_PAGES_PER_BROWSER
+
+        self._playwright = None
+        self._browsers = []
+        self._slots = asyncio.Semaphore(self.size * self.pages_per_browser)
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+        self.launches = 0
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+
+    async def run(self, job: Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Run a job on a new page of the least busy browser.
+
+        Args:
+            job: Coroutine function receiving a page in a new browser context; both are closed afterwards
+
+        Returns:
+            The job's return value
+        """
+        async with self._slots:
+            entry = await self._checkout()
+            try:
+                context = await self._new_context(entry.browser)
+                try:
+                    result = await job(await context.new_page())
+                finally:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+            except Exception:
+                self.jobs_failed += 1
+                raise
+            finally:
+                entry.active -= 1
+                entry.jobs += 1
+            self.jobs_completed += 1
+            return result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+    async def warm(self):
+        """Launch the browsers before the first job arrives."""
+        async with self._lock:
+            await self._fill()
+
+    async def _start_playwright(self):
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright not available. Install with: pip install playwright && playwright install chromium")
+        return await async_playwright().start()
+
+    async def _launch(self, playwright) -> _AsyncBrowser:
+        browser = await playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        self.launches += 1
+        return _AsyncBrowser(browser)
+
+    @staticmethod
+    async def _new_context(browser):
+        return await browser.new_context(bypass_csp=True, ignore_https_errors=True)
+
+    async def _fill(self):
+        if self._closed:
+            raise RuntimeError("AsyncBrowserPool is closed")
+        if self._playwright is None:
+            self._playwright = await self._start_playwright()
+        while len(self._browsers) < self.size:
+            self._browsers.append(await self._launch(self._playwright))
+            logger.info(f"🌐 Async browser {len(self._browsers)} ready")
+
+    def _exhausted(self, entry: _AsyncBrowser) -> bool:
+        return bool(self.max_jobs_per_browser) and entry.jobs >= self.max_jobs_per_browser
+
+    async def _checkout(self) -> _AsyncBrowser:
+        async with self._lock:
+            await self._fill()
+
+            # Health check and recycling (exhausted browsers are replaced once their pages are done)
+            for position, entry in enumerate(self._browsers):
+                crashed = not entry.browser.is_connected()
+                if crashed or (self._exhausted(entry) and entry.active == 0):
+                    reason = "relaunching" if crashed else "recycling"
+                    logger.info(f"🔄 Async browser {position + 1}: {reason} browser after {entry.jobs} jobs")
+                    await self._close_browser(entry)
+                    self._browsers[position] = await self._launch(self._playwright)
+
+            candidates = [entry for entry in self._browsers if not self._exhausted(entry)] or self._browsers
+            entry = min(candidates, key=lambda candidate: candidate.active)
+            entry.active += 1
+            return entry
+
+    @staticmethod
+    async def _close_browser(entry: _AsyncBrowser):
+        try:
+            await entry.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool size, launches, pages in use and job counts."""
+        return {
+            'size': self.size,
+            'browsers': len(self._browsers),
+            'pages_per_browser': self.pages_per_browser,
+            'active_pages': sum(entry.active for entry in self._browsers),
+            'launches': self.launches,
+            'jobs_completed': self.jobs_completed,
+            'jobs_failed': self.jobs_failed,
+        }
+
+    async def close(self):
+        """Shut every browser down (running jobs should be awaited first)."""
+        async with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for entry in self._browsers:
+                await self._close_browser(entry)
+            self._browsers = []
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    pass
+                self._playwright = None
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+_async_pools: Dict[asyncio.AbstractEventLoop, AsyncBrowserPool] = {}
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+def close_browser_pool():
+    """Shut the process-wide browser pool down (a new one is created on next use)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+def get_async_browser_pool() -> AsyncBrowserPool:
+    """
+    Return the async browser pool of the running event loop.
+
+    Meant for long-lived loops (the API server) that call
+    close_async_browser_pool() on shutdown; short-lived callers should use a
+    scoped `async with AsyncBrowserPool()` instead.
+    """
+    loop = asyncio.get_running_loop()
+    # Forget pools of loops that ended without closing them
+    for stale in [other for other in _async_pools if other.is_closed()]:
+        del _async_pools[stale]
+    pool = _async_pools.get(loop)
+    if pool is None:
+        pool = AsyncBrowserPool()
+        _async_pools[loop] = pool
+    return pool
+
+
+async def close_async_browser_pool():
+    """Shut the running event loop's async browser pool down."""
+    pool = _async_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+atexit.register(close_browser_pool)
@@ -0,0 +1,179 @@
+"""
+Content-addressed cache of conversion results.
+
+A conversion is identified by the HTML, every local asset it references (e.g.
+../extracted_images/figure_1.png), and the render settings (method, zoom,
+render mode, image compression). Converting the same deck again, as happens
+with /convert after /pipeline or evaluation re-runs, serves the stored PDF
+instead of starting a browser. Per-slide renders are cached as well, keyed by
+the slide's own markup plus the shared document context, so a variant that only
+changes a few slides re-renders just those. Entries expire after
+CONVERSION_CACHE_TTL_HOURS, and converters do not store degraded results
+(unmerged slide PDFs, remote assets that could not be prefetched).
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import unquote, urlparse
+import logging
+
+from opencanvas.config import Config
+from opencanvas.utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when rendering changes in a way that invalidates stored results
+CACHE_VERSION = "1"
+
+# src/href attributes and CSS url() references
+ASSET_REFERENCE_PATTERN = re.compile(
+    r'''(?:\bsrc|\bhref)\s*=\s*["']([^"']+)["']|url\(\s*["']?([^"')]+)["']?\s*\)''',
+    re.IGNORECASE
+)
+REMOTE_PREFIXES = ('http://', 'https://', '//', 'data:', 'mailto:', 'javascript:', '#', 'about:', 'blob:')
+
+# Returns the document with its slides removed (shared context) plus each slide's markup
+SLIDE_SOURCES_SCRIPT = """
+() => {
+    const clone = document.documentElement.cloneNode(true);
+    clone.querySelectorAll('.slide').forEach(slide => slide.remove());
+    return {
+        context: clone.outerHTML,
+        slides: Array.from(document.querySelectorAll('.slide')).map(slide => slide.outerHTML)
+    };
+}
+"""
+
+
+def _digest(*parts: str) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode('utf-8'))
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+def asset_fingerprint(html: str, base_dir) -> str:
+    """
+    Hash the local files an HTML document references.
+
+    Args:
+        html: Document markup
+        base_dir: Directory relative references are resolved against
+
+    Returns:
+        Digest over (reference, file content hash) pairs; missing files hash as "missing"
+    """
+    base_dir = Path(base_dir)
+    references = set()
+    for match in ASSET_REFERENCE_PATTERN.finditer(html):
+        reference = (match.group(1) or match.group(2) or '').strip()
+        if reference and not reference.lower().startswith(REMOTE_PREFIXES):
+            references.add(reference)
+
+    parts = []
+    for reference in sorted(references):
+        parsed = urlparse(reference)
+        if parsed.scheme == 'file':
+            path = Path(unquote(parsed.path))
+        elif parsed.scheme:
+            continue
+        else:
+            path = base_dir / unquote(parsed.path)
+        try:
+            content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            content_hash = "missing"
+        parts.append(f"{reference}={content_hash}")
+    return _digest(*parts)
+
+
+class ConversionCache:
+    """Stores whole-deck PDFs and per-slide PDF pages by content hash."""
+
+    def __init__(self, cache_dir=None, max_size_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the conversion cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to <CACHE_DIR>/conversion)
+            max_size_bytes: Total size budget for LRU eviction
+            ttl_seconds: Entry lifetime (defaults to CONVERSION_CACHE_TTL_HOURS, 0 = never expires)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = Config.CONVERSION_CACHE_TTL_HOURS * 3600
+        self.cache = DiskCache(
+            cache_dir or Config.CACHE_DIR / "conversion",
+            max_size_bytes=max_size_bytes or int(Config.CONVERSION_CACHE_MAX_MB * 1024 * 1024),
+            default_ttl=ttl_seconds or None
+        )
+
+    @staticmethod
+    def document_key(html_file, settings: Dict[str, Any]) -> str:
+        """
+        Key for a whole conversion.
+
+        Args:
+            html_file: Presentation HTML file
+            settings: Render settings that affect the output (method, zoom, ...)
+        """
+        html_file = Path(html_file)
+        html = html_file.read_text(encoding='utf-8', errors='replace')
+        return "pdf:" + _digest(
+            CACHE_VERSION,
+            json.dumps(settings, sort_keys=True),
+            html,
+            asset_fingerprint(html, html_file.parent)
+        )
+
+    @staticmethod
+    def slide_key(context_key: str, slide_html: str) -> str:
+        """Key for one slide rendered within a document context (see context_key)."""
+        return "slide:" + _digest(context_key, slide_html)
+
+    @staticmethod
+    def context_key(context_html: str, assets: str, settings: Dict[str, Any]) -> str:
+        """Digest of everything besides the slide itself that affects a slide render."""
+        return _digest(CACHE_VERSION, json.dumps(settings, sort_keys=True), context_html, assets)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a cached PDF, or None."""
+        return self.cache.get_bytes(key)
+
+    def put(self, key: str, pdf_path) -> bool:
+        """Store the PDF at pdf_path under key."""
+        try:
+            data = Path(pdf_path).read_bytes()
+        except OSError as e:
+            logger.warning(f"Could not cache conversion result {pdf_path}: {e}")
+            return False
+        self.cache.set(key, value={'size': len(data)}, data=data)
+        return True
+
+    def restore(self, key: str, output_path) -> bool:
+        """Write a cached PDF to output_path; returns False on a miss."""
+        data = self.get(key)
+        if data is None:
+            return False
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counts."""
+        return {'hits': self.cache.hits, 'misses': self.cache.misses}
+
+
+_conversion_cache: Optional[ConversionCache] = None
+
+
+def get_conversion_cache() -> ConversionCache:
+    """Return the process-wide conversion cache."""
+    global _conversion_cache
+    if _conversion_cache is None:
+        _conversion_cache = ConversionCache()
+    return _conversion_cache
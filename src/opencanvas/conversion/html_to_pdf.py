@@ -15,11 +15,14 @@ Requirements:
 """
 
 import os
+import re
 import time
+import tempfile
 import subprocess
 import shutil
+from concurrent.futures import wait
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 import logging
 import asyncio
 import base64
@@ -47,6 +50,16 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logging.warning("Playwright not available. Install with: pip install playwright && playwright install chromium")
 
+from opencanvas.config import Config
+from opencanvas.conversion.asset_prefetch import find_remote_assets, get_asset_prefetcher
+from opencanvas.conversion.browser_pool import AsyncBrowserPool, get_browser_pool
+from opencanvas.conversion.conversion_cache import SLIDE_SOURCES_SCRIPT, asset_fingerprint, get_conversion_cache
+from opencanvas.conversion.image_pdf import ImagePDFWriter
+from opencanvas.conversion.raster_export import generate_thumbnails, write_manifest
+from opencanvas.conversion.readiness import (
+    wait_for_page, wait_for_slide, async_wait_for_page, async_wait_for_slide, wait_for_driver
+)
+
 # Import validation if available
 try:
     from opencanvas.utils.validation import InputValidator
@@ -69,12 +82,205 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Print stylesheet injected before Playwright renders slides to PDF
+PRINT_STYLES = """
+@media print {
+    /* Hide navigation elements */
+    .controls, .slide-number, .progress-bar, .navigation,
+    [class*="control"], [class*="nav"], .presenter-notes {
+        display: none !important;
+    }
+
+    /* Ensure full content width is captured */
+    body {
+        width: 100% !important;
+        max-width: none !important;
+        overflow: visible !important;
+    }
+
+    /* Ensure slides break properly and use full width */
+    .slide, section {
+        page-break-after: always;
+        page-break-inside: avoid;
+        width: 100% !important;
+        max-width: none !important;
+        min-width: 100% !important;
+    }
+
+    /* Last slide shouldn't have page break */
+    .slide:last-child, section:last-child {
+        page-break-after: auto;
+    }
+}
+"""
+
+# Hides deck navigation UI in screenshots
+HIDE_CONTROLS_STYLES = """
+.controls, .slide-number, .progress-bar {
+    display: none !important;
+}
+"""
+
+# Make every slide visible regardless of the deck's navigation state
+SHOW_SLIDES_SCRIPT = """
+() => {
+    document.querySelectorAll('.slide').forEach(slide => {
+        slide.classList.add('active');
+        slide.style.display = 'block';
+        slide.style.opacity = '1';
+        slide.style.visibility = 'visible';
+    });
+}
+"""
+
+# Activate every slide while keeping the deck's own display mode (e.g. flex);
+# slides that stay hidden after activation fall back to display: block
+REVEAL_SLIDES_SCRIPT = """
+() => {
+    document.querySelectorAll('.slide').forEach(slide => {
+        slide.classList.add('active');
+        if (getComputedStyle(slide).display === 'none') {
+            slide.style.setProperty('display', 'block', 'important');
+        }
+    });
+}
+"""
+
+# Viewport used for slide images (matches the 1920x1080 slide design size)
+RASTER_VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Jump straight to one slide by making it the only active one
+GOTO_SLIDE_SCRIPT = """
+(index) => {
+    const slides = document.querySelectorAll('.slide');
+    slides.forEach((slide, i) => slide.classList.toggle('active', i === index));
+    if (typeof currentSlide !== 'undefined') {
+        try { currentSlide = index; } catch (e) {}
+    }
+    return slides.length;
+}
+"""
+
+
+def split_slides(total_slides: int, parts: int) -> List[List[int]]:
+    """Split slide indices into at most `parts` contiguous, evenly sized shares."""
+    parts = max(1, min(parts, total_slides))
+    size, extra = divmod(total_slides, parts)
+    shares, start = [], 0
+    for part in range(parts):
+        end = start + size + (1 if part < extra else 0)
+        shares.append(list(range(start, end)))
+        start = end
+    return [share for share in shares if share]
+
+
+def single_pass_styles(slide_height: float) -> str:
+    """
+    Print stylesheet laying every slide out as its own page.
+
+    Args:
+        slide_height: Printable page height in inches (page height minus margins)
+    """
+    return f"""
+@media print {{
+    html, body {{
+        height: auto !important;
+        overflow: visible !important;
+    }}
+
+    /* Stack all slides in document flow, one per page */
+    .slide {{
+        position: relative !important;
+        left: auto !important;
+        top: auto !important;
+        transform: none !important;
+        opacity: 1 !important;
+        visibility: visible !important;
+        box-sizing: border-box !important;
+        height: {slide_height}in !important;
+        min-height: 0 !important;
+        overflow: hidden !important;
+        page-break-after: always;
+        break-after: page;
+        page-break-inside: avoid;
+        break-inside: avoid;
+    }}
+
+    .slide:last-of-type {{
+        page-break-after: auto;
+        break-after: auto;
+    }}
+}}
+"""
+
+
+def temp_slide_path(output_dir, pdf_path, index: int) -> Path:
+    """Per-slide PDF named after the output, so concurrent conversions into one directory do not collide."""
+    return Path(output_dir) / f"temp_{Path(pdf_path).stem}_slide_{index + 1:02d}.pdf"
+
+
+def combine_pdfs(pdf_paths: List[str], output_path: str) -> bool:
+    """
+    Combine multiple PDFs into one using PyPDF2 or fallback to system tools.
+
+    Returns:
+        True if every page was merged, False if only the first PDF could be copied
+    """
+    try:
+        # Try using PyPDF2 first
+        try:
+            from PyPDF2 import PdfMerger
+            merger = PdfMerger()
+
+            for pdf_path in pdf_paths:
+                merger.append(pdf_path)
+
+            merger.write(output_path)
+            merger.close()
+            logger.info(f"Combined {len(pdf_paths)} PDFs using PyPDF2")
+            return True
+
+        except ImportError:
+            logger.info("PyPDF2 not available, trying system tools...")
+
+        # Fallback to system tools
+        if shutil.which('pdftk'):
+            # Use pdftk if available
+            cmd = ['pdftk'] + pdf_paths + ['cat', 'output', output_path]
+            subprocess.run(cmd, check=True)
+            logger.info(f"Combined {len(pdf_paths)} PDFs using pdftk")
+            return True
+
+        elif shutil.which('gs'):
+            # Use Ghostscript if available
+            cmd = ['gs', '-dNOPAUSE', '-dBATCH', '-sDEVICE=pdfwrite', 
+                   f'-sOutputFile={output_path}'] + pdf_paths
+            subprocess.run(cmd, check=True)
+            logger.info(f"Combined {len(pdf_paths)} PDFs using Ghostscript")
+            return True
+
+        else:
+            # Last resort: just use the first PDF
+            logger.warning("No PDF merging tools available, using first slide only")
+            shutil.copy(pdf_paths[0], output_path)
+            return len(pdf_paths) == 1
+
+    except Exception as e:
+        logger.error(f"Error combining PDFs: {e}")
+        # Fallback: copy first PDF
+        if pdf_paths:
+            shutil.copy(pdf_paths[0], output_path)
+        return False
+
+
 class PresentationConverter:
     """Enhanced PresentationConverter with native PDF generation capabilities and fixed 4:3 aspect ratio."""
     
     def __init__(self, html_file: str, output_dir: str = "output", 
                  method: str = "playwright", zoom_factor: float = 1.2, 
-                 compress_images: bool = False):
+                 compress_images: bool = False, render_mode: Optional[str] = None,
+                 use_cache: Optional[bool] = None, prefetch_assets: Optional[bool] = None,
+                 raster_export: Optional[bool] = None):
         """
         Initialize the converter.
         
@@ -85,6 +291,17 @@ class PresentationConverter:
                    'selenium_cdp', or 'selenium' (original screenshot method)
             zoom_factor: Zoom level for PDF content (used in all methods)
             compress_images: Whether to compress Unsplash images for smaller PDFs (default: False)
+            render_mode: Playwright multi-slide mode - 'per_slide' (one PDF per slide,
+                   then merged), 'single_pass' (opt-in, all slides in one page.pdf call) or
+                   'parallel' (slides split across PARALLEL_CAPTURE_PAGES pooled pages);
+                   defaults to PLAYWRIGHT_RENDER_MODE
+            use_cache: Reuse earlier results for identical HTML, assets and settings
+                   (defaults to CONVERSION_CACHE_ENABLED)
+            prefetch_assets: Render remote images from a local asset store instead of
+                   fetching them during the render (defaults to ASSET_PREFETCH_ENABLED)
+            raster_export: Also save full-size PNGs and thumbnails of every slide from the
+                   same Playwright session, plus a manifest next to the PDF
+                   (defaults to RASTER_EXPORT_ENABLED)
         """
         self.html_file = Path(html_file)
         self.output_dir = Path(output_dir)
@@ -92,8 +309,17 @@ class PresentationConverter:
         self.method = method
         self.zoom_factor = zoom_factor
         self.compress_images = compress_images
+        self.render_mode = render_mode or Config.PLAYWRIGHT_RENDER_MODE
+        if use_cache is None:
+            use_cache = Config.CONVERSION_CACHE_ENABLED
+        self.cache = get_conversion_cache() if use_cache else None
+        self.prefetch_assets = Config.ASSET_PREFETCH_ENABLED if prefetch_assets is None else prefetch_assets
+        self.raster_export = Config.RASTER_EXPORT_ENABLED if raster_export is None else raster_export
+        self.raster_images = []  # (slide index, PNG path) from the last raster export
+        self.manifest_path = None
         self.temp_images = []  # Kept for compatibility
         self.temp_html_file = None  # For compressed HTML cleanup
+        self.degraded = []  # Why the last conversion fell short (such results are not cached)
         
         # Validate inputs
         is_valid, msg = InputValidator.validate_html_file(str(self.html_file))
@@ -104,6 +330,10 @@ class PresentationConverter:
         if not is_valid:
             raise ValueError(f"Invalid zoom factor: {msg}")
         
+        if self.render_mode not in ("single_pass", "per_slide", "parallel"):
+            raise ValueError(f"Invalid render mode: {self.render_mode} "
+                             f"(expected 'single_pass', 'per_slide' or 'parallel')")
+        
         # Check method availability
         if method == "playwright" and not PLAYWRIGHT_AVAILABLE:
             logger.warning("Playwright not available, falling back to chrome_headless")
@@ -131,29 +361,42 @@ class PresentationConverter:
         
         return driver
 
-    def _compress_images_in_html(self) -> Path:
-        """Create a temporary HTML file with compressed Unsplash images"""
-        import re
-        import time
+    def _prepare_html(self) -> Path:
+        """
+        HTML file to render: the original, or a temporary copy with compressed
+        Unsplash image URLs and/or remote images replaced by local prefetched copies.
+        """
+        if not (self.compress_images or self.prefetch_assets):
+            return self.html_file
         
         # Read original HTML
         with open(self.html_file, 'r', encoding='utf-8') as f:
             html_content = f.read()
+        prepared_content = html_content
+        
+        if self.compress_images:
+            # Apply aggressive compression: w=1350→w=400, q=80→q=40
+            prepared_content = re.sub(r'w=1350', 'w=400', prepared_content)
+            prepared_content = re.sub(r'q=80', 'q=40', prepared_content)
+        
+        if self.prefetch_assets:
+            prepared_content = get_asset_prefetcher().localize_html(prepared_content)
+            remaining = find_remote_assets(prepared_content)
+            if remaining:
+                self.degraded.append(f"{len(remaining)} remote assets could not be prefetched")
         
-        # Apply aggressive compression: w=1350→w=400, q=80→q=40
-        compressed_content = re.sub(r'w=1350', 'w=400', html_content)
-        compressed_content = re.sub(r'q=80', 'q=40', compressed_content)
+        if prepared_content == html_content:
+            return self.html_file
         
         # Create temp file IN THE SAME DIRECTORY as original (not /tmp!)
         # This preserves relative paths to ../extracted_images/
-        timestamp = int(time.time() * 1000)  # milliseconds for uniqueness
-        temp_path = self.html_file.parent / f"compressed_{timestamp}.html"
-        self.temp_html_file = temp_path
+        fd, temp_name = tempfile.mkstemp(dir=str(self.html_file.parent), prefix="prepared_", suffix=".html")
+        self.temp_html_file = Path(temp_name)
         
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            f.write(compressed_content)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(prepared_content)
         
-        logger.info(f"Created compressed HTML: {self.temp_html_file}")
+        logger.info(f"Created prepared HTML: {self.temp_html_file}")
         return self.temp_html_file
 
     def _cleanup_temp_html(self):
@@ -173,201 +416,319 @@ class PresentationConverter:
         
         pdf_path = self.output_dir / output_filename
         
-        # Use compressed HTML if image compression is enabled
-        html_file_to_use = self.html_file
-        if self.compress_images:
-            html_file_to_use = self._compress_images_in_html()
-            logger.info("Using compressed images for PDF generation")
-        
-        with sync_playwright() as p:
-            # Launch browser with flags to allow local file access (needed for extracted images)
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    '--allow-file-access-from-files',
-                    '--disable-web-security',
-                    '--allow-running-insecure-content'
-                ]
+        # Use compressed images and local copies of remote assets if enabled
+        html_file_to_use = self._prepare_html()
+        self.raster_images = []
+        
+        try:
+            if self.render_mode == "parallel":
+                self._render_playwright_parallel(html_file_to_use, pdf_path)
+            else:
+                get_browser_pool().run(lambda page: self._render_playwright_page(page, html_file_to_use, pdf_path))
+        finally:
+            # Clean up temporary files
+            self._cleanup_temp_html()
+        
+        if self.raster_export:
+            self._finish_raster_export(pdf_path)
+        
+        logger.info(f"PDF generated with Playwright (16:9 format): {pdf_path}")
+        return str(pdf_path)
+
+    def _render_playwright_parallel(self, html_file_to_use: Path, pdf_path: Path):
+        """Print slides on several pooled pages at once and merge them in slide order."""
+        parts = max(1, Config.PARALLEL_CAPTURE_PAGES)
+        pool = get_browser_pool()
+        futures = [
+            pool.submit(lambda page, part=part: self._render_playwright_share(page, html_file_to_use, pdf_path, part, parts))
+            for part in range(parts)
+        ]
+        # Let every share finish before anything is merged or removed
+        wait(futures)
+        shares = [future.result() for future in futures if future.exception() is None]
+        try:
+            if len(shares) < len(futures):
+                raise next(future.exception() for future in futures if future.exception() is not None)
+            
+            rendered = sorted(item for share in shares for item in share)
+            if len(rendered) == 1 and rendered[0][0] is None:
+                return  # Single page deck, already printed to pdf_path
+            
+            logger.info(f"Rendered {len(rendered)} slides on {len(futures)} pages in parallel")
+            self._combine_pdfs([path for _, path in rendered], str(pdf_path))
+        finally:
+            self._remove_slide_pdfs([item for share in shares for item in share])
+
+    @staticmethod
+    def _remove_slide_pdfs(rendered: List[Tuple[Optional[int], str]]):
+        """Delete per-slide temp PDFs (a None index marks the final PDF of a single page deck)."""
+        for index, path in rendered:
+            if index is None:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _render_playwright_share(self, page, html_file_to_use: Path, pdf_path: Path,
+                                 part: int, parts: int) -> List[Tuple[Optional[int], str]]:
+        """Load the deck in one page and print this page's share of the slides."""
+        page.goto(f"file://{html_file_to_use.absolute()}", wait_until='networkidle')
+        wait_for_page(page)
+        
+        total_slides = len(page.query_selector_all('.slide'))
+        if self.raster_export:
+            shares = split_slides(max(1, total_slides), parts)
+            if part < len(shares):
+                self._capture_slide_images(page, shares[part] if total_slides > 1 else [None], pdf_path)
+        
+        page.emulate_media(media='print')
+        page.add_style_tag(content=PRINT_STYLES)
+        
+        if total_slides <= 1:
+            if part > 0:
+                return []
+            self._print_page(page, pdf_path)
+            return [(None, str(pdf_path))]
+        
+        shares = split_slides(total_slides, parts)
+        if part >= len(shares):
+            return []
+        
+        slide_keys = self._slide_cache_keys(page, html_file_to_use)
+        rendered = []
+        try:
+            for index in shares[part]:
+                temp_pdf_path = self._temp_slide_path(pdf_path, index)
+                rendered.append((index, str(temp_pdf_path)))
+                if not self._restore_slide(slide_keys, index, temp_pdf_path):
+                    page.evaluate(GOTO_SLIDE_SCRIPT, index)
+                    wait_for_slide(page)
+                    self._print_page(page, temp_pdf_path)
+                    self._store_slide(slide_keys, index, temp_pdf_path)
+        except Exception:
+            self._remove_slide_pdfs(rendered)
+            raise
+        return rendered
+
+    def _temp_slide_path(self, pdf_path: Path, index: int) -> Path:
+        return temp_slide_path(self.output_dir, pdf_path, index)
+
+    def _cache_result(self, cache_key: str, pdf_path):
+        """Store a finished conversion unless it was degraded (those would be served until they expire)."""
+        if self.degraded:
+            logger.warning(f"⚠️ Not caching degraded conversion: {'; '.join(self.degraded)}")
+            return
+        self.cache.put(cache_key, pdf_path)
+
+    def _cache_settings(self, target: str = "document") -> Dict[str, Any]:
+        """Render settings that make up the conversion cache key."""
+        settings = {
+            'target': target,
+            'method': self.method,
+            'zoom_factor': self.zoom_factor,
+            'compress_images': self.compress_images,
+        }
+        if self.prefetch_assets:
+            settings['asset_max_width'] = Config.ASSET_MAX_WIDTH
+        if target == "document" and self.method == "playwright":
+            settings['render_mode'] = self.render_mode
+        return settings
+
+    def _slide_cache_keys(self, page, html_file_to_use: Path) -> Optional[List[str]]:
+        """Cache keys for every slide of the loaded deck (before any navigation)."""
+        if not self.cache:
+            return None
+        try:
+            return self._slide_keys_from_sources(page.evaluate(SLIDE_SOURCES_SCRIPT), html_file_to_use)
+        except Exception as e:
+            logger.debug(f"Per-slide cache keys unavailable: {e}")
+            return None
+
+    def _slide_keys_from_sources(self, sources: Dict[str, Any], html_file_to_use: Path) -> List[str]:
+        """Cache keys from the result of SLIDE_SOURCES_SCRIPT."""
+        html = html_file_to_use.read_text(encoding='utf-8', errors='replace')
+        context_key = self.cache.context_key(
+            sources['context'], asset_fingerprint(html, html_file_to_use.parent), self._cache_settings("slide")
+        )
+        return [self.cache.slide_key(context_key, slide_html) for slide_html in sources['slides']]
+
+    def _restore_slide(self, slide_keys: Optional[List[str]], index: int, path: Path) -> bool:
+        if not slide_keys or index >= len(slide_keys):
+            return False
+        if self.cache.restore(slide_keys[index], path):
+            logger.info(f"♻️ Reusing cached render of slide {index + 1}")
+            return True
+        return False
+
+    def _store_slide(self, slide_keys: Optional[List[str]], index: int, path: Path):
+        if slide_keys and index < len(slide_keys) and not self.degraded:
+            self.cache.put(slide_keys[index], path)
+
+    def _pdf_options(self) -> Dict[str, Any]:
+        """page.pdf() options for 16:9 pages at the configured zoom."""
+        return {
+            'width': f"{16.0 * self.zoom_factor}in",
+            'height': f"{9.0 * self.zoom_factor}in",
+            'print_background': True,
+            'margin': {'top': '0.2in', 'right': '0.2in', 'bottom': '0.2in', 'left': '0.2in'},
+            'prefer_css_page_size': False,
+            'display_header_footer': False,
+            'landscape': False,
+        }
+
+    def _print_page(self, page, path: Path):
+        """Print the current page state as one 16:9 PDF page."""
+        page.pdf(path=str(path), **self._pdf_options())
+
+    def _raster_dir(self, pdf_path: Path) -> Path:
+        return self.output_dir / f"{Path(pdf_path).stem}_slides"
+
+    def _capture_slide_images(self, page, indices: List[Optional[int]], pdf_path: Path):
+        """
+        Screenshot slides of a loaded deck at 1920x1080 into <pdf stem>_slides/.
+        
+        Args:
+            page: Playwright page with the deck loaded (screen media)
+            indices: Slide indices to activate and capture; None captures the page as is
+            pdf_path: PDF the images belong to
+        """
+        image_dir = self._raster_dir(pdf_path)
+        image_dir.mkdir(parents=True, exist_ok=True)
+        viewport = page.viewport_size
+        page.set_viewport_size(RASTER_VIEWPORT)
+        page.add_style_tag(content=HIDE_CONTROLS_STYLES)
+        try:
+            for index in indices:
+                if index is not None:
+                    page.evaluate(GOTO_SLIDE_SCRIPT, index)
+                wait_for_slide(page)
+                image_path = image_dir / f"slide_{(index or 0) + 1:02d}.png"
+                page.screenshot(path=str(image_path), full_page=False)
+                self.raster_images.append((index or 0, str(image_path)))
+        finally:
+            if viewport:
+                page.set_viewport_size(viewport)
+
+    def _finish_raster_export(self, pdf_path: Path):
+        """Create thumbnails for the captured slide images and write the manifest."""
+        image_paths = [path for _, path in sorted(self.raster_images)]
+        thumbnails = generate_thumbnails(image_paths, self._raster_dir(pdf_path) / "thumbnails")
+        self.manifest_path = str(write_manifest(pdf_path, image_paths, thumbnails))
+
+    def _render_playwright_page(self, page, html_file_to_use: Path, pdf_path: Path):
+        """Load the presentation in a pooled browser page and print it to pdf_path."""
+        # Navigate to file (using original HTML)
+        file_url = f"file://{html_file_to_use.absolute()}"
+        logger.info(f"Loading HTML from: {file_url}")
+        page.goto(file_url, wait_until='networkidle')
+        wait_for_page(page)
+        
+        # Screenshot the slides in screen media before the print styles are applied
+        if self.raster_export:
+            slide_count = len(page.query_selector_all('.slide'))
+            self._capture_slide_images(page, list(range(slide_count)) if slide_count > 1 else [None], pdf_path)
+            if slide_count > 1:
+                page.evaluate(GOTO_SLIDE_SCRIPT, 0)
+        
+        # Set print media type for better PDF rendering
+        page.emulate_media(media='print')
+        
+        # Hide navigation elements
+        page.add_style_tag(content=PRINT_STYLES)
+        
+        # Check if this is a multi-slide presentation
+        slides = page.query_selector_all('.slide')
+        total_slides = len(slides)
+        
+        if total_slides <= 1:
+            # Single slide or no slide structure detected - use single page PDF
+            logger.info("Single slide detected, using single-page PDF generation")
+            
+            # Use 16:9 aspect ratio to match 1920x1080 and capture full content
+            page_width = 16.0 * self.zoom_factor  # 16:9 ratio for full width
+            page_height = 9.0 * self.zoom_factor   # 16:9 ratio
+            
+            # Generate PDF with proper 16:9 aspect ratio
+            page.pdf(
+                path=str(pdf_path),
+                width=f"{page_width}in",
+                height=f"{page_height}in",
+                print_background=True,
+                margin={
+                    'top': '0.2in',
+                    'right': '0.2in', 
+                    'bottom': '0.2in',
+                    'left': '0.2in'
+                },
+                prefer_css_page_size=False,
+                display_header_footer=False,
+                landscape=False
             )
-            # Create context with bypass CSP to allow local file access
-            context = browser.new_context(
-                bypass_csp=True,
-                ignore_https_errors=True
+        elif self.render_mode == "single_pass":
+            # Multi-slide presentation - lay every slide out as its own page and print once
+            logger.info(f"Multi-slide presentation detected ({total_slides} slides), rendering in a single pass")
+            
+            page_width = 16.0 * self.zoom_factor  # 16:9 ratio
+            page_height = 9.0 * self.zoom_factor
+            
+            page.add_style_tag(content=single_pass_styles(page_height - 0.4))
+            page.evaluate(REVEAL_SLIDES_SCRIPT)
+            wait_for_page(page)
+            
+            page.pdf(
+                path=str(pdf_path),
+                width=f"{page_width}in",
+                height=f"{page_height}in",
+                print_background=True,
+                margin={
+                    'top': '0.2in',
+                    'right': '0.2in', 
+                    'bottom': '0.2in',
+                    'left': '0.2in'
+                },
+                prefer_css_page_size=False,
+                display_header_footer=False,
+                landscape=False
             )
-            page = context.new_page()
-            
-            # Navigate to file (using original HTML)
-            file_url = f"file://{html_file_to_use.absolute()}"
-            logger.info(f"Loading HTML from: {file_url}")
-            page.goto(file_url, wait_until='networkidle')
-            page.wait_for_timeout(3000)
-            
-            # Set print media type for better PDF rendering
-            page.emulate_media(media='print')
-            
-            # Hide navigation elements
-            page.add_style_tag(content="""
-                @media print {
-                    /* Hide navigation elements */
-                    .controls, .slide-number, .progress-bar, .navigation,
-                    [class*="control"], [class*="nav"], .presenter-notes {
-                        display: none !important;
-                    }
-                    
-                    /* Ensure full content width is captured */
-                    body {
-                        width: 100% !important;
-                        max-width: none !important;
-                        overflow: visible !important;
-                    }
-                    
-                    /* Ensure slides break properly and use full width */
-                    .slide, section {
-                        page-break-after: always;
-                        page-break-inside: avoid;
-                        width: 100% !important;
-                        max-width: none !important;
-                        min-width: 100% !important;
-                    }
-                    
-                    /* Last slide shouldn't have page break */
-                    .slide:last-child, section:last-child {
-                        page-break-after: auto;
-                    }
-                }
-            """)
+        else:
+            # Multi-slide presentation - capture each slide individually
+            logger.info(f"Multi-slide presentation detected ({total_slides} slides)")
             
-            # Check if this is a multi-slide presentation
-            slides = page.query_selector_all('.slide')
-            total_slides = len(slides)
+            # Capture each slide as a separate PDF page
+            temp_pdfs = []
+            slide_keys = self._slide_cache_keys(page, html_file_to_use)
             
-            if total_slides <= 1:
-                # Single slide or no slide structure detected - use single page PDF
-                logger.info("Single slide detected, using single-page PDF generation")
-                
-                # Use 16:9 aspect ratio to match 1920x1080 and capture full content
-                page_width = 16.0 * self.zoom_factor  # 16:9 ratio for full width
-                page_height = 9.0 * self.zoom_factor   # 16:9 ratio
-                
-                # Generate PDF with proper 16:9 aspect ratio
-                page.pdf(
-                    path=str(pdf_path),
-                    width=f"{page_width}in",
-                    height=f"{page_height}in",
-                    print_background=True,
-                    margin={
-                        'top': '0.2in',
-                        'right': '0.2in', 
-                        'bottom': '0.2in',
-                        'left': '0.2in'
-                    },
-                    prefer_css_page_size=False,
-                    display_header_footer=False,
-                    landscape=False
-                )
-            else:
-                # Multi-slide presentation - capture each slide individually
-                logger.info(f"Multi-slide presentation detected ({total_slides} slides)")
-                
-                # Capture each slide as a separate PDF page
-                temp_pdfs = []
+            for slide_num in range(1, total_slides + 1):
+                logger.info(f"Capturing slide {slide_num}/{total_slides}")
                 
-                for slide_num in range(1, total_slides + 1):
-                    logger.info(f"Capturing slide {slide_num}/{total_slides}")
-                    
-                    # Navigate to specific slide (most presentations use arrow keys)
-                    if slide_num > 1:
-                        page.keyboard.press('ArrowRight')
-                        page.wait_for_timeout(1000)
-                    
-                    # Generate PDF for this slide
-                    temp_pdf_path = self.output_dir / f"temp_slide_{slide_num:02d}.pdf"
-                    
-                    page_width = 16.0 * self.zoom_factor  # 16:9 ratio
-                    page_height = 9.0 * self.zoom_factor
-                    
-                    page.pdf(
-                        path=str(temp_pdf_path),
-                        width=f"{page_width}in",
-                        height=f"{page_height}in",
-                        print_background=True,
-                        margin={
-                            'top': '0.2in',
-                            'right': '0.2in', 
-                            'bottom': '0.2in',
-                            'left': '0.2in'
-                        },
-                        prefer_css_page_size=False,
-                        display_header_footer=False,
-                        landscape=False
-                    )
-                    
-                    temp_pdfs.append(str(temp_pdf_path))
+                # Navigate to specific slide (most presentations use arrow keys)
+                if slide_num > 1:
+                    page.keyboard.press('ArrowRight')
+                    wait_for_slide(page)
                 
-                # Combine all PDFs into one
-                self._combine_pdfs(temp_pdfs, str(pdf_path))
+                # Generate PDF for this slide (unless an identical slide was rendered before)
+                temp_pdf_path = self._temp_slide_path(pdf_path, slide_num - 1)
+                if not self._restore_slide(slide_keys, slide_num - 1, temp_pdf_path):
+                    self._print_page(page, temp_pdf_path)
+                    self._store_slide(slide_keys, slide_num - 1, temp_pdf_path)
                 
-                # Clean up temporary PDFs
-                for temp_pdf in temp_pdfs:
-                    try:
-                        os.remove(temp_pdf)
-                    except:
-                        pass
+                temp_pdfs.append(str(temp_pdf_path))
             
-            browser.close()
+            # Combine all PDFs into one
+            self._combine_pdfs(temp_pdfs, str(pdf_path))
             
-            # Clean up temporary files
-            if self.compress_images:
-                self._cleanup_temp_html()
-            
-            logger.info(f"PDF generated with Playwright (16:9 format): {pdf_path}")
-            return str(pdf_path)
+            # Clean up temporary PDFs
+            for temp_pdf in temp_pdfs:
+                try:
+                    os.remove(temp_pdf)
+                except:
+                    pass
 
     def _combine_pdfs(self, pdf_paths: List[str], output_path: str):
         """Combine multiple PDFs into one using PyPDF2 or fallback to system tools."""
-        try:
-            # Try using PyPDF2 first
-            try:
-                from PyPDF2 import PdfMerger
-                merger = PdfMerger()
-                
-                for pdf_path in pdf_paths:
-                    merger.append(pdf_path)
-                
-                merger.write(output_path)
-                merger.close()
-                logger.info(f"Combined {len(pdf_paths)} PDFs using PyPDF2")
-                return
-                
-            except ImportError:
-                logger.info("PyPDF2 not available, trying system tools...")
-                
-            # Fallback to system tools
-            if shutil.which('pdftk'):
-                # Use pdftk if available
-                cmd = ['pdftk'] + pdf_paths + ['cat', 'output', output_path]
-                subprocess.run(cmd, check=True)
-                logger.info(f"Combined {len(pdf_paths)} PDFs using pdftk")
-                return
-                
-            elif shutil.which('gs'):
-                # Use Ghostscript if available
-                cmd = ['gs', '-dNOPAUSE', '-dBATCH', '-sDEVICE=pdfwrite', 
-                       f'-sOutputFile={output_path}'] + pdf_paths
-                subprocess.run(cmd, check=True)
-                logger.info(f"Combined {len(pdf_paths)} PDFs using Ghostscript")
-                return
-                
-            else:
-                # Last resort: just use the first PDF
-                logger.warning("No PDF merging tools available, using first slide only")
-                shutil.copy(pdf_paths[0], output_path)
-                
-        except Exception as e:
-            logger.error(f"Error combining PDFs: {e}")
-            # Fallback: copy first PDF
-            if pdf_paths:
-                shutil.copy(pdf_paths[0], output_path)
+        if not combine_pdfs(pdf_paths, output_path):
+            self.degraded.append("slide PDFs could not be merged")
 
     def convert_with_chrome_headless(self, output_filename: str) -> str:
         """Convert using Chrome headless - produces selectable PDF with proper multi-slide support."""
@@ -422,7 +783,7 @@ class PresentationConverter:
                 WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
-                time.sleep(2)
+                wait_for_driver(driver)
                 
                 # Check for slides
                 slides = driver.find_elements(By.CLASS_NAME, "slide")
@@ -509,7 +870,7 @@ class PresentationConverter:
                         # Navigate to specific slide
                         if slide_num > 1:
                             driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ARROW_RIGHT)
-                            time.sleep(1)
+                            wait_for_driver(driver, scope='slide')
                         
                         # Use CDP to generate PDF for this slide
                         base_width, base_height = 16.0, 9.0  # 16:9 ratio
@@ -532,7 +893,7 @@ class PresentationConverter:
                         pdf_data = result['data']
                         
                         # Save temporary PDF
-                        temp_pdf_path = self.output_dir / f"temp_slide_{slide_num:02d}.pdf"
+                        temp_pdf_path = self._temp_slide_path(pdf_path, slide_num - 1)
                         with open(temp_pdf_path, 'wb') as f:
                             f.write(base64.b64decode(pdf_data))
                         
@@ -593,7 +954,7 @@ class PresentationConverter:
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            time.sleep(3)
+            wait_for_driver(driver)
             
             # Check for slides
             slides = driver.find_elements(By.CLASS_NAME, "slide")
@@ -690,7 +1051,7 @@ class PresentationConverter:
                     # Navigate to specific slide
                     if slide_num > 1:
                         driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ARROW_RIGHT)
-                        time.sleep(1)
+                        wait_for_driver(driver, scope='slide')
                     
                     # Use 16:9 dimensions
                     base_width, base_height = 16.0, 9.0  # 16:9 ratio
@@ -714,7 +1075,7 @@ class PresentationConverter:
                     pdf_data = result['data']
                     
                     # Save temporary PDF
-                    temp_pdf_path = self.output_dir / f"temp_slide_{slide_num:02d}.pdf"
+                    temp_pdf_path = self._temp_slide_path(pdf_path, slide_num - 1)
                     with open(temp_pdf_path, 'wb') as f:
                         f.write(base64.b64decode(pdf_data))
                     
@@ -737,8 +1098,17 @@ class PresentationConverter:
             driver.quit()
 
     # Original methods kept for backward compatibility
-    def capture_slides_selenium(self) -> List[str]:
-        """Capture all slides using Selenium (original screenshot method)."""
+    def capture_slides_selenium(self, on_capture: Optional[Callable[[bytes], None]] = None) -> List[str]:
+        """
+        Capture all slides using Selenium (original screenshot method).
+        
+        Args:
+            on_capture: Receives each screenshot as PNG bytes instead of writing
+                slide_NN.png files (e.g. ImagePDFWriter.add)
+        
+        Returns:
+            Paths of the written screenshots (empty when on_capture is given)
+        """
         logger.info("Starting slide capture with Selenium (screenshot method)...")
         driver = self.setup_selenium_driver()
         image_paths = []
@@ -750,7 +1120,7 @@ class PresentationConverter:
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "slide"))
             )
-            time.sleep(3)
+            wait_for_driver(driver)
             
             # Hide UI elements
             driver.execute_script("""
@@ -770,13 +1140,16 @@ class PresentationConverter:
             for slide_num in range(1, total_slides + 1):
                 logger.info(f"Capturing slide {slide_num}/{total_slides}")
                 
-                screenshot_path = self.output_dir / f"slide_{slide_num:02d}.png"
-                driver.save_screenshot(str(screenshot_path))
-                image_paths.append(str(screenshot_path))
+                if on_capture:
+                    on_capture(driver.get_screenshot_as_png())
+                else:
+                    screenshot_path = self.output_dir / f"slide_{slide_num:02d}.png"
+                    driver.save_screenshot(str(screenshot_path))
+                    image_paths.append(str(screenshot_path))
                 
                 if slide_num < total_slides:
                     driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ARROW_RIGHT)
-                    time.sleep(2)
+                    wait_for_driver(driver, scope='slide')
             
         except Exception as e:
             logger.error(f"Error during slide capture: {e}")
@@ -786,92 +1159,90 @@ class PresentationConverter:
         
         return image_paths
 
-    async def capture_slides_playwright(self) -> List[str]:
-        """Capture all slides using Playwright (original screenshot method)."""
+    async def capture_slides_playwright(self, parallel_pages: Optional[int] = None,
+                                        pool: Optional[AsyncBrowserPool] = None) -> List[str]:
+        """
+        Capture all slides using Playwright (original screenshot method).
+        
+        Args:
+            parallel_pages: Number of pages capturing slides concurrently
+                (defaults to PARALLEL_CAPTURE_PAGES; 1 steps through the deck with ArrowRight)
+            pool: Warm AsyncBrowserPool owned by the caller; without one a single
+                browser is launched for this call and closed when it returns
+        """
         logger.info("Starting slide capture with Playwright (screenshot method)...")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page(viewport={'width': 1920, 'height': 1080})  # Full HD viewport
-            
-            file_url = f"file://{self.html_file.absolute()}"
-            await page.goto(file_url)
-            await page.wait_for_selector('.slide')
-            await page.wait_for_timeout(3000)
-            
-            await page.add_style_tag(content="""
-                .controls, .slide-number, .progress-bar {
-                    display: none !important;
-                }
-            """)
-            
-            slides = await page.query_selector_all('.slide')
-            total_slides = len(slides)
-            logger.info(f"Found {total_slides} slides")
-            
-            image_paths = []
+        parts = max(1, Config.PARALLEL_CAPTURE_PAGES if parallel_pages is None else parallel_pages)
+        if pool is None:
+            async with AsyncBrowserPool(size=1, max_jobs_per_browser=0, pages_per_browser=parts) as scoped_pool:
+                return await self._capture_on_pool(scoped_pool, parts)
+        return await self._capture_on_pool(pool, parts)
+
+    async def _capture_on_pool(self, pool: AsyncBrowserPool, parts: int) -> List[str]:
+        if parts == 1:
+            return await pool.run(self._capture_all_playwright)
+        
+        # Each page loads the same document and jumps straight to its share of the slides
+        results = await asyncio.gather(*[
+            pool.run(lambda page, part=part: self._capture_share_playwright(page, part, parts))
+            for part in range(parts)
+        ])
+        image_paths = [path for share_paths in results for path in share_paths]
+        logger.info(f"Captured {len(image_paths)} slides on {sum(1 for share in results if share)} pages in parallel")
+        return image_paths
+
+    async def _load_capture_page(self, page) -> int:
+        """Open the deck for screenshots in a pooled page and return its slide count."""
+        await page.set_viewport_size({'width': 1920, 'height': 1080})  # Full HD viewport
+        await page.goto(f"file://{self.html_file.absolute()}")
+        await page.wait_for_selector('.slide')
+        await async_wait_for_page(page, quiet_ms=Config.NETWORK_QUIET_MS)
+        await page.add_style_tag(content=HIDE_CONTROLS_STYLES)
+        return len(await page.query_selector_all('.slide'))
+
+    async def _capture_all_playwright(self, page) -> List[str]:
+        """Screenshot every slide, stepping through the deck with ArrowRight."""
+        total_slides = await self._load_capture_page(page)
+        logger.info(f"Found {total_slides} slides")
+        
+        image_paths = []
+        for slide_num in range(1, total_slides + 1):
+            logger.info(f"Capturing slide {slide_num}/{total_slides}")
             
-            for slide_num in range(1, total_slides + 1):
-                logger.info(f"Capturing slide {slide_num}/{total_slides}")
-                
-                screenshot_path = self.output_dir / f"slide_{slide_num:02d}.png"
-                await page.screenshot(path=str(screenshot_path), full_page=False)
-                image_paths.append(str(screenshot_path))
-                
-                if slide_num < total_slides:
-                    await page.keyboard.press('ArrowRight')
-                    await page.wait_for_timeout(2000)
+            screenshot_path = self.output_dir / f"slide_{slide_num:02d}.png"
+            await page.screenshot(path=str(screenshot_path), full_page=False)
+            image_paths.append(str(screenshot_path))
             
-            await browser.close()
-            return image_paths
+            if slide_num < total_slides:
+                await page.keyboard.press('ArrowRight')
+                await async_wait_for_slide(page)
+        return image_paths
+
+    async def _capture_share_playwright(self, page, part: int, parts: int) -> List[str]:
+        """Screenshot this page's share of the slides by activating each one directly."""
+        total_slides = await self._load_capture_page(page)
+        shares = split_slides(max(1, total_slides), parts)
+        if part >= len(shares):
+            return []
+        
+        paths = []
+        for index in shares[part]:
+            await page.evaluate(GOTO_SLIDE_SCRIPT, index)
+            await async_wait_for_slide(page)
+            screenshot_path = self.output_dir / f"slide_{index + 1:02d}.png"
+            await page.screenshot(path=str(screenshot_path), full_page=False)
+            paths.append(str(screenshot_path))
+        return paths
 
     def create_pdf_from_images(self, image_paths: List[str], output_filename: str = "presentation.pdf"):
-        """Create PDF from captured slide images with proper 4:3 aspect ratio."""
+        """Create PDF from captured slide images with 16:9 pages, one image decoded at a time."""
         logger.info(f"Creating PDF from {len(image_paths)} images with {self.zoom_factor*100:.0f}% zoom...")
         
         pdf_path = self.output_dir / output_filename
+        with ImagePDFWriter(pdf_path, self.zoom_factor) as writer:
+            for image_path in image_paths:
+                writer.add(image_path)
         
-        first_image = Image.open(image_paths[0])
-        if first_image.mode != 'RGB':
-            first_image = first_image.convert('RGB')
-        
-        img_width, img_height = first_image.size
-        
-        # Calculate 16:9 aspect ratio dimensions to match content
-        aspect_ratio = 16/9
-        if img_width / img_height > aspect_ratio:
-            # Image is wider than 16:9, fit to width  
-            page_width = img_width * self.zoom_factor
-            page_height = page_width / aspect_ratio
-        else:
-            # Image is taller than 16:9, fit to height
-            page_height = img_height * self.zoom_factor
-            page_width = page_height * aspect_ratio
-        
-        c = canvas.Canvas(str(pdf_path), pagesize=(page_width, page_height))
-        first_image.close()
-        
-        for i, image_path in enumerate(image_paths):
-            logger.info(f"Adding slide {i+1} to PDF...")
-            
-            with Image.open(image_path) as img:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                if i > 0:
-                    c.setPageSize((page_width, page_height))
-                
-                # Center the image within the 16:9 page
-                x_offset = max(0, (page_width - img.width * self.zoom_factor) / 2)
-                y_offset = max(0, (page_height - img.height * self.zoom_factor) / 2)
-                
-                c.drawImage(ImageReader(img), x_offset, y_offset, 
-                          img.width * self.zoom_factor, img.height * self.zoom_factor)
-                
-                if i < len(image_paths) - 1:
-                    c.showPage()
-        
-        c.save()
         logger.info(f"PDF saved with 16:9 aspect ratio (1920x1080): {pdf_path}")
         return str(pdf_path)
 
@@ -898,6 +1269,19 @@ class PresentationConverter:
             Path to generated PDF file
         """
         try:
+            self.degraded = []
+            # Serve identical conversions (same HTML, assets and settings) from the cache
+            cache_key = None
+            if self.cache and not self.raster_export:
+                cache_key = self.cache.document_key(self.html_file, self._cache_settings())
+                cached_path = self.output_dir / output_filename
+                if self.cache.restore(cache_key, cached_path):
+                    logger.info(f"♻️ Reusing cached conversion: {cached_path}")
+                    return str(cached_path)
+            
+            if self.raster_export and self.method != "playwright":
+                logger.warning(f"Raster export requires the playwright method, skipping it for '{self.method}'")
+            
             # Use enhanced PDF generation methods by default
             if self.method == "playwright":
                 pdf_path = self.convert_with_playwright(output_filename)
@@ -906,10 +1290,11 @@ class PresentationConverter:
             elif self.method == "selenium_cdp":
                 pdf_path = self.convert_with_selenium_cdp(output_filename)
             elif self.method == "selenium":
-                # Original screenshot method for backward compatibility
-                image_paths = self.capture_slides_selenium()
-                self.temp_images = image_paths
-                pdf_path = self.create_pdf_from_images(image_paths, output_filename)
+                # Original screenshot method for backward compatibility;
+                # screenshots stream into the PDF without intermediate files
+                with ImagePDFWriter(self.output_dir / output_filename, self.zoom_factor) as writer:
+                    self.capture_slides_selenium(on_capture=writer.add)
+                pdf_path = str(writer.pdf_path)
             else:
                 # Default fallback to playwright
                 logger.warning(f"Unknown method '{self.method}', using playwright")
@@ -918,6 +1303,9 @@ class PresentationConverter:
             if cleanup:
                 self.cleanup_temp_files()
             
+            if cache_key:
+                self._cache_result(cache_key, pdf_path)
+            
             logger.info(f"Conversion completed successfully with 16:9 format (1920x1080): {pdf_path}")
             return pdf_path
             
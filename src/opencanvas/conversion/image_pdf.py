@@ -0,0 +1,144 @@
+"""
+Streaming assembly of screenshot-based PDFs.
+
+The screenshot conversion used to write every slide to a PNG file, then open
+each one with PIL and let reportlab re-encode the decoded bitmap. ImagePDFWriter
+takes screenshots as they are captured (encoded bytes or file paths), JPEG-encodes
+them on a small worker pool and appends each page to the PDF in slide order.
+Only a bounded number of pages is in flight at a time and every decoded bitmap
+is released once its JPEG is written, so memory stays flat for long decks and
+no intermediate files are needed.
+"""
+
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import logging
+
+from PIL import Image
+from reportlab.pdfgen import canvas
+from reportlab.lib.utils import ImageReader
+
+from opencanvas.config import Config
+
+logger = logging.getLogger(__name__)
+
+ImageSource = Union[bytes, str, Path]
+
+
+def encode_page(image: ImageSource, quality: int) -> Tuple[bytes, int, int]:
+    """
+    Decode a screenshot and re-encode it as JPEG.
+
+    Args:
+        image: Encoded image bytes or path to an image file
+        quality: JPEG quality
+
+    Returns:
+        (jpeg bytes, width, height)
+    """
+    source = io.BytesIO(image) if isinstance(image, bytes) else image
+    with Image.open(source) as opened:
+        rgb = opened.convert('RGB') if opened.mode != 'RGB' else opened
+        output = io.BytesIO()
+        rgb.save(output, format='JPEG', quality=quality, optimize=True)
+        width, height = rgb.size
+        if rgb is not opened:
+            rgb.close()
+    return output.getvalue(), width, height
+
+
+class ImagePDFWriter:
+    """Appends slide screenshots to a 16:9 PDF as they arrive."""
+
+    def __init__(self, pdf_path, zoom_factor: float = 1.2, workers: Optional[int] = None,
+                 jpeg_quality: Optional[int] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            pdf_path: Output PDF path
+            zoom_factor: Page and image scale (page size follows the first screenshot)
+            workers: Threads encoding pages (defaults to SCREENSHOT_ENCODE_WORKERS)
+            jpeg_quality: JPEG quality of embedded pages (defaults to SCREENSHOT_JPEG_QUALITY)
+        """
+        self.pdf_path = Path(pdf_path)
+        self.zoom_factor = zoom_factor
+        self.workers = workers or Config.SCREENSHOT_ENCODE_WORKERS
+        self.jpeg_quality = jpeg_quality or Config.SCREENSHOT_JPEG_QUALITY
+        self.max_pending = self.workers * 2
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._pending = deque()
+        self._canvas = None
+        self._page_size = None
+        self.pages = 0
+
+    def add(self, image: ImageSource):
+        """
+        Queue a screenshot as the next page.
+
+        Args:
+            image: Encoded image bytes (e.g. a PNG screenshot) or path to an image file
+        """
+        self._pending.append(self._executor.submit(encode_page, image, self.jpeg_quality))
+        while len(self._pending) >= self.max_pending:
+            self._write_next()
+
+    def _write_next(self):
+        jpeg, width, height = self._pending.popleft().result()
+
+        if self._canvas is None:
+            # Calculate 16:9 aspect ratio dimensions to match content
+            aspect_ratio = 16 / 9
+            if width / height > aspect_ratio:
+                page_width = width * self.zoom_factor
+                page_height = page_width / aspect_ratio
+            else:
+                page_height = height * self.zoom_factor
+                page_width = page_height * aspect_ratio
+            self._page_size = (page_width, page_height)
+            self._canvas = canvas.Canvas(str(self.pdf_path), pagesize=self._page_size)
+        else:
+            self._canvas.showPage()
+            self._canvas.setPageSize(self._page_size)
+
+        # Center the image within the 16:9 page
+        page_width, page_height = self._page_size
+        x_offset = max(0, (page_width - width * self.zoom_factor) / 2)
+        y_offset = max(0, (page_height - height * self.zoom_factor) / 2)
+        self._canvas.drawImage(ImageReader(io.BytesIO(jpeg)), x_offset, y_offset,
+                               width * self.zoom_factor, height * self.zoom_factor)
+        self.pages += 1
+        logger.info(f"Added slide {self.pages} to PDF...")
+
+    def close(self) -> str:
+        """Write the remaining pages and save the PDF."""
+        try:
+            while self._pending:
+                self._write_next()
+        finally:
+            self._executor.shutdown(wait=True)
+        if self._canvas is None:
+            raise ValueError("No slides were captured")
+        self._canvas.save()
+        return str(self.pdf_path)
+
+    def abort(self):
+        """Discard queued pages without writing the PDF."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
@@ -0,0 +1,134 @@
+"""
+Slide image export: thumbnails and the raster manifest.
+
+With raster export enabled, the Playwright converter screenshots every slide in
+the same browser session that prints the PDF. This module turns those
+full-size PNGs into thumbnails on a process pool (resizing and WebP encoding
+are CPU bound) and writes a manifest next to the PDF describing every slide
+image, so preview pipelines do not need a second render.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from PIL import Image
+
+from opencanvas.config import Config
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_FORMATS = {'webp': ('WEBP', {'quality': 80, 'method': 4}), 'png': ('PNG', {'optimize': True})}
+
+
+def make_thumbnail(image_path: str, thumbnail_path: str, width: int, image_format: str) -> Tuple[int, int]:
+    """
+    Resize one slide image (runs in a worker process).
+
+    Args:
+        image_path: Full-size PNG
+        thumbnail_path: Output file
+        width: Thumbnail width (height keeps the aspect ratio)
+        image_format: 'webp' or 'png'
+
+    Returns:
+        (width, height) of the thumbnail
+    """
+    pil_format, options = THUMBNAIL_FORMATS[image_format]
+    with Image.open(image_path) as image:
+        height = max(1, round(image.height * width / image.width))
+        thumbnail = image.convert('RGB').resize((width, height), Image.LANCZOS)
+    thumbnail.save(thumbnail_path, format=pil_format, **options)
+    return thumbnail.size
+
+
+def generate_thumbnails(image_paths: List[str], thumbnail_dir, width: Optional[int] = None,
+                        image_format: Optional[str] = None, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Create thumbnails for slide images on a process pool.
+
+    Args:
+        image_paths: Full-size slide images in slide order
+        thumbnail_dir: Output directory (created if missing)
+        width: Thumbnail width (defaults to THUMBNAIL_WIDTH)
+        image_format: 'webp' or 'png' (defaults to THUMBNAIL_FORMAT)
+        workers: Worker processes (defaults to THUMBNAIL_WORKERS)
+
+    Returns:
+        One dict per image with 'path', 'width' and 'height'
+    """
+    width = width or Config.THUMBNAIL_WIDTH
+    image_format = (image_format or Config.THUMBNAIL_FORMAT).lower()
+    if image_format not in THUMBNAIL_FORMATS:
+        raise ValueError(f"Unsupported thumbnail format: {image_format} (expected 'webp' or 'png')")
+    if not image_paths:
+        return []
+
+    thumbnail_dir = Path(thumbnail_dir)
+    thumbnail_dir.mkdir(parents=True, exist_ok=True)
+    targets = [str(thumbnail_dir / f"{Path(path).stem}.{image_format}") for path in image_paths]
+    arguments = (image_paths, targets, [width] * len(targets), [image_format] * len(targets))
+
+    workers = min(workers or Config.THUMBNAIL_WORKERS, len(image_paths))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sizes = list(executor.map(make_thumbnail, *arguments))
+    else:
+        sizes = list(map(make_thumbnail, *arguments))
+
+    logger.info(f"🖼️ Created {len(targets)} {image_format} thumbnails ({width}px wide)")
+    return [{'path': target, 'width': size[0], 'height': size[1]} for target, size in zip(targets, sizes)]
+
+
+def manifest_path_for(pdf_path) -> Path:
+    """Manifest location for a PDF (presentation.pdf -> presentation_manifest.json)."""
+    pdf_path = Path(pdf_path)
+    return pdf_path.with_name(f"{pdf_path.stem}_manifest.json")
+
+
+def write_manifest(pdf_path, image_paths: List[str], thumbnails: List[Dict[str, Any]]) -> Path:
+    """
+    Write the raster manifest next to the PDF.
+
+    Args:
+        pdf_path: Converted PDF
+        image_paths: Full-size slide images in slide order
+        thumbnails: Result of generate_thumbnails() for the same images
+
+    Returns:
+        Path to the manifest
+    """
+    manifest_path = manifest_path_for(pdf_path)
+    base_dir = manifest_path.parent
+
+    def relative(path):
+        path = Path(path)
+        try:
+            return str(path.relative_to(base_dir))
+        except ValueError:
+            return str(path)
+
+    slides = []
+    for number, image_path in enumerate(image_paths, start=1):
+        with Image.open(image_path) as image:
+            size = image.size
+        slide = {'slide': number, 'image': relative(image_path), 'width': size[0], 'height': size[1]}
+        if number <= len(thumbnails):
+            thumbnail = thumbnails[number - 1]
+            slide['thumbnail'] = {'path': relative(thumbnail['path']),
+                                  'width': thumbnail['width'], 'height': thumbnail['height']}
+        slides.append(slide)
+
+    manifest = {
+        'pdf': relative(pdf_path),
+        'slide_count': len(slides),
+        'created_at': datetime.now().isoformat(),
+        'slides': slides,
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"📝 Raster manifest written: {manifest_path}")
+    return manifest_path
@@ -0,0 +1,176 @@
+"""
+Event-driven readiness checks for slide capture.
+
+Instead of sleeping for a worst-case delay before printing or capturing a
+slide, the converters wait until the page is actually stable: network quiet,
+document.fonts.ready, every image decoded, and running CSS transitions and
+animations of the active slide finished. All waits share one hard cap, so a
+page that never settles costs at most as much as the old fixed delay.
+
+The same script is used from sync Playwright, async Playwright and Selenium.
+"""
+
+import time
+from typing import Optional
+import logging
+
+from opencanvas.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Resolves with the number of milliseconds spent waiting.
+# scope: 'document' waits on the whole page, 'slide' only on the active slide.
+# quiet: wait until no new resources have loaded for this long (0 to skip).
+READINESS_SCRIPT = """
+async ({scope, timeout, quiet}) => {
+    const started = performance.now();
+    const deadline = started + timeout;
+    const remaining = () => Math.max(0, deadline - performance.now());
+    const capped = (promise) => Promise.race([
+        Promise.resolve(promise).catch(() => null),
+        new Promise(resolve => setTimeout(resolve, remaining()))
+    ]);
+    const nextFrame = () => capped(new Promise(resolve =>
+        requestAnimationFrame(() => requestAnimationFrame(resolve))));
+
+    if (quiet > 0) {
+        await capped(new Promise(resolve => {
+            let seen = -1;
+            const check = () => {
+                const loaded = performance.getEntriesByType('resource').length;
+                if (loaded === seen && document.readyState === 'complete') {
+                    resolve();
+                } else {
+                    seen = loaded;
+                    setTimeout(check, quiet);
+                }
+            };
+            check();
+        }));
+    }
+
+    if (document.fonts && document.fonts.ready) {
+        await capped(document.fonts.ready);
+    }
+
+    const root = scope === 'slide' ? (document.querySelector('.slide.active') || document) : document;
+    const images = Array.from(root.querySelectorAll('img')).filter(img => img.src && img.decode);
+    await capped(Promise.all(images.map(img => img.decode().catch(() => null))));
+
+    // Let style changes from navigation start their transitions, then wait for them
+    await nextFrame();
+    const animations = root === document
+        ? (document.getAnimations ? document.getAnimations() : [])
+        : (root.getAnimations ? root.getAnimations({subtree: true}) : []);
+    const finite = animations.filter(animation => {
+        const timing = animation.effect && animation.effect.getComputedTiming();
+        return timing && Number.isFinite(timing.endTime);
+    });
+    await capped(Promise.all(finite.map(animation => animation.finished.catch(() => null))));
+    await nextFrame();
+
+    return Math.round(performance.now() - started);
+}
+"""
+
+# Selenium's execute_async_script passes a completion callback as the last argument
+SELENIUM_READINESS_SCRIPT = (
+    "const done = arguments[arguments.length - 1];"
+    f"({READINESS_SCRIPT})(arguments[0]).then(done, () => done(null));"
+)
+
+
+def _options(scope: str, timeout_ms: Optional[int], quiet_ms: int) -> dict:
+    if timeout_ms is None:
+        timeout_ms = Config.PAGE_READY_TIMEOUT_MS if scope == 'document' else Config.SLIDE_READY_TIMEOUT_MS
+    return {'scope': scope, 'timeout': timeout_ms, 'quiet': quiet_ms}
+
+
+def _log(scope: str, waited_ms):
+    if waited_ms is not None:
+        logger.debug(f"{scope.title()} ready after {waited_ms}ms")
+
+
+def wait_for_page(page, timeout_ms: Optional[int] = None, quiet_ms: int = 0) -> Optional[int]:
+    """
+    Wait until a (sync Playwright) page has loaded fonts, images and finished animating.
+
+    Args:
+        page: Playwright page
+        timeout_ms: Hard cap for all waits (defaults to PAGE_READY_TIMEOUT_MS)
+        quiet_ms: Also wait for this long without new network requests (0 to skip,
+            e.g. when the page was loaded with wait_until='networkidle')
+
+    Returns:
+        Milliseconds spent waiting, or None if the check could not run
+    """
+    options = _options('document', timeout_ms, quiet_ms)
+    try:
+        waited = page.evaluate(READINESS_SCRIPT, options)
+    except Exception as e:
+        logger.debug(f"Page readiness check failed: {e}")
+        return None
+    _log('page', waited)
+    return waited
+
+
+def wait_for_slide(page, timeout_ms: Optional[int] = None) -> Optional[int]:
+    """Wait until the active slide of a (sync Playwright) page has settled after navigation."""
+    try:
+        waited = page.evaluate(READINESS_SCRIPT, _options('slide', timeout_ms, 0))
+    except Exception as e:
+        logger.debug(f"Slide readiness check failed: {e}")
+        return None
+    _log('slide', waited)
+    return waited
+
+
+async def async_wait_for_page(page, timeout_ms: Optional[int] = None, quiet_ms: int = 0) -> Optional[int]:
+    """Async Playwright variant of wait_for_page()."""
+    try:
+        waited = await page.evaluate(READINESS_SCRIPT, _options('document', timeout_ms, quiet_ms))
+    except Exception as e:
+        logger.debug(f"Page readiness check failed: {e}")
+        return None
+    _log('page', waited)
+    return waited
+
+
+async def async_wait_for_slide(page, timeout_ms: Optional[int] = None) -> Optional[int]:
+    """Async Playwright variant of wait_for_slide()."""
+    try:
+        waited = await page.evaluate(READINESS_SCRIPT, _options('slide', timeout_ms, 0))
+    except Exception as e:
+        logger.debug(f"Slide readiness check failed: {e}")
+        return None
+    _log('slide', waited)
+    return waited
+
+
+def wait_for_driver(driver, scope: str = 'document', timeout_ms: Optional[int] = None,
+                    quiet_ms: Optional[int] = None) -> Optional[int]:
+    """
+    Selenium variant: wait until the page (or its active slide) is stable.
+
+    Args:
+        driver: Selenium WebDriver
+        scope: 'document' after loading, 'slide' after navigating to the next slide
+        timeout_ms: Hard cap for all waits
+        quiet_ms: Network quiet period (defaults to NETWORK_QUIET_MS for documents,
+            Selenium has no network idle event)
+
+    Returns:
+        Milliseconds spent waiting, or None if the check could not run
+    """
+    if quiet_ms is None:
+        quiet_ms = Config.NETWORK_QUIET_MS if scope == 'document' else 0
+    options = _options(scope, timeout_ms, quiet_ms)
+    started = time.time()
+    try:
+        driver.set_script_timeout(options['timeout'] / 1000 + 5)
+        waited = driver.execute_async_script(SELENIUM_READINESS_SCRIPT, options)
+    except Exception as e:
+        logger.debug(f"{scope.title()} readiness check failed after {time.time() - started:.1f}s: {e}")
+        return None
+    _log(scope, waited)
+    return waited
@@ -0,0 +1,131 @@
+"""
+Pre-warmed single-slide renderer.
+
+Warms the shared browser pool as soon as it is created and renders individual
+slides to PDF pages on demand, so slides can be converted while the rest of
+the deck is still being generated.
+"""
+
+import os
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+from opencanvas.config import Config
+from opencanvas.conversion.browser_pool import get_browser_pool
+from opencanvas.conversion.conversion_cache import asset_fingerprint, get_conversion_cache
+from opencanvas.conversion.readiness import wait_for_page
+from opencanvas.conversion.html_to_pdf import (
+    PRINT_STYLES, PLAYWRIGHT_AVAILABLE, SHOW_SLIDES_SCRIPT, combine_pdfs, temp_slide_path
+)
+
+logger = logging.getLogger(__name__)
+
+class SlideRenderer:
+    """Renders slides to PDF pages on browsers launched ahead of time."""
+
+    def __init__(self, output_dir, zoom_factor: float = Config.DEFAULT_ZOOM, output_name: str = "presentation.pdf"):
+        """
+        Initialize the renderer and start the pooled browsers in the background.
+
+        Args:
+            output_dir: Directory for per-slide documents and PDF pages; relative
+                asset paths in slides are resolved against it
+            zoom_factor: Page size multiplier (same meaning as PresentationConverter)
+            output_name: Name of the combined PDF; per-slide files are named after it
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is required for incremental slide rendering")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.zoom_factor = zoom_factor
+        self.output_name = output_name
+
+        self._cache = get_conversion_cache() if Config.CONVERSION_CACHE_ENABLED else None
+        self._pool = get_browser_pool()
+        self._pool.warm()
+
+    def submit(self, index: int, document_html: str) -> Future:
+        """
+        Queue a single-slide document for rendering.
+
+        Args:
+            index: Zero-based slide index (used for file naming)
+            document_html: Complete HTML document containing the slide
+
+        Returns:
+            Future resolving to the path of the rendered one-page PDF
+        """
+        pdf_path = temp_slide_path(self.output_dir, self.output_name, index)
+        cache_key = None
+        if self._cache:
+            settings = {'target': 'incremental_slide', 'zoom_factor': self.zoom_factor}
+            cache_key = self._cache.slide_key(
+                self._cache.context_key("", asset_fingerprint(document_html, self.output_dir), settings),
+                document_html
+            )
+            if self._cache.restore(cache_key, pdf_path):
+                logger.info(f"♻️ Reusing cached render of slide {index + 1}")
+                future = Future()
+                future.set_result(str(pdf_path))
+                return future
+
+        return self._pool.submit(lambda page: self._render(page, index, document_html, pdf_path, cache_key))
+
+    def _render(self, page, index: int, document_html: str, pdf_path: Path, cache_key: Optional[str]) -> str:
+        html_path = pdf_path.with_name(f".{pdf_path.stem}.html")
+        html_path.write_text(document_html, encoding='utf-8')
+
+        try:
+            page.emulate_media(media='print')
+            page.goto(f"file://{html_path.absolute()}", wait_until='networkidle')
+            page.add_style_tag(content=PRINT_STYLES)
+            page.evaluate(SHOW_SLIDES_SCRIPT)
+            wait_for_page(page)
+            page.pdf(
+                path=str(pdf_path),
+                width=f"{16.0 * self.zoom_factor}in",
+                height=f"{9.0 * self.zoom_factor}in",
+                print_background=True,
+                margin={'top': '0.2in', 'right': '0.2in', 'bottom': '0.2in', 'left': '0.2in'},
+                prefer_css_page_size=False,
+                display_header_footer=False,
+                landscape=False
+            )
+        finally:
+            try:
+                os.remove(html_path)
+            except OSError:
+                pass
+
+        if cache_key:
+            self._cache.put(cache_key, pdf_path)
+        logger.info(f"🖨️ Rendered slide {index + 1}")
+        return str(pdf_path)
+
+    def combine(self, page_paths: List[str], output_path) -> Optional[str]:
+        """
+        Merge rendered pages into one PDF and remove the per-slide files.
+
+        Returns:
+            Path of the combined PDF, or None if the pages could not all be merged
+            (no partial PDF is left at output_path in that case)
+        """
+        merged = combine_pdfs(page_paths, str(output_path))
+        for page_path in page_paths:
+            try:
+                os.remove(page_path)
+            except OSError:
+                pass
+
+        if not merged:
+            logger.warning("⚠️ Could not merge slide pages; PDF will be produced by the regular converter")
+            Path(output_path).unlink(missing_ok=True)
+            return None
+        return str(output_path)
+
+    def close(self):
+        """Release the renderer (the pooled browsers stay warm for later conversions)."""
+        self._pool = None
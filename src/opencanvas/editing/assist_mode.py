@@ -9,10 +9,10 @@ This module implements the two-step assist mode for presentation style editing:
 import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-import anthropic
 
 from opencanvas.editing.prompts import EditingPrompts
 from opencanvas.config import Config
+from opencanvas.llm.clients import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +70,7 @@ class AssistModeStyleEditor:
         if not anthropic_api_key:
             raise ValueError("No Anthropic API key found. Check Config.ANTHROPIC_API_KEY or provide key directly.")
         
-        self.client = anthropic.Anthropic(api_key=anthropic_api_key)
+        self.client = get_anthropic_client(anthropic_api_key)
         self.prompts = EditingPrompts()
         
         logger.info(f"AssistModeStyleEditor initialized with model: {self.prompts.EDITING_MODEL}")
@@ -0,0 +1,209 @@
+"""
+Bulk evaluation of directories of presentations with bounded concurrency.
+
+The runner scans a tree for decks (a presentation.pdf with an optional
+source.pdf next to it, or the organized slides/ + sources/ layout written by
+the pipeline) and evaluates them on a worker pool. All workers share one
+PresentationEvaluator, so provider calls go through the same rate limiter,
+evaluation cache and file store. Like batch generation it runs on
+ResumableBatchRunner: every finished deck is appended to a JSONL results file
+immediately, and running the batch again with the same results file skips
+decks already evaluated successfully, unless their presentation changed.
+"""
+
+import time
+import hashlib
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+from opencanvas.config import Config
+from opencanvas.utils.batch_runner import ResumableBatchRunner
+
+logger = logging.getLogger(__name__)
+
+SCORE_SECTIONS = ('visual_scores', 'content_free_scores', 'content_required_scores')
+
+
+@dataclass
+class EvaluationItem:
+    """One presentation to evaluate"""
+    id: str
+    presentation_pdf: str
+    source_pdf: Optional[str] = None
+    source_content: Optional[str] = None
+
+
+@dataclass
+class EvaluationBatchResult:
+    """Outcome of one deck, written as a line of the results file"""
+    id: str
+    presentation_pdf: str
+    status: str
+    attempts: int
+    presentation_sha256: str = ""
+    source_pdf: Optional[str] = None
+    source_content: Optional[str] = None
+    overall_scores: Dict[str, float] = field(default_factory=dict)
+    evaluation: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    completed_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def file_sha256(path) -> str:
+    """Hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_presentations(root) -> List[EvaluationItem]:
+    """
+    Find every deck under a directory.
+
+    A deck is a folder holding presentation.pdf (flat layout, with an optional
+    source.pdf beside it) or slides/presentation.pdf (organized layout, with an
+    optional sources/source.pdf or sources/source_content.txt). Item ids are
+    the deck folders relative to root.
+
+    Args:
+        root: Directory to scan
+
+    Returns:
+        Items sorted by id
+    """
+    root = Path(root)
+    items = {}
+    for presentation_pdf in sorted(root.rglob("presentation.pdf")):
+        folder = presentation_pdf.parent
+        if folder.name == "slides":
+            deck = folder.parent
+            sources = deck / "sources"
+            source_pdf = sources / "source.pdf"
+            source_content = sources / "source_content.txt"
+        else:
+            deck = folder
+            source_pdf = folder / "source.pdf"
+            source_content = None
+
+        item_id = deck.relative_to(root).as_posix() if deck != root else deck.name
+        items[item_id] = EvaluationItem(
+            id=item_id,
+            presentation_pdf=str(presentation_pdf),
+            source_pdf=str(source_pdf) if source_pdf.exists() else None,
+            source_content=str(source_content) if source_content and source_content.exists() else None
+        )
+    return [items[item_id] for item_id in sorted(items)]
+
+
+def evaluation_errors(evaluation: Dict[str, Any]) -> List[str]:
+    """Errors reported by the provider calls of an evaluation (as a dict of score sections)."""
+    errors = []
+    for section in SCORE_SECTIONS:
+        scores = evaluation.get(section)
+        if isinstance(scores, dict) and 'error' in scores:
+            errors.append(f"{section}: {scores['error']}")
+    return errors
+
+
+class EvaluationBatchRunner(ResumableBatchRunner):
+    """Evaluates many decks with one shared PresentationEvaluator on a worker pool"""
+
+    def __init__(self, evaluator, max_workers: Optional[int] = None, max_retries: Optional[int] = None,
+                 retry_backoff: float = 5.0):
+        """
+        Initialize the runner.
+
+        Args:
+            evaluator: PresentationEvaluator shared by all workers
+            max_workers: Decks evaluated concurrently (defaults to EVALUATION_BATCH_WORKERS)
+            max_retries: Extra attempts for a deck whose evaluation failed (defaults to BATCH_MAX_RETRIES)
+            retry_backoff: Base delay in seconds between attempts (doubles each retry)
+        """
+        super().__init__(
+            max_workers or Config.EVALUATION_BATCH_WORKERS,
+            Config.BATCH_MAX_RETRIES if max_retries is None else max_retries,
+            retry_backoff,
+            thread_name_prefix="evaluate"
+        )
+        self.evaluator = evaluator
+
+    def _evaluate(self, item: EvaluationItem) -> Dict[str, Any]:
+        result = self.evaluator.evaluate_presentation_with_sources(
+            presentation_pdf_path=item.presentation_pdf,
+            source_content_path=item.source_content,
+            source_pdf_path=item.source_pdf
+        )
+        evaluation = asdict(result)
+        errors = evaluation_errors(evaluation)
+        if errors or not evaluation.get('overall_scores'):
+            raise RuntimeError("; ".join(errors) or "Evaluation returned no scores")
+        return evaluation
+
+    def run_item(self, item: EvaluationItem, presentation_sha256: str = "") -> EvaluationBatchResult:
+        """Evaluate one deck, retrying failed provider calls with exponential backoff."""
+        started = time.time()
+        evaluation, attempts, error = self.attempt(item.id, lambda: self._evaluate(item))
+        return EvaluationBatchResult(
+            id=item.id,
+            presentation_pdf=item.presentation_pdf,
+            status='success' if evaluation else 'failed',
+            attempts=attempts,
+            presentation_sha256=presentation_sha256,
+            source_pdf=item.source_pdf,
+            source_content=item.source_content,
+            overall_scores=evaluation['overall_scores'] if evaluation else {},
+            evaluation=evaluation,
+            error=error,
+            duration_seconds=time.time() - started
+        )
+
+    def run(self, items: List[EvaluationItem], results_path=None) -> List[EvaluationBatchResult]:
+        """
+        Evaluate all items.
+
+        Args:
+            items: Decks to evaluate
+            results_path: JSONL results file; decks recorded there as successful
+                (with an unchanged presentation.pdf) are skipped
+
+        Returns:
+            Results for the decks evaluated in this run
+        """
+        hashes = {item.id: file_sha256(item.presentation_pdf) for item in items}
+
+        def log_result(result: EvaluationBatchResult, finished: int, total: int):
+            if result.status == 'success':
+                overall = result.overall_scores.get('presentation_overall', 0)
+                logger.info(f"✅ [{finished}/{total}] {result.id}: {overall:.2f}/5.0")
+            else:
+                logger.info(f"❌ [{finished}/{total}] {result.id}: {result.error}")
+
+        return self.run_items(
+            items,
+            lambda item: self.run_item(item, hashes[item.id]),
+            results_path=results_path,
+            is_done=lambda item, record: record.get('presentation_sha256', '') == hashes[item.id],
+            on_result=log_result,
+            label="presentations"
+        )
+
+
+def average_scores(results: List[EvaluationBatchResult]) -> Dict[str, float]:
+    """Mean of each overall score over the successful results."""
+    totals: Dict[str, List[float]] = {}
+    for result in results:
+        if result.status != 'success':
+            continue
+        for name, value in result.overall_scores.items():
+            if isinstance(value, (int, float)):
+                totals.setdefault(name, []).append(value)
+    return {name: round(sum(values) / len(values), 3) for name, values in totals.items()}
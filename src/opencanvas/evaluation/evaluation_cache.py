@@ -0,0 +1,93 @@
+"""
+Persistent cache of evaluation results.
+
+Used by `opencanvas evaluate` and `opencanvas evaluate-batch` when
+EVALUATION_CACHE_ENABLED is set (it is off by default, and --no-cache skips
+it for a single run). Re-scoring a directory after a partial failure or with
+an unchanged deck is then answered from disk. Each provider call is keyed by
+the provider, the model, a hash of the prompt text and content hashes of the
+presentation and source documents. Error responses are never cached.
+Evolution iterations and the adversarial tester build their evaluators with
+use_cache=False and never read from it.
+
+Nothing else is part of the key: a change in what the provider serves under
+the same model name, or in scoring code outside the prompts, still returns the
+stored scores until their TTL expires (bump CACHE_VERSION for the latter).
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+import logging
+
+from opencanvas.config import Config
+from opencanvas.utils.disk_cache import DiskCache
+from opencanvas.utils.pdf_document import PDFDocument
+
+logger = logging.getLogger(__name__)
+
+# Bump when response parsing changes in a way that invalidates stored results
+CACHE_VERSION = "1"
+
+
+def content_hash(data) -> str:
+    """SHA-256 of a document or text; empty for None."""
+    if data is None:
+        return ""
+    if isinstance(data, PDFDocument):
+        return data.sha256
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+class EvaluationCache:
+    """On-disk cache of parsed evaluation responses."""
+
+    def __init__(self, cache_dir=None, ttl_seconds: Optional[float] = None, max_size_bytes: Optional[int] = None):
+        """
+        Initialize the evaluation cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to <CACHE_DIR>/evaluation)
+            ttl_seconds: Lifetime of an entry (defaults to EVALUATION_CACHE_TTL_HOURS, 0 = never expires)
+            max_size_bytes: Total size budget for LRU eviction
+        """
+        if ttl_seconds is None:
+            ttl_seconds = Config.EVALUATION_CACHE_TTL_HOURS * 3600
+        self.cache = DiskCache(
+            cache_dir or Config.CACHE_DIR / "evaluation",
+            max_size_bytes=max_size_bytes or int(Config.EVALUATION_CACHE_MAX_MB * 1024 * 1024),
+            default_ttl=ttl_seconds or None
+        )
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, presentation_data, source_data=None) -> str:
+        """
+        Build the cache key for one evaluation call.
+
+        Args:
+            provider: 'claude', 'gpt' or 'gemini'
+            model: Evaluation model
+            prompt: Full prompt text sent with the documents
+            presentation_data: Presentation PDF document
+            source_data: Source PDF document, if any
+        """
+        return "|".join([
+            CACHE_VERSION, provider, model, content_hash(prompt),
+            content_hash(presentation_data), content_hash(source_data)
+        ])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached scores, or None on a miss."""
+        record = self.cache.get(key)
+        return record['value'] if record is not None else None
+
+    def put(self, key: str, scores: Dict[str, Any]):
+        """Store scores unless the call failed."""
+        if not isinstance(scores, dict) or "error" in scores:
+            return
+        self.cache.set(key, value=scores)
+
+    def get_stats(self) -> Dict:
+        """Return hit/miss counters."""
+        return self.cache.get_stats()
@@ -2,11 +2,11 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List, Literal
+from typing import Dict, Any, Optional, Tuple, List, Literal, Callable
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import base64
 
-from anthropic import Anthropic
 try:
     from openai import OpenAI
 except ImportError:
@@ -21,7 +21,14 @@ try:
 except ImportError:
     genai = None
     types = None
+from opencanvas.config import Config
+from opencanvas.evaluation.evaluation_cache import EvaluationCache
+from opencanvas.evaluation.file_store import ANTHROPIC_FILES_BETA, create_file_store
 from opencanvas.evaluation.prompts import EvaluationPrompts
+from opencanvas.llm.transport import get_transport
+from opencanvas.llm.rate_limit import estimate_tokens, get_rate_limiter
+from opencanvas.llm.clients import get_anthropic_client
+from opencanvas.utils.pdf_document import PDFDocument, PDFSource
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +46,9 @@ class PresentationEvaluator:
     Supports Claude, GPT, and Gemini models
     """
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash", provider: Literal["claude", "gpt", "gemini"] = "gemini"):
+    def __init__(self, api_key: str, model: str = "gemini-2.5-flash", provider: Literal["claude", "gpt", "gemini"] = "gemini",
+                 concurrent: Optional[bool] = None, use_cache: Optional[bool] = None,
+                 upload_files: Optional[bool] = None):
         """
         Initialize the evaluator
         
@@ -47,13 +56,24 @@ class PresentationEvaluator:
             api_key: API key for the chosen provider
             model: Model name to use for evaluation
             provider: Either "claude", "gpt", or "gemini"
+            concurrent: Issue the independent evaluation calls at the same time
+                (defaults to EVALUATION_CONCURRENT)
+            use_cache: Reuse stored results for identical documents, prompts and model
+                (defaults to EVALUATION_CACHE_ENABLED; False bypasses the cache)
+            upload_files: Upload each PDF once through the provider's Files API and reference
+                it by id instead of inlining base64 (defaults to EVALUATION_FILE_UPLOADS)
         """
         self.provider = provider
         self.model = model
+        self.concurrent = Config.EVALUATION_CONCURRENT if concurrent is None else concurrent
+        if use_cache is None:
+            use_cache = Config.EVALUATION_CACHE_ENABLED
+        self.cache = EvaluationCache() if use_cache else None
         self.prompts = EvaluationPrompts()
         
         if provider == "claude":
-            self.client = Anthropic(api_key=api_key)
+            self.client = get_anthropic_client(api_key)
+            self.transport = get_transport(self.client)
         elif provider == "gpt":
             self.client = OpenAI(api_key=api_key)
         elif provider == "gemini":
@@ -70,6 +90,13 @@ class PresentationEvaluator:
             self.client = genai.Client(api_key=api_key)
         else:
             raise ValueError("Provider must be either 'claude', 'gpt', or 'gemini'")
+        
+        if upload_files is None:
+            upload_files = Config.EVALUATION_FILE_UPLOADS
+        # Message batches cannot carry the Files API beta header, so batched Claude calls keep inline PDFs
+        if provider == "claude" and self.transport.name != "direct":
+            upload_files = False
+        self.file_store = create_file_store(provider, self.client, api_key) if upload_files else None
     
     def extract_pdf_as_base64(self, pdf_path: str) -> str:
         """Extract PDF as base64 data for API calls"""
@@ -90,49 +117,88 @@ class PresentationEvaluator:
             logger.error(f"Error reading PDF file: {e}")
             return b""
 
-    def extract_pdf_content(self, pdf_path: str) -> str:
-        """Extract PDF as base64 data for API calls"""
-        return self.extract_pdf_as_base64(pdf_path)
+    def extract_pdf_document(self, pdf_path: str) -> Optional[PDFDocument]:
+        """Load a PDF for API calls (base64 is only produced for providers that need it)"""
+        try:
+            return PDFDocument.from_file(pdf_path)
+        except Exception as e:
+            logger.error(f"Error reading PDF file: {e}")
+            return None
+
+    def extract_pdf_content(self, pdf_path: str) -> Optional[PDFDocument]:
+        """Extract PDF as a document for API calls"""
+        return self.extract_pdf_document(pdf_path)
+    
+    def _documents(self, presentation_pdf_data: PDFSource,
+                   source_pdf_data: Optional[PDFSource]) -> Tuple[PDFDocument, Optional[PDFDocument]]:
+        """Accept documents, raw bytes or base64 text for the presentation and source PDFs (documents stay owned by the caller)"""
+        presentation = PDFDocument.coerce(presentation_pdf_data, name="presentation.pdf")
+        source = PDFDocument.coerce(source_pdf_data, name="source.pdf") if source_pdf_data else None
+        return presentation, source
     
-    def call_claude_api_with_pdfs(self, prompt: str, presentation_pdf_data: str, source_pdf_data: Optional[str] = None) -> Dict[str, Any]:
+    def _close_documents(self, *documents: Optional[PDFDocument]):
+        """Release the memory maps of documents the evaluator loaded from files"""
+        for document in documents:
+            if document is not None:
+                document.close()
+    
+    def _claude_document(self, pdf_data: PDFDocument, filename: str) -> Dict[str, Any]:
+        """Claude document block: an uploaded file reference or the inline base64 PDF"""
+        if self.file_store:
+            return {"type": "document", "source": {"type": "file", "file_id": self.file_store.file_id(pdf_data, filename)}}
+        return {
+            "type": "document",
+            "source": {
+                "type": "base64",
+                "media_type": "application/pdf",
+                "data": pdf_data.base64,
+            },
+        }
+    
+    def _gpt_document(self, pdf_data: PDFDocument, filename: str) -> Dict[str, Any]:
+        """GPT input_file part: an uploaded file reference or the inline base64 PDF"""
+        if self.file_store:
+            return {"type": "input_file", "file_id": self.file_store.file_id(pdf_data, filename)}
+        return {
+            "type": "input_file",
+            "filename": filename,
+            "file_data": f"data:application/pdf;base64,{pdf_data.base64}",
+        }
+    
+    def _gemini_document(self, pdf_data: PDFDocument, filename: str):
+        """Gemini Part: an uploaded file URI or the decoded PDF bytes"""
+        if self.file_store:
+            return types.Part.from_uri(file_uri=self.file_store.file_id(pdf_data, filename), mime_type='application/pdf')
+        return types.Part.from_bytes(data=pdf_data.to_bytes(), mime_type='application/pdf')
+    
+    def call_claude_api_with_pdfs(self, prompt: str, presentation_pdf_data: PDFSource, source_pdf_data: Optional[PDFSource] = None) -> Dict[str, Any]:
         """Make API call to Claude with presentation PDF and optional source PDF"""
+        presentation_pdf_data, source_pdf_data = self._documents(presentation_pdf_data, source_pdf_data)
         try:
             content = [{"type": "text", "text": prompt}]
             
             # Add source PDF if available (for reference-required evaluation)
             if source_pdf_data:
-                content.append({
-                    "type": "document",
-                    "source": {
-                        "type": "base64",
-                        "media_type": "application/pdf",
-                        "data": source_pdf_data,
-                    },
-                })
+                content.append(self._claude_document(source_pdf_data, "source.pdf"))
                 content.append({
                     "type": "text",
                     "text": "Above is the source paper. Below is the presentation to evaluate:"
                 })
             
             # Add presentation PDF
-            content.append({
-                "type": "document",
-                "source": {
-                    "type": "base64",
-                    "media_type": "application/pdf",
-                    "data": presentation_pdf_data,
-                },
-            })
+            content.append(self._claude_document(presentation_pdf_data, "presentation.pdf"))
             content.append({
                 "type": "text",
                 "text": "This is the presentation to evaluate. Please assess it according to the evaluation criteria."
             })
             
-            message = self.client.messages.create(
+            extra = {"extra_headers": {"anthropic-beta": ANTHROPIC_FILES_BETA}} if self.file_store else {}
+            message = self.transport.create(
                 model=self.model,
                 max_tokens=8000,
                 temperature=0.1,
-                messages=[{"role": "user", "content": content}]
+                messages=[{"role": "user", "content": content}],
+                **extra
             )
             
             response_text = message.content[0].text
@@ -152,8 +218,9 @@ class PresentationEvaluator:
             logger.error(f"Claude API call failed: {e}")
             return {"error": str(e)}
     
-    def call_gpt_api_with_pdfs(self, prompt: str, presentation_pdf_data: str, source_pdf_data: Optional[str] = None) -> Dict[str, Any]:
+    def call_gpt_api_with_pdfs(self, prompt: str, presentation_pdf_data: PDFSource, source_pdf_data: Optional[PDFSource] = None) -> Dict[str, Any]:
         """Make API call to GPT with presentation PDF and optional source PDF"""
+        presentation_pdf_data, source_pdf_data = self._documents(presentation_pdf_data, source_pdf_data)
         try:
             # Build the content array for the GPT API
             content = [
@@ -165,37 +232,33 @@ class PresentationEvaluator:
             
             # Add source PDF if available (for reference-required evaluation)
             if source_pdf_data:
-                content.append({
-                    "type": "input_file",
-                    "filename": "source.pdf",
-                    "file_data": f"data:application/pdf;base64,{source_pdf_data}",
-                })
+                content.append(self._gpt_document(source_pdf_data, "source.pdf"))
                 content.append({
                     "type": "input_text",
                     "text": "Above is the source document. Below is the presentation to evaluate:"
                 })
             
             # Add presentation PDF
-            content.append({
-                "type": "input_file",
-                "filename": "presentation.pdf",
-                "file_data": f"data:application/pdf;base64,{presentation_pdf_data}",
-            })
+            content.append(self._gpt_document(presentation_pdf_data, "presentation.pdf"))
             content.append({
                 "type": "input_text",
                 "text": "This is the presentation to evaluate. Please assess it according to the evaluation criteria and return your response as valid JSON."
             })
             
             # Use the correct OpenAI responses API
-            response = self.client.responses.create(
-                model=self.model,
-                input=[{
-                    "role": "user",
-                    "content": content
-                }],
-                max_output_tokens=8000,
-                temperature=0.1,
-            )
+            limiter = get_rate_limiter("openai", self.model)
+            attachments = 2 if source_pdf_data else 1
+            with limiter.acquire(estimate_tokens(prompt, attachments=attachments, max_tokens=8000)) as lease:
+                response = self.client.responses.create(
+                    model=self.model,
+                    input=[{
+                        "role": "user",
+                        "content": content
+                    }],
+                    max_output_tokens=8000,
+                    temperature=0.1,
+                )
+                lease.settle(getattr(getattr(response, 'usage', None), 'total_tokens', None))
             
             response_text = response.output_text
             
@@ -222,7 +285,7 @@ class PresentationEvaluator:
             logger.error(f"GPT API call failed: {e}")
             return {"error": str(e)}
 
-    def call_gemini_api_with_pdfs(self, prompt: str, presentation_pdf_data: str, source_pdf_data: Optional[str] = None) -> Dict[str, Any]:
+    def call_gemini_api_with_pdfs(self, prompt: str, presentation_pdf_data: PDFSource, source_pdf_data: Optional[PDFSource] = None) -> Dict[str, Any]:
         """Make API call to Gemini with presentation PDF and optional source PDF"""
         # Check if SDK is available
         if genai is None or types is None:
@@ -230,34 +293,31 @@ class PresentationEvaluator:
                 "error": "google-genai SDK not installed. Please run: pip install google-genai"
             }
         
+        presentation_pdf_data, source_pdf_data = self._documents(presentation_pdf_data, source_pdf_data)
         try:
             # Build the content array for Gemini - all items must be Part objects
             content_parts = []
             
             # Add source PDF if available (for reference-required evaluation)
             if source_pdf_data:
-                source_pdf_bytes = base64.b64decode(source_pdf_data)
-                content_parts.append(types.Part.from_bytes(
-                    data=source_pdf_bytes,
-                    mime_type='application/pdf'
-                ))
+                content_parts.append(self._gemini_document(source_pdf_data, "source.pdf"))
                 content_parts.append(types.Part.from_text(text="Above is the source document. Below is the presentation to evaluate:"))
             
             # Add presentation PDF
-            presentation_pdf_bytes = base64.b64decode(presentation_pdf_data)
-            content_parts.append(types.Part.from_bytes(
-                data=presentation_pdf_bytes,
-                mime_type='application/pdf'
-            ))
+            content_parts.append(self._gemini_document(presentation_pdf_data, "presentation.pdf"))
             
             # Add the evaluation prompt as a text part
             content_parts.append(types.Part.from_text(text=f"{prompt}\n\nThis is the presentation to evaluate. Please assess it according to the evaluation criteria and return your response as valid JSON."))
             
             # Make the API call with properly formatted content
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=[types.Content(parts=content_parts)]
-            )
+            limiter = get_rate_limiter("gemini", self.model)
+            attachments = 2 if source_pdf_data else 1
+            with limiter.acquire(estimate_tokens(prompt, attachments=attachments)) as lease:
+                response = self.client.models.generate_content(
+                    model=self.model,
+                    contents=[types.Content(parts=content_parts)]
+                )
+                lease.settle(getattr(getattr(response, 'usage_metadata', None), 'total_token_count', None))
             
             response_text = response.text
             logger.debug(f"Gemini response length: {len(response_text)} chars")
@@ -289,18 +349,35 @@ class PresentationEvaluator:
             logger.error(f"Model: {self.model}, Content parts: {len(content_parts) if 'content_parts' in locals() else 'unknown'}")
             return {"error": str(e)}
     
-    def call_api_with_pdfs(self, prompt: str, presentation_pdf_data: str, source_pdf_data: Optional[str] = None) -> Dict[str, Any]:
-        """Make API call using the appropriate provider"""
+    def call_api_with_pdfs(self, prompt: str, presentation_pdf_data: PDFSource, source_pdf_data: Optional[PDFSource] = None) -> Dict[str, Any]:
+        """Make API call using the appropriate provider (answered from the cache when possible)"""
+        presentation_pdf_data, source_pdf_data = self._documents(presentation_pdf_data, source_pdf_data)
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(self.provider, self.model, prompt, presentation_pdf_data, source_pdf_data)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("♻️ Reusing cached evaluation result")
+                return cached
+        
         if self.provider == "claude":
-            return self.call_claude_api_with_pdfs(prompt, presentation_pdf_data, source_pdf_data)
+            result = self.call_claude_api_with_pdfs(prompt, presentation_pdf_data, source_pdf_data)
         elif self.provider == "gpt":
-            return self.call_gpt_api_with_pdfs(prompt, presentation_pdf_data, source_pdf_data)
+            result = self.call_gpt_api_with_pdfs(prompt, presentation_pdf_data, source_pdf_data)
         elif self.provider == "gemini":
-            return self.call_gemini_api_with_pdfs(prompt, presentation_pdf_data, source_pdf_data)
+            result = self.call_gemini_api_with_pdfs(prompt, presentation_pdf_data, source_pdf_data)
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
+        
+        if self.file_store and "error" in result:
+            # Upload again next time only if the provider says the file is gone
+            self.file_store.forget_missing(str(result["error"]), presentation_pdf_data, source_pdf_data)
+        
+        if cache_key:
+            self.cache.put(cache_key, result)
+        return result
     
-    def evaluate_visual(self, presentation_pdf_data: str) -> Dict[str, Any]:
+    def evaluate_visual(self, presentation_pdf_data: PDFSource) -> Dict[str, Any]:
         """Evaluate visual dimensions using presentation PDF"""
         logger.info("Evaluating visual dimensions...")
         return self.call_api_with_pdfs(self.prompts.visual, presentation_pdf_data)
@@ -334,7 +411,7 @@ class PresentationEvaluator:
     def _evaluate_with_claude_custom(self, html_content: str, prompt: str) -> Dict[str, Any]:
         """Evaluate using Claude with custom prompt"""
         try:
-            response = self.client.messages.create(
+            response = self.transport.create(
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.3,
@@ -353,27 +430,29 @@ class PresentationEvaluator:
     def _evaluate_with_gpt_custom(self, html_content: str, prompt: str) -> Dict[str, Any]:
         """Evaluate using GPT with custom prompt"""
         try:
-            if OpenAI:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    temperature=0.3,
-                    messages=[
-                        {"role": "system", "content": prompt},
-                        {"role": "user", "content": f"Please evaluate this presentation:\n\n{html_content}"}
-                    ]
-                )
-                result_text = response.choices[0].message.content
-            else:
-                # Old OpenAI library
-                response = openai.ChatCompletion.create(
-                    model=self.model,
-                    temperature=0.3,
-                    messages=[
-                        {"role": "system", "content": prompt},
-                        {"role": "user", "content": f"Please evaluate this presentation:\n\n{html_content}"}
-                    ]
-                )
-                result_text = response.choices[0].message["content"]
+            limiter = get_rate_limiter("openai", self.model)
+            with limiter.acquire(estimate_tokens(prompt, html_content)):
+                if OpenAI:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        temperature=0.3,
+                        messages=[
+                            {"role": "system", "content": prompt},
+                            {"role": "user", "content": f"Please evaluate this presentation:\n\n{html_content}"}
+                        ]
+                    )
+                    result_text = response.choices[0].message.content
+                else:
+                    # Old OpenAI library
+                    response = openai.ChatCompletion.create(
+                        model=self.model,
+                        temperature=0.3,
+                        messages=[
+                            {"role": "system", "content": prompt},
+                            {"role": "user", "content": f"Please evaluate this presentation:\n\n{html_content}"}
+                        ]
+                    )
+                    result_text = response.choices[0].message["content"]
                 
             return self.parse_json_response(result_text)
         except Exception as e:
@@ -384,14 +463,17 @@ class PresentationEvaluator:
         """Evaluate using Gemini with custom prompt"""
         try:
             full_prompt = f"{prompt}\n\nPlease evaluate this presentation:\n\n{html_content}"
-            response = self.client.models.generate_content(
-                model=f"models/{self.model}",
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.3,
-                    max_output_tokens=4000
+            limiter = get_rate_limiter("gemini", self.model)
+            with limiter.acquire(estimate_tokens(full_prompt, max_tokens=4000)) as lease:
+                response = self.client.models.generate_content(
+                    model=f"models/{self.model}",
+                    contents=full_prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0.3,
+                        max_output_tokens=4000
+                    )
                 )
-            )
+                lease.settle(getattr(getattr(response, 'usage_metadata', None), 'total_token_count', None))
             
             result_text = response.text
             return self.parse_json_response(result_text)
@@ -399,16 +481,34 @@ class PresentationEvaluator:
             logger.error(f"Gemini custom evaluation error: {e}")
             return {"error": str(e)}
     
-    def evaluate_content_free(self, presentation_pdf_data: str) -> Dict[str, Any]:
+    def evaluate_content_free(self, presentation_pdf_data: PDFSource) -> Dict[str, Any]:
         """Evaluate content dimensions without reference using presentation PDF"""
         logger.info("Evaluating reference-free content dimensions...")
         return self.call_api_with_pdfs(self.prompts.content_free, presentation_pdf_data)
     
-    def evaluate_content_required(self, presentation_pdf_data: str, source_pdf_data: str) -> Dict[str, Any]:
+    def evaluate_content_required(self, presentation_pdf_data: PDFSource, source_pdf_data: PDFSource) -> Dict[str, Any]:
         """Evaluate content dimensions requiring reference comparison using both PDFs"""
         logger.info("Evaluating reference-required content dimensions...")
         return self.call_api_with_pdfs(self.prompts.content_required, presentation_pdf_data, source_pdf_data)
     
+    def _run_evaluations(self, evaluations: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run independent evaluation calls, concurrently if enabled
+        
+        Args:
+            evaluations: Evaluation name -> zero-argument call
+            
+        Returns:
+            Evaluation name -> scores (exceptions propagate as in sequential mode)
+        """
+        if not self.concurrent or len(evaluations) < 2:
+            return {name: evaluate() for name, evaluate in evaluations.items()}
+        
+        logger.info(f"Running {len(evaluations)} evaluations concurrently...")
+        with ThreadPoolExecutor(max_workers=len(evaluations), thread_name_prefix="evaluation") as executor:
+            futures = {name: executor.submit(evaluate) for name, evaluate in evaluations.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
     def evaluate_presentation(self, eval_folder: str) -> EvaluationResult:
         """
         Evaluate a presentation folder containing .html and .pdf files
@@ -441,26 +541,38 @@ class PresentationEvaluator:
         source_pdf_data = self.extract_pdf_content(str(source_pdf)) if source_pdf else None
         
         if not presentation_pdf_data:
+            if source_pdf_data is not None:
+                source_pdf_data.close()
             raise ValueError("Could not read presentation.pdf file")
         
         # Run evaluations using PDFs - no fallback, let errors propagate
         result = EvaluationResult()
         
-        # Visual evaluation (always possible with presentation PDF)
-        result.visual_scores = self.evaluate_visual(presentation_pdf_data)
+        # Visual and reference-free content evaluation (always possible with presentation PDF),
+        # reference-required content evaluation only if source PDF available
+        evaluations = {
+            'visual': lambda: self.evaluate_visual(presentation_pdf_data),
+            'content_free': lambda: self.evaluate_content_free(presentation_pdf_data),
+        }
+        if source_pdf_data:
+            evaluations['content_required'] = lambda: self.evaluate_content_required(presentation_pdf_data, source_pdf_data)
+        try:
+            scores = self._run_evaluations(evaluations)
+        finally:
+            self._close_documents(presentation_pdf_data, source_pdf_data)
+        
+        result.visual_scores = scores['visual']
         if "error" in result.visual_scores:
             logger.error(f"Visual evaluation failed: {result.visual_scores['error']}")
             # Let the error propagate - don't use fallback scores
         
-        # Content evaluation - reference-free (using presentation PDF)
-        result.content_free_scores = self.evaluate_content_free(presentation_pdf_data)
+        result.content_free_scores = scores['content_free']
         if "error" in result.content_free_scores:
             logger.error(f"Content-free evaluation failed: {result.content_free_scores['error']}")
             # Let the error propagate - don't use fallback scores
         
-        # Content evaluation - reference-required (only if source PDF available)
-        if source_pdf_data:
-            result.content_required_scores = self.evaluate_content_required(presentation_pdf_data, source_pdf_data)
+        if 'content_required' in scores:
+            result.content_required_scores = scores['content_required']
             if "error" in result.content_required_scores:
                 logger.error(f"Content-required evaluation failed: {result.content_required_scores['error']}")
                 # Let the error propagate - don't use fallback scores
@@ -565,48 +677,53 @@ class PresentationEvaluator:
         logger.info("Starting presentation evaluation with source content...")
         
         # Extract presentation PDF
-        presentation_pdf_data = self.extract_pdf_as_base64(presentation_pdf_path)
+        presentation_pdf_data = self.extract_pdf_document(presentation_pdf_path)
         if not presentation_pdf_data:
             logger.error("Failed to extract presentation PDF")
             return EvaluationResult()
         
         # Step 1: Visual evaluation (no source needed)
-        visual_scores = self.evaluate_visual(presentation_pdf_data)
-        
         # Step 2: Content-free evaluation (no source needed)
-        content_free_scores = self.evaluate_content_free(presentation_pdf_data)
-        
-        # Step 3: Content-required evaluation (with source)
-        content_required_scores = None
+        evaluations = {
+            'visual': lambda: self.evaluate_visual(presentation_pdf_data),
+            'content_free': lambda: self.evaluate_content_free(presentation_pdf_data),
+        }
         
-        if source_pdf_path:
-            # Use PDF source for reference-required evaluation
-            logger.info(f"Using PDF source for reference evaluation: {source_pdf_path}")
-            source_pdf_data = self.extract_pdf_as_base64(source_pdf_path)
-            if source_pdf_data:
-                content_required_scores = self.evaluate_content_required(
-                    presentation_pdf_data, 
-                    source_pdf_data
+        source_pdf_data = None
+        try:
+            # Step 3: Content-required evaluation (with source)
+            if source_pdf_path:
+                # Use PDF source for reference-required evaluation
+                logger.info(f"Using PDF source for reference evaluation: {source_pdf_path}")
+                source_pdf_data = self.extract_pdf_document(source_pdf_path)
+                if source_pdf_data:
+                    evaluations['content_required'] = lambda: self.evaluate_content_required(
+                        presentation_pdf_data, 
+                        source_pdf_data
+                    )
+                else:
+                    logger.warning("Failed to extract source PDF data")
+            
+            elif source_content_path:
+                # Use text content for reference-required evaluation
+                logger.info(f"Using text source for reference evaluation: {source_content_path}")
+                evaluations['content_required'] = lambda: self.evaluate_content_with_text_source(
+                    presentation_pdf_data,
+                    source_content_path
                 )
+            
             else:
-                logger.warning("Failed to extract source PDF data")
-        
-        elif source_content_path:
-            # Use text content for reference-required evaluation
-            logger.info(f"Using text source for reference evaluation: {source_content_path}")
-            content_required_scores = self.evaluate_content_with_text_source(
-                presentation_pdf_data,
-                source_content_path
-            )
-        
-        else:
-            logger.warning("No source content provided for reference-required evaluation")
+                logger.warning("No source content provided for reference-required evaluation")
+            
+            scores = self._run_evaluations(evaluations)
+        finally:
+            self._close_documents(presentation_pdf_data, source_pdf_data)
         
         # Combine results
         result = EvaluationResult(
-            visual_scores=visual_scores,
-            content_free_scores=content_free_scores,
-            content_required_scores=content_required_scores
+            visual_scores=scores['visual'],
+            content_free_scores=scores['content_free'],
+            content_required_scores=scores.get('content_required')
         )
         
         # Calculate overall scores
@@ -616,14 +733,14 @@ class PresentationEvaluator:
     
     def evaluate_content_with_text_source(
         self, 
-        presentation_pdf_data: str, 
+        presentation_pdf_data: PDFSource, 
         source_content_path: str
     ) -> Dict[str, Any]:
         """
         Evaluate content dimensions using text source content
         
         Args:
-            presentation_pdf_data: Base64 encoded presentation PDF
+            presentation_pdf_data: Presentation PDF (document, bytes or base64 text)
             source_content_path: Path to source text content
             
         Returns:
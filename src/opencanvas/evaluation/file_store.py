@@ -0,0 +1,269 @@
+"""
+Upload-once document handles for evaluation calls.
+
+Every evaluation call used to inline the full base64 presentation PDF (and the
+source PDF for reference-required scoring), so one evaluation sent the same
+megabytes two or three times. A FileStore uploads each document once through
+the provider's Files API and remembers the returned file id by content hash
+(per provider account), so the evaluation calls only reference the id.
+Concurrent calls for the same document wait for a single upload.
+
+Uploads stay in the provider account until deleted, so they are opt-in
+(EVALUATION_FILE_UPLOADS) and each one is reused for EVALUATION_FILE_TTL_HOURS
+only: an expired file is deleted from the provider before the document is
+uploaded again, and cleanup() deletes every expired upload of the account
+(create_file_store runs it whenever a store is created). When the provider
+reports a file as missing, only the index entry is dropped.
+LocalFileStore is an offline stand-in with the same interface for tests.
+"""
+
+import io
+import re
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+from opencanvas.config import Config
+from opencanvas.utils.disk_cache import DiskCache
+from opencanvas.utils.pdf_document import PDFDocument, PDFSource
+
+logger = logging.getLogger(__name__)
+
+# Beta flag required on Messages API requests that reference uploaded files
+ANTHROPIC_FILES_BETA = "files-api-2025-04-14"
+
+# Provider errors meaning a referenced file is gone (unlike rate limits, timeouts or unparsable answers)
+MISSING_FILE_PATTERN = re.compile(r'not[ _-]?found|does not exist|no such file|expired|deleted|\b404\b', re.IGNORECASE)
+
+
+class FileStore(ABC):
+    """Base class: maps document content hashes to provider file ids."""
+
+    provider = "local"
+    # How long an upload is reused before it is deleted (None = EVALUATION_FILE_TTL_HOURS)
+    ttl_seconds: Optional[float] = None
+
+    def __init__(self, account: str = "", cache_dir=None):
+        """
+        Initialize the store.
+
+        Args:
+            account: Identifies the provider account (file ids are not shared between API keys)
+            cache_dir: Index directory (defaults to <CACHE_DIR>/files)
+        """
+        self.account = hashlib.sha256(account.encode('utf-8')).hexdigest()[:16]
+        ttl = self.ttl_seconds
+        if ttl is None:
+            ttl = Config.EVALUATION_FILE_TTL_HOURS * 3600 or None
+        self.index = DiskCache(Path(cache_dir or Config.CACHE_DIR / "files") / self.provider, default_ttl=ttl)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self.uploads = 0
+        self.deletions = 0
+
+    def _index_key(self, digest: str) -> str:
+        return f"{self.account}|{digest}"
+
+    def _lock_for(self, digest: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(digest, threading.Lock())
+
+    def file_id(self, data: PDFSource, filename: str = "document.pdf") -> str:
+        """
+        Return the provider file id of a document, uploading it on first use.
+
+        Args:
+            data: PDF document, raw bytes or base64 text
+            filename: Name shown in the provider's file listing
+
+        Returns:
+            File id (a URI for Gemini)
+        """
+        document = PDFDocument.coerce(data, name=filename)
+        digest = document.sha256
+        key = self._index_key(digest)
+
+        with self._lock_for(digest):
+            record = self.index.get(key, include_expired=True)
+            if record is not None:
+                if not record['expired']:
+                    return record['value']
+                self._discard(key, record['value'])
+
+            pdf_bytes = document.to_bytes()
+            file_id = self._upload(pdf_bytes, filename)
+            self.index.set(key, value=file_id, metadata={'filename': filename, 'size': len(pdf_bytes)})
+            self.uploads += 1
+            logger.info(f"📤 Uploaded {filename} ({len(pdf_bytes) / 1024:.0f} KB) to {self.provider} as {file_id}")
+            return file_id
+
+    def forget(self, data: PDFSource):
+        """
+        Drop a document's file id so it is uploaded again.
+
+        Only the index entry is removed: other in-flight calls may still reference
+        the file, so deleting it at the provider is left to cleanup().
+        """
+        self.index.delete(self._index_key(PDFDocument.coerce(data).sha256))
+
+    def forget_missing(self, error: str, *documents: Optional[PDFSource]) -> int:
+        """
+        Forget the documents whose files an error reports as missing or expired.
+
+        Args:
+            error: Error message returned by an evaluation call
+            documents: Documents referenced by that call (None entries are skipped)
+
+        Returns:
+            Number of documents forgotten (0 for unrelated errors)
+        """
+        if not MISSING_FILE_PATTERN.search(error):
+            return 0
+        forgotten = 0
+        for data in documents:
+            if not data:
+                continue
+            record = self.index.get(self._index_key(PDFDocument.coerce(data).sha256), include_expired=True)
+            if record is not None and (record['value'] in error or 'file' in error.lower()):
+                self.forget(data)
+                forgotten += 1
+        return forgotten
+
+    def cleanup(self, expired_only: bool = True) -> int:
+        """
+        Delete this account's uploads from the provider and the index.
+
+        Args:
+            expired_only: Only delete uploads older than the store's TTL
+
+        Returns:
+            Number of uploads deleted
+        """
+        deleted = 0
+        for record in self.index.records(include_expired=True):
+            key = record.get('key', '')
+            if not key.startswith(f"{self.account}|") or (expired_only and not record['expired']):
+                continue
+            digest = key.split('|', 1)[1]
+            with self._lock_for(digest):
+                self._discard(key, record['value'])
+            deleted += 1
+        if deleted:
+            logger.info(f"🧹 Deleted {deleted} uploaded files from {self.provider}")
+        return deleted
+
+    def _discard(self, key: str, file_id: str):
+        try:
+            self._delete(file_id)
+            self.deletions += 1
+        except Exception as e:
+            logger.warning(f"⚠️ Could not delete {file_id} from {self.provider}: {e}")
+        self.index.delete(key)
+
+    @abstractmethod
+    def _upload(self, pdf_bytes: bytes, filename: str) -> str:
+        """Upload a PDF and return its file id."""
+
+    def _delete(self, file_id: str):
+        """Delete an uploaded file (no-op for providers that expire files themselves)."""
+
+    def get_stats(self) -> Dict:
+        """Return upload, deletion and index hit counters."""
+        return {'uploads': self.uploads, 'deletions': self.deletions,
+                'hits': self.index.hits, 'misses': self.index.misses}
+
+
+class AnthropicFileStore(FileStore):
+    """Anthropic Files API (beta)."""
+
+    provider = "claude"
+
+    def __init__(self, client, account: str = "", cache_dir=None):
+        super().__init__(account, cache_dir)
+        self.client = client
+
+    def _upload(self, pdf_bytes: bytes, filename: str) -> str:
+        return self.client.beta.files.upload(
+            file=(filename, pdf_bytes, "application/pdf"),
+            betas=[ANTHROPIC_FILES_BETA]
+        ).id
+
+    def _delete(self, file_id: str):
+        self.client.beta.files.delete(file_id, betas=[ANTHROPIC_FILES_BETA])
+
+
+class OpenAIFileStore(FileStore):
+    """OpenAI Files API."""
+
+    provider = "gpt"
+
+    def __init__(self, client, account: str = "", cache_dir=None):
+        super().__init__(account, cache_dir)
+        self.client = client
+
+    def _upload(self, pdf_bytes: bytes, filename: str) -> str:
+        return self.client.files.create(file=(filename, pdf_bytes, "application/pdf"), purpose="user_data").id
+
+    def _delete(self, file_id: str):
+        self.client.files.delete(file_id)
+
+
+class GeminiFileStore(FileStore):
+    """Gemini Files API (files are deleted after 48 hours)."""
+
+    provider = "gemini"
+    ttl_seconds = 46 * 3600
+
+    def __init__(self, client, account: str = "", cache_dir=None):
+        super().__init__(account, cache_dir)
+        self.client = client
+
+    def _upload(self, pdf_bytes: bytes, filename: str) -> str:
+        uploaded = self.client.files.upload(
+            file=io.BytesIO(pdf_bytes),
+            config={'mime_type': 'application/pdf', 'display_name': filename}
+        )
+        return uploaded.uri
+
+
+class LocalFileStore(FileStore):
+    """Offline stand-in that keeps "uploaded" documents on local disk."""
+
+    provider = "local"
+
+    def __init__(self, cache_dir=None, account: str = ""):
+        super().__init__(account, cache_dir)
+        self.files_dir = Path(cache_dir or Config.CACHE_DIR / "files") / "local_files"
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+
+    def _upload(self, pdf_bytes: bytes, filename: str) -> str:
+        file_id = f"file-local-{hashlib.sha256(pdf_bytes).hexdigest()[:24]}"
+        (self.files_dir / file_id).write_bytes(pdf_bytes)
+        return file_id
+
+    def _delete(self, file_id: str):
+        (self.files_dir / file_id).unlink(missing_ok=True)
+
+    def read(self, file_id: str) -> bytes:
+        """Return the document stored under file_id."""
+        return (self.files_dir / file_id).read_bytes()
+
+
+def create_file_store(provider: str, client, api_key: str = "") -> FileStore:
+    """
+    Build the file store for an evaluation provider and delete its expired uploads.
+
+    Args:
+        provider: 'claude', 'gpt' or 'gemini'
+        client: The provider SDK client used for evaluation
+        api_key: API key of the client (scopes the file id index)
+    """
+    stores = {'claude': AnthropicFileStore, 'gpt': OpenAIFileStore, 'gemini': GeminiFileStore}
+    if provider not in stores:
+        raise ValueError(f"No file store for provider: {provider}")
+    store = stores[provider](client, account=f"{provider}:{api_key}")
+    store.cleanup()
+    return store
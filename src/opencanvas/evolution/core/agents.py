@@ -6,9 +6,9 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from anthropic import Anthropic
 
 from opencanvas.config import Config
+from opencanvas.llm.clients import get_anthropic_client
 from opencanvas.evolution.config.agent_prompts import AGENT_PROMPTS, AGENT_ACTIONS, AGENT_CONFIG
 from opencanvas.evolution.prompts.evolution_prompts import EvolutionPrompts
 
@@ -41,7 +41,7 @@ class EvolutionAgent:
         if not self.api_key:
             raise ValueError(f"API key required for {self.name}")
         
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = get_anthropic_client(self.api_key)
         self.system_prompt = AGENT_PROMPTS[agent_type]
         self.valid_actions = AGENT_ACTIONS[agent_type]
         self.history = []
@@ -6,6 +6,7 @@ import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from opencanvas.config import Config
@@ -710,75 +711,26 @@ class EvolutionSystem:
         evaluator = PresentationEvaluator(
             api_key=eval_config['api_key'],
             model=eval_config['model'],
-            provider=eval_config['provider']
+            provider=eval_config['provider'],
+            use_cache=False
         )
         
         evaluation_data = []
         errors = []
         
-        for i, presentation in enumerate(presentations, 1):
-            try:
-                logger.info(f"  📊 Evaluating presentation {i}/{len(presentations)}: {presentation['topic'][:50]}...")
-                
-                # Use evaluate_presentation_with_sources WITH source content
-                # This enables reference-required evaluation for content accuracy
-                
-                # Detect if this is PDF-based or topic-based presentation
-                is_pdf_based = presentation['topic'].startswith('PDF:')
-                
-                if is_pdf_based:
-                    # For PDF evolution - use source PDF for reference-required evaluation
-                    eval_result = evaluator.evaluate_presentation_with_sources(
-                        presentation_pdf_path=presentation['pdf_path'],
-                        source_content_path=None,  # No text source for PDF
-                        source_pdf_path=presentation.get('source_pdf_path')  # Use saved source PDF
-                    )
-                else:
-                    # For topic evolution - use source content for reference-required evaluation
-                    eval_result = evaluator.evaluate_presentation_with_sources(
-                        presentation_pdf_path=presentation['pdf_path'],
-                        source_content_path=presentation.get('source_content_path'),  # Use saved source content
-                        source_pdf_path=None  # No PDF source (using text source)
-                    )
-                
-                # Convert dataclass to dict and log the evaluation scores
-                if eval_result:
-                    # Convert EvaluationResult dataclass to dict
-                    from dataclasses import asdict
-                    eval_dict = asdict(eval_result) if hasattr(eval_result, '__dataclass_fields__') else eval_result
-                    
-                    # Check if evaluation contains errors (from API failures)
-                    has_errors = False
-                    for score_type in ['visual_scores', 'content_free_scores', 'content_required_scores']:
-                        if score_type in eval_dict and isinstance(eval_dict[score_type], dict):
-                            if 'error' in eval_dict[score_type]:
-                                logger.error(f"    ❌ {score_type} evaluation failed: {eval_dict[score_type]['error']}")
-                                has_errors = True
-                    
-                    if has_errors:
-                        # Don't add results with errors to evaluation_data
-                        errors.append(f"Evaluation API errors for {presentation['topic']}")
-                        continue
-                    
-                    overall_scores = eval_dict.get('overall_scores', {}) if isinstance(eval_dict, dict) else {}
-                    if overall_scores:
-                        logger.info(f"    ✅ Evaluation scores for '{presentation['topic'][:30]}':")
-                        logger.info(f"      - Visual Design: {overall_scores.get('visual', 0):.2f}/5.0")
-                        logger.info(f"      - Content Quality: {overall_scores.get('content_combined', 0):.2f}/5.0")
-                        logger.info(f"      - Overall Score: {overall_scores.get('presentation_overall', 0):.2f}/5.0")
-                    else:
-                        logger.warning(f"    ⚠️  No overall scores available for '{presentation['topic'][:30]}'")
-                        errors.append(f"No scores returned for {presentation['topic']}")
-                        continue
-                    
-                    # Add source info
-                    eval_dict['source_path'] = presentation['topic']
-                    eval_dict['topic'] = presentation['topic']
-                    evaluation_data.append(eval_dict)
-                
-            except Exception as e:
-                logger.error(f"    ❌ Evaluation failed for {presentation['topic']}: {e}")
-                errors.append(f"Evaluation failed for {presentation['topic']}: {e}")
+        # Presentations are independent: evaluate them concurrently (provider calls stay rate limited)
+        workers = max(1, min(Config.EVALUATION_BATCH_WORKERS, len(presentations)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evaluate") as executor:
+            outcomes = list(executor.map(
+                lambda numbered: self._evaluate_presentation(evaluator, numbered[0], len(presentations), numbered[1]),
+                enumerate(presentations, 1)
+            ))
+        
+        for eval_dict, error in outcomes:
+            if eval_dict is not None:
+                evaluation_data.append(eval_dict)
+            elif error:
+                errors.append(error)
         
         # Check if we have ANY valid evaluation data
         success = len(evaluation_data) > 0
@@ -844,6 +796,72 @@ class EvolutionSystem:
             "average_scores": avg_scores
         }
     
+    def _evaluate_presentation(self, evaluator: PresentationEvaluator, i: int, total: int,
+                               presentation: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        """Evaluate one generated presentation, returning (evaluation dict, None) or (None, error)"""
+        try:
+            logger.info(f"  📊 Evaluating presentation {i}/{total}: {presentation['topic'][:50]}...")
+            
+            # Use evaluate_presentation_with_sources WITH source content
+            # This enables reference-required evaluation for content accuracy
+            
+            # Detect if this is PDF-based or topic-based presentation
+            is_pdf_based = presentation['topic'].startswith('PDF:')
+            
+            if is_pdf_based:
+                # For PDF evolution - use source PDF for reference-required evaluation
+                eval_result = evaluator.evaluate_presentation_with_sources(
+                    presentation_pdf_path=presentation['pdf_path'],
+                    source_content_path=None,  # No text source for PDF
+                    source_pdf_path=presentation.get('source_pdf_path')  # Use saved source PDF
+                )
+            else:
+                # For topic evolution - use source content for reference-required evaluation
+                eval_result = evaluator.evaluate_presentation_with_sources(
+                    presentation_pdf_path=presentation['pdf_path'],
+                    source_content_path=presentation.get('source_content_path'),  # Use saved source content
+                    source_pdf_path=None  # No PDF source (using text source)
+                )
+            
+            # Convert dataclass to dict and log the evaluation scores
+            if eval_result:
+                # Convert EvaluationResult dataclass to dict
+                from dataclasses import asdict
+                eval_dict = asdict(eval_result) if hasattr(eval_result, '__dataclass_fields__') else eval_result
+                
+                # Check if evaluation contains errors (from API failures)
+                has_errors = False
+                for score_type in ['visual_scores', 'content_free_scores', 'content_required_scores']:
+                    if score_type in eval_dict and isinstance(eval_dict[score_type], dict):
+                        if 'error' in eval_dict[score_type]:
+                            logger.error(f"    ❌ {score_type} evaluation failed: {eval_dict[score_type]['error']}")
+                            has_errors = True
+                
+                if has_errors:
+                    # Don't add results with errors to evaluation_data
+                    return None, f"Evaluation API errors for {presentation['topic']}"
+                
+                overall_scores = eval_dict.get('overall_scores', {}) if isinstance(eval_dict, dict) else {}
+                if overall_scores:
+                    logger.info(f"    ✅ Evaluation scores for '{presentation['topic'][:30]}':")
+                    logger.info(f"      - Visual Design: {overall_scores.get('visual', 0):.2f}/5.0")
+                    logger.info(f"      - Content Quality: {overall_scores.get('content_combined', 0):.2f}/5.0")
+                    logger.info(f"      - Overall Score: {overall_scores.get('presentation_overall', 0):.2f}/5.0")
+                else:
+                    logger.warning(f"    ⚠️  No overall scores available for '{presentation['topic'][:30]}'")
+                    return None, f"No scores returned for {presentation['topic']}"
+                
+                # Add source info
+                eval_dict['source_path'] = presentation['topic']
+                eval_dict['topic'] = presentation['topic']
+                return eval_dict, None
+        
+        except Exception as e:
+            logger.error(f"    ❌ Evaluation failed for {presentation['topic']}: {e}")
+            return None, f"Evaluation failed for {presentation['topic']}: {e}"
+        
+        return None, None
+    
     def _calculate_average_scores(self, evaluation_data: List[Dict]) -> Dict[str, float]:
         """Calculate average scores across all evaluations"""
         score_sums = {}
@@ -1985,10 +2003,9 @@ class EvolutionSystem:
             )
             
             # Call LLM to evolve the prompt
-            from anthropic import Anthropic
-            from opencanvas.config import Config
+            from opencanvas.llm.clients import get_anthropic_client
             
-            client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+            client = get_anthropic_client()
             
             logger.info("🤖 Requesting evolved prompt from LLM...")
             response = client.messages.create(
@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional, List
 from opencanvas.generators.router import GenerationRouter
 from opencanvas.generators.topic_generator import TopicGenerator
 from opencanvas.generators.pdf_generator import PDFGenerator
+from opencanvas.generators.streaming import HTMLStreamSink
 from opencanvas.evolution.core.prompts import PromptManager
 
 logger = logging.getLogger(__name__)
@@ -278,7 +279,7 @@ class EvolvedTopicGenerator(TopicGenerator):
         
         return blog_content
     
-    def generate_slides_html(self, blog_content, purpose, theme):
+    def generate_slides_html(self, blog_content, purpose, theme, stream_to=None, on_slide=None):
         """Generate HTML slide deck using evolved prompt - tools applied via pipeline"""
         
         # Tools are now applied through the pipeline in generate_from_topic
@@ -288,11 +289,11 @@ class EvolvedTopicGenerator(TopicGenerator):
             logger.info(f"🧬 Using EVOLVED slide generation prompt ({len(self.evolved_prompt)} chars)")
             # Since we set self.generation_prompt = evolved_prompt in __init__, 
             # just call parent method which will use the evolved prompt
-            return super().generate_slides_html(blog_content, purpose, theme)
+            return super().generate_slides_html(blog_content, purpose, theme, stream_to=stream_to, on_slide=on_slide)
         else:
             logger.info(f"📦 Using BASELINE slide generation prompt")
             # Fall back to parent's implementation with baseline prompt
-            return super().generate_slides_html(blog_content, purpose, theme)
+            return super().generate_slides_html(blog_content, purpose, theme, stream_to=stream_to, on_slide=on_slide)
 
 
 class EvolvedPDFGenerator(PDFGenerator):
@@ -310,7 +311,7 @@ class EvolvedPDFGenerator(PDFGenerator):
         else:
             logger.error(f"❌ EvolvedPDFGenerator initialized without evolved prompt!")
     
-    def generate_slides_html(self, pdf_data, presentation_focus, theme="professional", extract_images=False, output_dir=None):
+    def generate_slides_html(self, pdf_data, presentation_focus, theme="professional", extract_images=False, output_dir=None, stream_to=None, on_slide=None):
         """Generate HTML slides directly from PDF content using evolved prompt."""
         
         self.presentation_focus = presentation_focus
@@ -377,11 +378,10 @@ class EvolvedPDFGenerator(PDFGenerator):
             logger.info("📡 Using streaming for long-running operation...")
             
             # Use streaming for long operations (copied from parent)
-            stream = self.client.messages.create(
+            stream = self.transport.stream(
                 model="claude-3-7-sonnet-20250219",
                 max_tokens=50000,
                 temperature=0.7,
-                stream=True,
                 messages=[
                     {
                         "role": "user",
@@ -403,14 +403,9 @@ class EvolvedPDFGenerator(PDFGenerator):
                 ],
             )
             
-            # Collect the streamed response (copied from parent)
-            html_content = ""
-            for chunk in stream:
-                if chunk.type == "content_block_delta":
-                    html_content += chunk.delta.text
-                    # Log progress every 1000 characters
-                    if len(html_content) % 1000 == 0:
-                        logger.info(f"📝 Generated {len(html_content)} characters...")
+            # Collect the streamed response
+            with HTMLStreamSink(output_file=stream_to, on_slide=on_slide, clean=self.clean_html_content) as sink:
+                html_content = sink.consume(stream)
             
             logger.info(f"✅ Completed evolved PDF generation: {len(html_content)} characters")
             return self.clean_html_content(html_content), None
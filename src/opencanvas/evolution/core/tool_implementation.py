@@ -12,8 +12,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from anthropic import Anthropic
 from opencanvas.config import Config
+from opencanvas.llm.clients import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +36,7 @@ class AutomaticToolImplementation:
         """
         self.require_human_review = require_human_review
         self.output_dir = Path(output_dir) if output_dir else Path("evolution_output")
-        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = get_anthropic_client()
         self.sandbox_dir = Path("tool_sandbox")
         self.sandbox_dir.mkdir(exist_ok=True)
         self.implemented_tools = []
@@ -325,9 +325,9 @@ svg text {
         """Call Claude API for generation"""
         
         try:
-            from anthropic import Anthropic
+            from opencanvas.llm.clients import get_anthropic_client
             
-            client = Anthropic(api_key=self.api_key)
+            client = get_anthropic_client(self.api_key)
             
             message = client.messages.create(
                 model="claude-sonnet-4-20250514",
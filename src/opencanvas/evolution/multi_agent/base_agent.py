@@ -6,8 +6,8 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
-from anthropic import Anthropic
 from opencanvas.config import Config
+from opencanvas.llm.clients import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ class BaseEvolutionAgent(ABC):
         self.model = model
         
         if self.api_key:
-            self.claude = Anthropic(api_key=self.api_key)
+            self.claude = get_anthropic_client(self.api_key)
         else:
             self.claude = None
             logger.warning(f"{self.name} agent: No API key provided")
@@ -292,7 +292,8 @@ class MultiAgentEvolutionManager:
         evaluator = PresentationEvaluator(
             api_key=eval_config['api_key'],
             model=eval_config['model'],
-            provider=eval_config['provider']
+            provider=eval_config['provider'],
+            use_cache=False
         )
         
         for i, pres_data in enumerate(presentation_data):
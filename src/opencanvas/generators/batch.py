@@ -0,0 +1,196 @@
+"""
+Batch generation of many presentations with bounded concurrency.
+
+Inputs come from a JSONL manifest (one item per line); every finished item is
+appended to a results manifest immediately by ResumableBatchRunner, so an
+interrupted batch can be resumed by running it again with the same results
+file. All items share the
+generators (and therefore the API clients) of one GenerationRouter, so
+generator state touched by several workers must be thread-safe: the image
+validation cache gives each worker thread its own DuckDB cursor and
+serializes writes, and lazily created extractors are built under a lock.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+from opencanvas.config import Config
+from opencanvas.utils.batch_runner import ResumableBatchRunner
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItem:
+    """One presentation to generate"""
+    input: str
+    id: str = ""
+    purpose: str = Config.DEFAULT_PURPOSE
+    theme: str = Config.DEFAULT_THEME
+    output_dir: Optional[str] = None
+    extract_images: bool = False
+
+    def __post_init__(self):
+        if not self.id:
+            digest = hashlib.sha256(f"{self.input}|{self.purpose}|{self.theme}".encode('utf-8')).hexdigest()
+            self.id = digest[:12]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch item, written as a line of the results manifest"""
+    id: str
+    input: str
+    status: str
+    attempts: int
+    html_file: Optional[str] = None
+    pdf_file: Optional[str] = None
+    topic_slug: Optional[str] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    completed_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def load_manifest(manifest_path) -> List[BatchItem]:
+    """
+    Load batch items from a JSONL manifest.
+
+    Each line is a JSON object with at least "input" (topic text or PDF path/URL)
+    and optionally "id", "purpose", "theme", "output_dir" and "extract_images".
+    Blank lines and lines starting with '#' are ignored.
+    """
+    items = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{manifest_path}:{line_number}: invalid JSON ({e})")
+            if not data.get('input'):
+                raise ValueError(f"{manifest_path}:{line_number}: missing 'input'")
+            known = {key: data[key] for key in BatchItem.__dataclass_fields__ if key in data}
+            items.append(BatchItem(**known))
+
+    ids = [item.id for item in items]
+    duplicates = {item_id for item_id in ids if ids.count(item_id) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate item ids in manifest: {', '.join(sorted(duplicates))}")
+    return items
+
+
+class BatchRunner(ResumableBatchRunner):
+    """Runs batch items through a GenerationRouter on a worker pool"""
+
+    def __init__(self, router, max_workers: int = 4, max_retries: int = 2,
+                 provider_limits: Optional[Dict[str, int]] = None, retry_backoff: float = 5.0):
+        """
+        Initialize the runner.
+
+        Args:
+            router: GenerationRouter whose generators are shared by all items
+            max_workers: Number of items generated concurrently
+            max_retries: Extra attempts for an item that failed
+            provider_limits: Maximum concurrent items per provider, e.g. {"anthropic": 4, "brave": 2}
+            retry_backoff: Base delay in seconds between attempts (doubles each retry)
+        """
+        super().__init__(max_workers, max_retries, retry_backoff, thread_name_prefix="batch")
+        self.router = router
+        self._provider_slots = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in (provider_limits or {}).items()
+        }
+
+    def _providers_for(self, item: BatchItem) -> List[str]:
+        """Providers an item talks to (topic research also uses Brave Search)."""
+        providers = ['anthropic']
+        if self.router.detect_input_type(item.input) == 'topic':
+            providers.append('brave')
+        return sorted(provider for provider in providers if provider in self._provider_slots)
+
+    def _generate(self, item: BatchItem, output_dir: Path) -> Dict:
+        # Acquire provider slots in a fixed order so items never deadlock
+        providers = self._providers_for(item)
+        for provider in providers:
+            self._provider_slots[provider].acquire()
+        try:
+            return self.router.generate(
+                input_source=item.input,
+                purpose=item.purpose,
+                theme=item.theme,
+                output_dir=str(output_dir),
+                extract_images=item.extract_images,
+                open_browser=False  # Unattended: never open a browser tab per item
+            )
+        finally:
+            for provider in reversed(providers):
+                self._provider_slots[provider].release()
+
+    def run_item(self, item: BatchItem, output_dir) -> BatchResult:
+        """Generate one item, retrying failures with exponential backoff."""
+        item_output = Path(item.output_dir) if item.output_dir else Path(output_dir) / item.id
+        started = time.time()
+
+        def generate():
+            result = self._generate(item, item_output)
+            if not result:
+                raise RuntimeError("Generator returned no result")
+            return result
+
+        result, attempts, error = self.attempt(item.id, generate)
+        if result:
+            return BatchResult(
+                id=item.id,
+                input=item.input,
+                status='success',
+                attempts=attempts,
+                html_file=result.get('html_file'),
+                pdf_file=result.get('pdf_file'),
+                topic_slug=result.get('topic_slug'),
+                duration_seconds=time.time() - started
+            )
+        return BatchResult(
+            id=item.id,
+            input=item.input,
+            status='failed',
+            attempts=attempts,
+            error=error,
+            duration_seconds=time.time() - started
+        )
+
+    def run(self, items: List[BatchItem], output_dir=str(Config.OUTPUT_DIR), results_path=None) -> List[BatchResult]:
+        """
+        Generate all items.
+
+        Args:
+            items: Items to generate
+            output_dir: Base directory; each item gets its own <output_dir>/<id> folder
+            results_path: JSONL results manifest; items already recorded as
+                successful there are skipped
+
+        Returns:
+            Results for the items processed in this run
+        """
+        def log_result(result: BatchResult, finished: int, total: int):
+            status = "✅" if result.status == 'success' else "❌"
+            logger.info(f"{status} [{finished}/{total}] {result.id}: {result.input[:60]}")
+
+        return self.run_items(
+            items,
+            lambda item: self.run_item(item, output_dir),
+            results_path=results_path,
+            on_result=log_result,
+            label="presentations"
+        )
@@ -0,0 +1,268 @@
+"""
+Slide-by-slide post-processing that overlaps with generation.
+
+IncrementalSlidePipeline is passed as the on_slide callback of
+HTMLStreamSink: every slide is handed to the image validation pipeline as
+soon as its closing tag has been streamed, and the validated slide is then
+rendered to a PDF page by a pre-warmed SlideRenderer. When generation ends,
+finish() merges the validated slides back into the deck and combines the
+pages, so only the tail of the work remains after the last token.
+
+A slide rendered while the deck is still streaming cannot include whatever
+follows the last slide, because that part has not been generated yet. When
+that tail turns out to run scripts (slide navigation, chart initialization),
+finish() renders the affected slides again on the warm pages with the tail
+appended so the scripts run, instead of discarding them and converting the
+whole deck again. Slides that are validated after the tail is known are
+rendered with it directly.
+"""
+
+import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+from opencanvas.generators.streaming import partial_path
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_TAG_PATTERN = re.compile(r'<script\b', re.IGNORECASE)
+
+REPORT_COUNTERS = (
+    'total_images_checked', 'failed_images_found', 'successful_replacements',
+    'claude_calls_made', 'cache_hits', 'slides_with_changes'
+)
+
+
+class IncrementalSlidePipeline:
+    """Validates and renders slides while the rest of the deck is still streaming."""
+
+    def __init__(self, image_validator=None, renderer=None, stream_file=None, max_workers: int = 4):
+        """
+        Initialize the pipeline.
+
+        Args:
+            image_validator: ImageValidationPipeline applied to each slide (optional)
+            renderer: SlideRenderer producing one PDF page per slide (optional)
+            stream_file: Output file of the sink streaming the deck; the document
+                head is read from its .partial file (or from the file itself once
+                the stream has finished) so slides can be rendered standalone
+            max_workers: Number of slides validated concurrently
+        """
+        self.image_validator = image_validator
+        self.renderer = renderer
+        self.stream_file = Path(stream_file) if stream_file else None
+
+        self.started_at = time.time()
+        self.first_slide_at: Optional[float] = None
+        self.first_processed_at: Optional[float] = None
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="slide-validation")
+        self._lock = threading.Lock()
+        self._slides: Dict[int, str] = {}
+        self._validations = {}
+        self._renders = {}
+        self._validated: Dict[int, str] = {}
+        self._stale_renders = set()
+        self._document_prefix: Optional[str] = None
+        self._document_tail: Optional[str] = None
+
+    def on_slide(self, index: int, slide_html: str):
+        """HTMLStreamSink callback: schedule work for a freshly completed slide."""
+        with self._lock:
+            if self.first_slide_at is None:
+                self.first_slide_at = time.time()
+            self._slides[index] = slide_html
+            future = self._executor.submit(self._validate_slide, index, slide_html)
+            self._validations[index] = future
+
+        if self.renderer and self.stream_file:
+            future.add_done_callback(lambda done, index=index: self._schedule_render(index, done))
+        else:
+            future.add_done_callback(self._mark_processed)
+
+    def _validate_slide(self, index: int, slide_html: str) -> Tuple[str, Dict]:
+        if not self.image_validator:
+            return slide_html, {}
+        slides, report = self.image_validator.validate_and_fix_slides(
+            [{'html': slide_html, 'id': f'slide_{index + 1}'}]
+        )
+        validated = slides[0]['html'] if slides and slides[0].get('html') else slide_html
+        return validated, report
+
+    def _schedule_render(self, index: int, validation_future):
+        try:
+            validated_html, _ = validation_future.result()
+        except Exception:
+            validated_html = self._slides[index]
+
+        prefix = self._get_document_prefix()
+        if prefix is None:
+            return
+
+        with self._lock:
+            self._validated[index] = validated_html
+            render_future = self._submit_render(index, prefix)
+        render_future.add_done_callback(self._mark_processed)
+
+    def _submit_render(self, index: int, prefix: str):
+        """Render a validated slide with the deck's tail if it is known (caller holds the lock)."""
+        tail = self._document_tail
+        if tail is None:
+            # Speculative render; redone in finish() if the tail turns out to run scripts
+            self._stale_renders.add(index)
+            tail = "\n</body>\n</html>"
+        else:
+            self._stale_renders.discard(index)
+
+        render_future = self.renderer.submit(index, prefix + self._validated[index] + tail)
+        self._renders[index] = render_future
+        return render_future
+
+    def _mark_processed(self, _future):
+        with self._lock:
+            if self.first_processed_at is None:
+                self.first_processed_at = time.time()
+                logger.info(f"⚡ First slide post-processed after {self.first_processed_at - self.started_at:.1f}s")
+
+    def _get_document_prefix(self) -> Optional[str]:
+        """Return everything the deck streamed before its first slide (head, styles, wrappers)."""
+        with self._lock:
+            if self._document_prefix is None:
+                try:
+                    try:
+                        streamed = partial_path(self.stream_file).read_text(encoding='utf-8')
+                    except FileNotFoundError:
+                        streamed = self.stream_file.read_text(encoding='utf-8')
+                except OSError as e:
+                    logger.warning(f"⚠️ Cannot read streamed deck for incremental rendering: {e}")
+                    return None
+                position = streamed.find(self._slides[0])
+                if position == -1:
+                    return None
+                prefix = streamed[:position]
+                # Drop a leading ```html fence the model may have wrapped the deck in
+                if prefix.lstrip().startswith("```"):
+                    prefix = prefix.lstrip().split("\n", 1)[-1]
+                self._document_prefix = prefix
+            return self._document_prefix
+
+    def finish(self, html_content: str, pdf_path=None) -> Tuple[str, Dict]:
+        """
+        Wait for outstanding slide work and assemble the results.
+
+        Args:
+            html_content: Final (cleaned) deck HTML
+            pdf_path: Where to write the combined PDF if every slide was rendered
+
+        Returns:
+            Tuple of (html_content with validated slides, report). The report has
+            the same counters as ImageValidationPipeline.validate_and_fix_slides
+            plus timing fields and 'pdf_file' when a PDF was assembled.
+        """
+        report = {counter: 0 for counter in REPORT_COUNTERS}
+        report.update({'total_slides': len(self._slides), 'processed_slides': 0, 'errors': []})
+
+        # Locate the tail before validated slides are merged back (they no longer match self._slides)
+        tail = self._find_document_tail(html_content)
+        has_trailing_scripts = tail is not None and bool(SCRIPT_TAG_PATTERN.search(tail))
+        if has_trailing_scripts:
+            with self._lock:
+                self._document_tail = tail
+
+        for index in sorted(self._validations):
+            original = self._slides[index]
+            try:
+                validated, slide_report = self._validations[index].result()
+            except Exception as e:
+                logger.warning(f"⚠️ Validation failed for slide {index + 1}: {e}")
+                report['errors'].append(f"Slide {index + 1}: {e}")
+                continue
+
+            report['processed_slides'] += 1
+            for counter in REPORT_COUNTERS:
+                report[counter] += slide_report.get(counter, 0)
+            if validated != original:
+                html_content = html_content.replace(original, validated, 1)
+
+        # Joining the validation workers also guarantees every render has been scheduled
+        self._executor.shutdown(wait=True)
+
+        if self.renderer:
+            if has_trailing_scripts:
+                self._rerender_with_tail()
+
+            page_paths = []
+            for index in sorted(self._slides):
+                future = self._renders.get(index)
+                try:
+                    page_paths.append(future.result() if future else None)
+                except Exception as e:
+                    logger.warning(f"⚠️ Rendering failed for slide {index + 1}: {e}")
+                    page_paths.append(None)
+
+            rendered = [path for path in page_paths if path]
+            if tail is None:
+                logger.info("📜 Cannot locate the end of the deck; PDF will be produced by the regular converter")
+                for path in rendered:
+                    Path(path).unlink(missing_ok=True)
+            elif pdf_path and page_paths and len(rendered) == len(page_paths):
+                combined = self.renderer.combine(rendered, pdf_path)
+                if combined:
+                    report['pdf_file'] = combined
+            else:
+                logger.warning("⚠️ Not every slide was rendered; PDF will be produced by the regular converter")
+                for path in rendered:
+                    Path(path).unlink(missing_ok=True)
+
+        self.close()
+
+        finished_at = time.time()
+        report['time_to_first_slide'] = (self.first_slide_at - self.started_at) if self.first_slide_at else None
+        report['time_to_first_processed_slide'] = (self.first_processed_at - self.started_at) if self.first_processed_at else None
+        report['total_time'] = finished_at - self.started_at
+        logger.info(f"✅ Incremental pipeline finished: {report['processed_slides']} slides, "
+                    f"{report['successful_replacements']} images replaced in {report['total_time']:.1f}s")
+        return html_content, report
+
+    def _find_document_tail(self, html_content: str) -> Optional[str]:
+        """Return what follows the last streamed slide in the deck (closing wrappers, scripts)."""
+        if not self._slides:
+            return ""
+        last_slide = self._slides[max(self._slides)]
+        position = html_content.rfind(last_slide)
+        if position == -1:
+            return None
+        tail = html_content[position + len(last_slide):]
+        # Drop a trailing ``` fence the model may have wrapped the deck in
+        if tail.rstrip().endswith("```"):
+            tail = tail.rstrip()[:-3]
+        return tail
+
+    def _rerender_with_tail(self):
+        """Render the slides that were rendered before the tail was known again, with the tail."""
+        with self._lock:
+            stale = sorted(self._stale_renders)
+        if not stale:
+            return
+
+        logger.info(f"📜 Deck runs scripts after its slides; re-rendering {len(stale)} slides with them")
+        prefix = self._get_document_prefix()
+        for index in stale:
+            # The earlier render writes the same page file, so let it finish first
+            try:
+                self._renders[index].result()
+            except Exception:
+                pass
+            with self._lock:
+                self._submit_render(index, prefix)
+
+    def close(self):
+        """Release worker threads and the renderer."""
+        self._executor.shutdown(wait=True)
+        if self.renderer:
+            self.renderer.close()
+            self.renderer = None
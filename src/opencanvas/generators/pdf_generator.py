@@ -2,227 +2,30 @@ import os
 import json
 import webbrowser
 import requests
-import base64
 from pathlib import Path
-from anthropic import Anthropic
 from datetime import datetime
 from urllib.parse import urlparse
 import mimetypes
 import logging
 import tempfile
+import threading
 
 from opencanvas.generators.base import BaseGenerator
+from opencanvas.generators.streaming import HTMLStreamSink
+from opencanvas.llm.transport import get_transport
+from opencanvas.llm.clients import get_anthropic_client
+from opencanvas.llm.prompt_cache import split_template, cached_system, cache_metrics
 from opencanvas.utils.validation import InputValidator
 from opencanvas.config import Config
 from opencanvas.utils.plot_caption_extractor import PDFPlotCaptionExtractor
 from opencanvas.utils.docling_extractor import DoclingImageExtractor
 from opencanvas.utils.file_utils import create_organized_output_structure
+from opencanvas.utils.pdf_document import PDFDocument
 
 logger = logging.getLogger(__name__)
 
-class PDFGenerator(BaseGenerator):
-    """
-    A class to generate HTML slide presentations from PDF documents using the Anthropic API.
-    """
-    def __init__(self, api_key):
-        """Initialize the PDF slide generator with Anthropic API key"""
-        super().__init__(api_key)
-        self.client = Anthropic(api_key=api_key)
-        self.presentation_focus = None
-        self.plot_extractor = None
-        self.docling_extractor = None
-
-    def validate_pdf_url(self, url):
-        """Validate if the URL points to a PDF file"""
-        return InputValidator.validate_pdf_url(url)
-
-    def validate_pdf_file(self, file_path):
-        """Validate if the file is a PDF"""
-        return InputValidator.validate_pdf_file(file_path)
-
-    def encode_pdf_from_file(self, file_path):
-        """Encode a local PDF file to base64"""
-        try:
-            with open(file_path, "rb") as f:
-                pdf_data = base64.b64encode(f.read()).decode("utf-8")
-            return pdf_data, None
-        except Exception as e:
-            return None, f"Error encoding PDF: {str(e)}"
-
-    def encode_pdf_from_url(self, url):
-        """Download and encode a PDF from URL to base64"""
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            pdf_data = base64.b64encode(response.content).decode("utf-8")
-            return pdf_data, None
-        except Exception as e:
-            return None, f"Error downloading and encoding PDF: {str(e)}"
-
-    def _extract_images_and_captions(self, pdf_data, output_dir):
-        """
-        Extract complete figures and captions from PDF using Docling
-        
-        This replaces the fragmented pdfplumber approach with Docling's semantic
-        figure detection that maintains the integrity of complex diagrams.
-        
-        Args:
-            pdf_data: Base64 encoded PDF data
-            output_dir: Directory to save extracted images
-            
-        Returns:
-            Tuple of (image_captions_dict, extracted_images_dir, plots_list)
-        """
-        try:
-            # Try Docling extraction first (preferred method)
-            if self._try_docling_extraction():
-                logger.info("🔍 Using Docling for complete figure extraction...")
-                
-                # Initialize Docling extractor if not already done
-                if self.docling_extractor is None:
-                    self.docling_extractor = DoclingImageExtractor(dpi_scale=2.0)
-                
-                # Extract using Docling
-                image_captions, extracted_images_dir, plots = self.docling_extractor.extract_from_pdf_data(
-                    pdf_data, output_dir
-                )
-                
-                if image_captions:
-                    logger.info(f"✅ Docling extracted {len(image_captions)} complete figures")
-                    return image_captions, extracted_images_dir, plots
-                else:
-                    logger.info("Docling found no figures, falling back to pdfplumber")
-            
-            # Fallback to original fragmented extraction
-            logger.info("📋 Falling back to pdfplumber fragmented extraction...")
-            return self._extract_with_pdfplumber_fallback(pdf_data, output_dir)
-            
-        except Exception as e:
-            logger.error(f"Error in image extraction: {e}")
-            # Always fallback to original method if there's any error
-            logger.info("🔄 Error occurred, using pdfplumber fallback...")
-            return self._extract_with_pdfplumber_fallback(pdf_data, output_dir)
-    
-    def _try_docling_extraction(self) -> bool:
-        """
-        Check if Docling extraction is available and should be used
-        
-        Returns:
-            True if Docling should be used, False for fallback
-        """
-        try:
-            from opencanvas.utils.docling_extractor import DOCLING_AVAILABLE
-            return DOCLING_AVAILABLE
-        except ImportError:
-            return False
-    
-    def _extract_with_pdfplumber_fallback(self, pdf_data, output_dir):
-        """
-        Fallback extraction using the original pdfplumber method
-        
-        This preserves the original fragmented behavior for compatibility
-        when Docling is not available or fails.
-        """
-        try:
-            # Initialize plot extractor if not already done
-            if self.plot_extractor is None:
-                self.plot_extractor = PDFPlotCaptionExtractor(
-                    api_key=self.api_key, 
-                    provider="claude"
-                )
-            
-            # Create temporary PDF file from base64 data
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
-                pdf_bytes = base64.b64decode(pdf_data)
-                temp_pdf.write(pdf_bytes)
-                temp_pdf_path = temp_pdf.name
-            
-            try:
-                # Extract plots and captions
-                plots = self.plot_extractor.extract_captions_from_pdf(temp_pdf_path)
-                
-                if not plots:
-                    logger.info("No images/plots found in PDF")
-                    return {}, None, []
-                
-                # Create extracted_images directory
-                extracted_images_dir = output_dir / "extracted_images"
-                extracted_images_dir.mkdir(exist_ok=True)
-                
-                # Save images and create caption mapping
-                image_captions = {}
-                for plot in plots:
-                    if plot.image_data:
-                        # Save image with plot_id as filename
-                        image_filename = f"{plot.plot_id}.png"
-                        image_path = extracted_images_dir / image_filename
-                        
-                        with open(image_path, "wb") as f:
-                            f.write(plot.image_data)
-                        
-                        # Create relative path for HTML (go up one level from slides/ to parent directory)
-                        relative_path = f"../extracted_images/{image_filename}"
-                        image_captions[plot.plot_id] = {
-                            'caption': plot.caption or "No caption found",
-                            'path': relative_path,
-                            'dimensions': plot.dimensions or "unknown",
-                            'width': plot.width,
-                            'height': plot.height,
-                            'error': plot.error
-                        }
-                        
-                        logger.info(f"Extracted image: {plot.plot_id} -> {image_path} ({plot.dimensions or 'unknown'})")
-                
-                logger.info(f"pdfplumber extracted {len(image_captions)} image fragments")
-                return image_captions, extracted_images_dir, plots
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_pdf_path):
-                    os.unlink(temp_pdf_path)
-                    
-        except Exception as e:
-            logger.error(f"Error in pdfplumber fallback extraction: {e}")
-            return {}, None, []
-
-    def generate_slides_html(self, pdf_data, presentation_focus, theme="professional", extract_images=True, output_dir=None):
-        """Generate HTML slides directly from PDF content in a single step."""
-        
-        self.presentation_focus = presentation_focus
-        
-        # Extract images and captions if enabled
-        image_captions = {}
-        extracted_images_dir = None
-        if extract_images and output_dir:
-            logger.info("🔍 Extracting images and captions from PDF...")
-            image_captions, extracted_images_dir, plots = self._extract_images_and_captions(pdf_data, output_dir)
-            
-            if image_captions:
-                logger.info(f"📸 Found {len(image_captions)} images with captions")
-            else:
-                logger.info("📸 No images found in PDF")
-        
-        # Build image context for prompt - integrated format
-        image_context = ""
-        if image_captions:
-            image_context = "\n**Visual Assets:** The following images have been extracted from the PDF with their captions and dimensions:\n"
-            for image_id, info in image_captions.items():
-                dimensions = info.get('dimensions', 'unknown')
-                image_context += f"- {image_id}: {info['caption']} (file: {info['path']}, size: {dimensions})\n"
-            image_context += "\n**Integration Instructions:**\n"
-            image_context += "- Incorporate these images strategically throughout the presentation\n"
-            image_context += "- Use format: `<img src='../extracted_images/image_id.png' alt='caption'>`\n"
-            image_context += "- Consider image dimensions for proper layout and positioning\n"
-            image_context += "- Place images where they enhance understanding and visual impact\n"
-        else:
-            image_context = "\n**Visual Assets:** No images were found in the source PDF."
-        
-        # Updated academic generation prompt
-        academic_gen_prompt = f'''<presentation_task>
+# Academic slide generation prompt; {placeholders} are filled per request via split_template
+ACADEMIC_GENERATION_PROMPT = '''<presentation_task>
 Create a stunning, visually captivating HTML presentation that makes viewers stop and say "wow" based on this PDF document.
 
 **Purpose of presentation:** {presentation_focus}
@@ -230,7 +33,7 @@ Create a stunning, visually captivating HTML presentation that makes viewers sto
 </presentation_task>
 
 <source_materials>
-**PDF Content:** The PDF document has been provided and analyzed for content extraction.{image_context}
+**PDF Content:** The PDF document has been provided and analyzed for content extraction. {image_context}
 </source_materials>
 
 <design_philosophy>
@@ -483,16 +286,237 @@ SLIDE NAVIGATION REQUIREMENTS:
 5. Maintain consistent z-index strategy across all slides
 6. Test all slide transitions to ensure smooth, predictable behavior
 </output_requirements>'''
+
+class PDFGenerator(BaseGenerator):
+    """
+    A class to generate HTML slide presentations from PDF documents using the Anthropic API.
+    """
+    # Batch workers share one generator; guards the lazily created extractors
+    _extractor_lock = threading.Lock()
+
+    def __init__(self, api_key):
+        """Initialize the PDF slide generator with Anthropic API key"""
+        super().__init__(api_key)
+        self.client = get_anthropic_client(api_key)
+        self.transport = get_transport(self.client)
+        self.presentation_focus = None
+        self.plot_extractor = None
+        self.docling_extractor = None
+
+    def validate_pdf_url(self, url):
+        """Validate if the URL points to a PDF file"""
+        return InputValidator.validate_pdf_url(url)
+
+    def validate_pdf_file(self, file_path):
+        """Validate if the file is a PDF"""
+        return InputValidator.validate_pdf_file(file_path)
+
+    def load_pdf_from_file(self, file_path):
+        """Load a local PDF file as a document (base64 is produced only when needed)"""
+        try:
+            return PDFDocument.from_file(file_path), None
+        except Exception as e:
+            return None, f"Error encoding PDF: {str(e)}"
+
+    def load_pdf_from_url(self, url):
+        """Download a PDF from URL as a document"""
+        try:
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+            response = requests.get(url, headers=headers, timeout=30)
+            response.raise_for_status()
+
+            name = Path(urlparse(url).path).name or "source.pdf"
+            return PDFDocument(response.content, name=name), None
+        except Exception as e:
+            return None, f"Error downloading and encoding PDF: {str(e)}"
+
+    def encode_pdf_from_file(self, file_path):
+        """Encode a local PDF file to base64"""
+        document, error = self.load_pdf_from_file(file_path)
+        return (document.base64 if document else None), error
+
+    def encode_pdf_from_url(self, url):
+        """Download and encode a PDF from URL to base64"""
+        document, error = self.load_pdf_from_url(url)
+        return (document.base64 if document else None), error
+
+    def _extract_images_and_captions(self, pdf_data, output_dir):
+        """
+        Extract complete figures and captions from PDF using Docling
+        
+        This replaces the fragmented pdfplumber approach with Docling's semantic
+        figure detection that maintains the integrity of complex diagrams.
+        
+        Args:
+            pdf_data: PDF document (or base64 encoded PDF data)
+            output_dir: Directory to save extracted images
+            
+        Returns:
+            Tuple of (image_captions_dict, extracted_images_dir, plots_list)
+        """
+        try:
+            # Try Docling extraction first (preferred method)
+            if self._try_docling_extraction():
+                logger.info("🔍 Using Docling for complete figure extraction...")
+                
+                # Initialize Docling extractor if not already done
+                with self._extractor_lock:
+                    if self.docling_extractor is None:
+                        self.docling_extractor = DoclingImageExtractor(dpi_scale=2.0)
+                
+                # Extract using Docling
+                image_captions, extracted_images_dir, plots = self.docling_extractor.extract_from_pdf_data(
+                    pdf_data, output_dir
+                )
+                
+                if image_captions:
+                    logger.info(f"✅ Docling extracted {len(image_captions)} complete figures")
+                    return image_captions, extracted_images_dir, plots
+                else:
+                    logger.info("Docling found no figures, falling back to pdfplumber")
+            
+            # Fallback to original fragmented extraction
+            logger.info("📋 Falling back to pdfplumber fragmented extraction...")
+            return self._extract_with_pdfplumber_fallback(pdf_data, output_dir)
+            
+        except Exception as e:
+            logger.error(f"Error in image extraction: {e}")
+            # Always fallback to original method if there's any error
+            logger.info("🔄 Error occurred, using pdfplumber fallback...")
+            return self._extract_with_pdfplumber_fallback(pdf_data, output_dir)
+    
+    def _try_docling_extraction(self) -> bool:
+        """
+        Check if Docling extraction is available and should be used
+        
+        Returns:
+            True if Docling should be used, False for fallback
+        """
+        try:
+            from opencanvas.utils.docling_extractor import DOCLING_AVAILABLE
+            return DOCLING_AVAILABLE
+        except ImportError:
+            return False
+    
+    def _extract_with_pdfplumber_fallback(self, pdf_data, output_dir):
+        """
+        Fallback extraction using the original pdfplumber method
+        
+        This preserves the original fragmented behavior for compatibility
+        when Docling is not available or fails.
+        """
+        try:
+            # Initialize plot extractor if not already done
+            with self._extractor_lock:
+                if self.plot_extractor is None:
+                    self.plot_extractor = PDFPlotCaptionExtractor(
+                        api_key=self.api_key, 
+                        provider="claude"
+                    )
+            
+            # Create temporary PDF file from the document
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
+                temp_pdf.write(PDFDocument.coerce(pdf_data).data)
+                temp_pdf_path = temp_pdf.name
+            
+            try:
+                # Extract plots and captions
+                plots = self.plot_extractor.extract_captions_from_pdf(temp_pdf_path)
+                
+                if not plots:
+                    logger.info("No images/plots found in PDF")
+                    return {}, None, []
+                
+                # Create extracted_images directory
+                extracted_images_dir = output_dir / "extracted_images"
+                extracted_images_dir.mkdir(exist_ok=True)
+                
+                # Save images and create caption mapping
+                image_captions = {}
+                for plot in plots:
+                    if plot.image_data:
+                        # Save image with plot_id as filename
+                        image_filename = f"{plot.plot_id}.png"
+                        image_path = extracted_images_dir / image_filename
+                        
+                        with open(image_path, "wb") as f:
+                            f.write(plot.image_data)
+                        
+                        # Create relative path for HTML (go up one level from slides/ to parent directory)
+                        relative_path = f"../extracted_images/{image_filename}"
+                        image_captions[plot.plot_id] = {
+                            'caption': plot.caption or "No caption found",
+                            'path': relative_path,
+                            'dimensions': plot.dimensions or "unknown",
+                            'width': plot.width,
+                            'height': plot.height,
+                            'error': plot.error
+                        }
+                        
+                        logger.info(f"Extracted image: {plot.plot_id} -> {image_path} ({plot.dimensions or 'unknown'})")
+                
+                logger.info(f"pdfplumber extracted {len(image_captions)} image fragments")
+                return image_captions, extracted_images_dir, plots
+                
+            finally:
+                # Clean up temporary file
+                if os.path.exists(temp_pdf_path):
+                    os.unlink(temp_pdf_path)
+                    
+        except Exception as e:
+            logger.error(f"Error in pdfplumber fallback extraction: {e}")
+            return {}, None, []
+
+    def generate_slides_html(self, pdf_data, presentation_focus, theme="professional", extract_images=True, output_dir=None, stream_to=None, on_slide=None):
+        """Generate HTML slides directly from PDF content in a single step."""
+        
+        self.presentation_focus = presentation_focus
+        
+        # Extract images and captions if enabled
+        image_captions = {}
+        extracted_images_dir = None
+        if extract_images and output_dir:
+            logger.info("🔍 Extracting images and captions from PDF...")
+            image_captions, extracted_images_dir, plots = self._extract_images_and_captions(pdf_data, output_dir)
+            
+            if image_captions:
+                logger.info(f"📸 Found {len(image_captions)} images with captions")
+            else:
+                logger.info("📸 No images found in PDF")
+        
+        # Build image context for prompt - integrated format
+        image_context = ""
+        if image_captions:
+            image_context = "\n**Visual Assets:** The following images have been extracted from the PDF with their captions and dimensions:\n"
+            for image_id, info in image_captions.items():
+                dimensions = info.get('dimensions', 'unknown')
+                image_context += f"- {image_id}: {info['caption']} (file: {info['path']}, size: {dimensions})\n"
+            image_context += "\n**Integration Instructions:**\n"
+            image_context += "- Incorporate these images strategically throughout the presentation\n"
+            image_context += "- Use format: `<img src='../extracted_images/image_id.png' alt='caption'>`\n"
+            image_context += "- Consider image dimensions for proper layout and positioning\n"
+            image_context += "- Place images where they enhance understanding and visual impact\n"
+        else:
+            image_context = "\n**Visual Assets:** No images were found in the source PDF."
+        
+        # Static instructions form a cacheable system prefix; focus, theme and image context come last
+        instructions, prompt_inputs = split_template(ACADEMIC_GENERATION_PROMPT, {
+            'presentation_focus': presentation_focus,
+            'theme': theme,
+            'image_context': image_context
+        })
         try:
             logger.info("🔍 Analyzing PDF and generating slides in one step...")
             logger.info("📡 Using streaming for long-running operation...")
             
             # Use streaming for long operations
-            stream = self.client.messages.create(
+            stream = self.transport.stream(
                 model="claude-3-7-sonnet-20250219",
                 max_tokens=50000,
                 temperature=0.7,
-                stream=True,
+                system=cached_system(instructions),
                 messages=[
                     {
                         "role": "user",
@@ -502,12 +526,12 @@ SLIDE NAVIGATION REQUIREMENTS:
                                 "source": {
                                     "type": "base64",
                                     "media_type": "application/pdf",
-                                    "data": pdf_data,
+                                    "data": PDFDocument.coerce(pdf_data).base64,
                                 },
                             },
                             {
                                 "type": "text",
-                                "text": academic_gen_prompt
+                                "text": prompt_inputs
                             }
                         ],
                     }
@@ -515,21 +539,17 @@ SLIDE NAVIGATION REQUIREMENTS:
             )
             
             # Collect the streamed response
-            html_content = ""
-            for chunk in stream:
-                if chunk.type == "content_block_delta":
-                    html_content += chunk.delta.text
-                    # Log progress every 1000 characters
-                    if len(html_content) % 1000 == 0:
-                        logger.info(f"📝 Generated {len(html_content)} characters...")
+            with HTMLStreamSink(output_file=stream_to, on_slide=on_slide, clean=self.clean_html_content) as sink:
+                html_content = sink.consume(stream)
             
-            logger.info(f"✅ Completed generation: {len(html_content)} characters")
+            logger.info(f"✅ Completed generation: {len(html_content)} characters, {len(sink.slides)} slides")
+            cache_metrics.record(sink.usage, label="pdf slides")
             return self.clean_html_content(html_content), None
 
         except Exception as e:
             return None, f"Error generating slides directly: {str(e)}"
     
-    def generate_presentation(self, pdf_source, presentation_focus="A comprehensive overview", theme="professional", slide_count=12, output_dir=str(Config.OUTPUT_DIR), extract_images=True):
+    def generate_presentation(self, pdf_source, presentation_focus="A comprehensive overview", theme="professional", slide_count=12, output_dir=str(Config.OUTPUT_DIR), extract_images=True, open_browser=True):
         """
         One-step function to generate a presentation from a PDF source with organized file structure.
         
@@ -540,6 +560,7 @@ SLIDE NAVIGATION REQUIREMENTS:
             slide_count: Target number of slides
             output_dir: Output directory for organized files
             extract_images: Whether to extract and include images from the PDF
+            open_browser: Whether to open the finished slides in a browser (off for batch runs)
             
         Returns:
             Dict with result information or None if process failed
@@ -569,8 +590,8 @@ SLIDE NAVIGATION REQUIREMENTS:
                 logger.error(f"Invalid PDF URL: {msg}")
                 return None
                 
-            # Download and encode PDF
-            pdf_data, error = self.encode_pdf_from_url(pdf_source)
+            # Download PDF
+            pdf_data, error = self.load_pdf_from_url(pdf_source)
             if error:
                 logger.error(f"❌ {error}")
                 return None
@@ -582,13 +603,13 @@ SLIDE NAVIGATION REQUIREMENTS:
                 logger.error(f"Invalid PDF file: {msg}")
                 return None
                 
-            # Encode PDF
-            pdf_data, error = self.encode_pdf_from_file(pdf_source)
+            # Load PDF
+            pdf_data, error = self.load_pdf_from_file(pdf_source)
             if error:
                 logger.error(f"❌ {error}")
                 return None
         
-        logger.info("2. PDF encoded successfully.")
+        logger.info("2. PDF loaded successfully.")
         
         # Create organized output structure
         paths = create_organized_output_structure(output_path, topic_slug, timestamp)
@@ -599,7 +620,8 @@ SLIDE NAVIGATION REQUIREMENTS:
             presentation_focus,
             theme,
             extract_images=extract_images,
-            output_dir=paths['base']
+            output_dir=paths['base'],
+            stream_to=paths['slides'] / "presentation.html"
         )
         
         if error:
@@ -619,7 +641,7 @@ SLIDE NAVIGATION REQUIREMENTS:
         )
         
         # Open in browser (use the organized HTML file)
-        if 'html' in organized_files:
+        if open_browser and 'html' in organized_files:
             logger.info(f"🌐 Opening slides in browser...")
             self.open_in_browser(str(organized_files['html']))
         
@@ -0,0 +1,197 @@
+"""
+Persistent caches for the topic research stage.
+
+ScrapeCache stores the cleaned text extracted from scraped pages keyed by
+normalized URL, together with the ETag/Last-Modified validators needed to
+revalidate stale entries with conditional GETs.
+
+SearchCache stores raw Brave Search results keyed by normalized query, market
+and freshness, with a TTL derived from the requested freshness window.
+"""
+
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import logging
+
+from opencanvas.config import Config
+from opencanvas.utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {'fbclid', 'gclid', 'msclkid', 'ref', 'ref_src'}
+
+# Words that do not change what a search query finds
+QUERY_STOPWORDS = {
+    'a', 'an', 'the', 'of', 'in', 'on', 'for', 'to', 'and', 'or', 'with',
+    'about', 'from', 'by', 'is', 'are', 'what', 'how'
+}
+
+# Search operators are case-sensitive and must survive normalization
+QUERY_OPERATORS = {'OR', 'AND', 'NOT'}
+
+# Quoted phrases (kept whole) or single whitespace-separated terms
+QUERY_TOKEN_PATTERN = re.compile(r'"[^"]*"|\S+')
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that trivially different links share a cache entry.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the query string and strips trailing slashes.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS
+    )
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class ScrapeCache:
+    """On-disk cache of extracted page text with HTTP revalidation metadata."""
+
+    def __init__(self, cache_dir=None, ttl_seconds: Optional[float] = None, max_size_bytes: Optional[int] = None):
+        """
+        Initialize the scrape cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to <CACHE_DIR>/scrape)
+            ttl_seconds: Freshness lifetime of an entry before revalidation
+            max_size_bytes: Total size budget for LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else Config.SCRAPE_CACHE_TTL_HOURS * 3600
+        self.cache = DiskCache(
+            cache_dir or Config.CACHE_DIR / "scrape",
+            max_size_bytes=max_size_bytes or int(Config.SCRAPE_CACHE_MAX_MB * 1024 * 1024),
+            default_ttl=self.ttl_seconds
+        )
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """
+        Return the cached record for a URL, including stale ones.
+
+        The caller serves fresh records directly and revalidates stale ones
+        using the 'etag'/'last_modified' entries in record['metadata'].
+        """
+        return self.cache.get(normalize_url(url), include_expired=True)
+
+    def store(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store extracted text with its HTTP validators."""
+        metadata = {'url': url}
+        if etag:
+            metadata['etag'] = etag
+        if last_modified:
+            metadata['last_modified'] = last_modified
+        self.cache.set(normalize_url(url), value=text, metadata=metadata)
+
+    def refresh(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Renew a stale entry after a 304 Not Modified response (counted as a hit)."""
+        metadata = {}
+        if etag:
+            metadata['etag'] = etag
+        if last_modified:
+            metadata['last_modified'] = last_modified
+        if self.cache.touch(normalize_url(url), metadata=metadata):
+            self.cache.mark_revalidated()
+
+    def conditional_headers(self, record: Dict) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cached record."""
+        headers = {}
+        metadata = record.get('metadata', {})
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+        return headers
+
+    def get_stats(self) -> Dict:
+        """Return cache statistics."""
+        return self.cache.get_stats()
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query so trivially different spellings share a cache entry.
+
+    Only case, whitespace and bare stopwords are normalized: term order, quoted
+    phrases, +/- prefixes, site: filters and OR/AND/NOT operators are kept, so
+    queries that a search engine treats differently never share results.
+    "The impact of AI on  healthcare" and "impact AI healthcare" share a key,
+    "python -snake" and "python snake" do not.
+    """
+    terms = []
+    for token in QUERY_TOKEN_PATTERN.findall(query):
+        if token in QUERY_OPERATORS:
+            terms.append(token)
+        elif token.startswith('"'):
+            terms.append(' '.join(token.lower().split()))
+        elif token.lower() not in QUERY_STOPWORDS:
+            terms.append(token.lower())
+    return ' '.join(terms) if terms else ' '.join(query.lower().split())
+
+
+class SearchCache:
+    """On-disk cache of raw web search results with freshness-aware TTLs."""
+
+    # Brave freshness window -> how long its results stay valid (seconds)
+    FRESHNESS_TTLS = {
+        'pd': 1 * 3600,         # past day
+        'pw': 6 * 3600,         # past week
+        'pm': 24 * 3600,        # past month
+        'py': 7 * 24 * 3600,    # past year
+    }
+    DEFAULT_TTL = 24 * 3600
+
+    def __init__(self, cache_dir=None, max_size_bytes: Optional[int] = None):
+        """
+        Initialize the search cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to <CACHE_DIR>/search)
+            max_size_bytes: Total size budget for LRU eviction
+        """
+        self.cache = DiskCache(
+            cache_dir or Config.CACHE_DIR / "search",
+            max_size_bytes=max_size_bytes or int(Config.SEARCH_CACHE_MAX_MB * 1024 * 1024)
+        )
+
+    def make_key(self, query: str, market: str, freshness: Optional[str]) -> str:
+        """Build the cache key for a query/market/freshness triple."""
+        return f"{normalize_query(query)}|{market.lower()}|{freshness or ''}"
+
+    def ttl_for(self, freshness: Optional[str]) -> float:
+        """Return the TTL for a freshness window."""
+        return self.FRESHNESS_TTLS.get(freshness, self.DEFAULT_TTL)
+
+    def get(self, query: str, market: str, freshness: Optional[str]) -> Optional[List[Dict]]:
+        """Return cached raw results, or None on a miss."""
+        record = self.cache.get(self.make_key(query, market, freshness))
+        return record['value'] if record is not None else None
+
+    def put(self, query: str, market: str, freshness: Optional[str], results: List[Dict]):
+        """Store raw results for a query."""
+        self.cache.set(
+            self.make_key(query, market, freshness),
+            value=results,
+            ttl=self.ttl_for(freshness),
+            metadata={'query': query}
+        )
+
+    def get_stats(self) -> Dict:
+        """Return hit/miss counters for search lookups."""
+        return self.cache.get_stats()
@@ -5,6 +5,7 @@ import logging
 from opencanvas.generators.topic_generator import TopicGenerator
 from opencanvas.generators.pdf_generator import PDFGenerator
 from opencanvas.utils.validation import InputValidator
+from opencanvas.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +45,9 @@ class GenerationRouter:
         logger.info(f"Detected topic text: {input_source[:50]}...")
         return 'topic'
     
-    def generate(self, input_source: str, purpose: str, theme: str, output_dir: str = 'output', extract_images: bool = False):
-        """Route to appropriate generator based on input type"""
+    def generate(self, input_source: str, purpose: str, theme: str, output_dir: str = 'output', extract_images: bool = False,
+                 open_browser: bool = True):
+        """Route to appropriate generator based on input type (open_browser=False skips opening the result)"""
         logger.info(f"Starting generation with router")
         logger.info(f"Input: {input_source}")
         logger.info(f"Purpose: {purpose}")
@@ -71,7 +73,8 @@ class GenerationRouter:
                     presentation_focus=purpose,
                     theme=theme,
                     output_dir=output_dir,
-                    extract_images=extract_images
+                    extract_images=extract_images,
+                    open_browser=open_browser
                 )
             else:
                 logger.info("Routing to topic generator")
@@ -82,8 +85,37 @@ class GenerationRouter:
                     user_text=input_source,
                     purpose=purpose,
                     theme=theme,
-                    output_dir=output_dir
+                    output_dir=output_dir,
+                    open_browser=open_browser
                 )
         except Exception as e:
             logger.error(f"Generation failed: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def generate_many(self, items, output_dir: str = 'output', max_workers: int = None, max_retries: int = None,
+                      provider_limits=None, results_path=None):
+        """
+        Generate many presentations concurrently, sharing this router's generators and API clients.
+        
+        Args:
+            items: BatchItem objects or dicts with 'input' and optional 'id', 'purpose', 'theme',
+                'output_dir', 'extract_images'
+            output_dir: Base directory; each item is written to <output_dir>/<id>
+            max_workers: Number of concurrent generations (defaults to BATCH_MAX_WORKERS)
+            max_retries: Extra attempts for failed items (defaults to BATCH_MAX_RETRIES)
+            provider_limits: Maximum concurrent items per provider, e.g. {'anthropic': 4}
+            results_path: JSONL results manifest used for resuming interrupted batches
+            
+        Returns:
+            List of BatchResult for the items processed in this call
+        """
+        from opencanvas.generators.batch import BatchItem, BatchRunner
+        
+        batch_items = [item if isinstance(item, BatchItem) else BatchItem(**item) for item in items]
+        runner = BatchRunner(
+            self,
+            max_workers=max_workers or Config.BATCH_MAX_WORKERS,
+            max_retries=Config.BATCH_MAX_RETRIES if max_retries is None else max_retries,
+            provider_limits=provider_limits
+        )
+        return runner.run(batch_items, output_dir=output_dir, results_path=results_path)
@@ -0,0 +1,223 @@
+"""
+Streaming sink for LLM-generated slide decks.
+
+Collects streamed text chunks without repeated string concatenation, mirrors
+them to a .partial file next to the output file as they arrive, logs progress
+by size/time thresholds and detects complete <div class="slide"> blocks so
+downstream consumers can start working on a slide as soon as it has been
+generated. The output file itself is only replaced once the stream has
+finished (and been cleaned), so a failed generation never leaves a truncated
+deck at the final path.
+"""
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Opening/closing div tags (complete tags only; partial tags wait for more text)
+DIV_TAG_PATTERN = re.compile(r'<div\b[^>]*>|</div\s*>', re.IGNORECASE)
+CLASS_ATTR_PATTERN = re.compile(r'class\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+
+
+def partial_path(output_file) -> Path:
+    """Return the file a stream bound for output_file is written to while it is in progress."""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + ".partial")
+
+
+class HTMLStreamSink:
+    """Accumulates streamed HTML and emits complete slides as they finish."""
+
+    def __init__(self, output_file=None, on_slide: Optional[Callable[[int, str], None]] = None,
+                 progress_bytes: int = 8192, progress_interval: float = 5.0, slide_class: str = "slide",
+                 clean: Optional[Callable[[str], str]] = None):
+        """
+        Initialize the sink.
+
+        Args:
+            output_file: Optional path the finished deck is written to; the raw stream
+                goes to a .partial file beside it until the sink is closed
+            on_slide: Callback invoked as on_slide(index, slide_html) for each completed slide
+            progress_bytes: Log progress every time this many more bytes have arrived
+            progress_interval: Also log progress after this many seconds without a log line
+            slide_class: CSS class identifying top-level slide containers
+            clean: Optional function applied to the complete text before it replaces output_file
+        """
+        self.output_file = Path(output_file) if output_file else None
+        self.partial_file = partial_path(self.output_file) if self.output_file else None
+        self.clean = clean
+        self.on_slide = on_slide
+        self.progress_bytes = progress_bytes
+        self.progress_interval = progress_interval
+        self.slide_class = slide_class
+
+        self.slides: List[str] = []
+        self.usage: Dict[str, int] = {}
+        self.bytes_received = 0
+        self.started_at = time.time()
+        self.first_slide_at: Optional[float] = None
+
+        self._chunks: List[str] = []
+        self._text: Optional[str] = None
+        self._file = None
+        self._closed = False
+        self._next_progress_bytes = progress_bytes
+        self._last_progress_time = self.started_at
+
+        # Slide detection state
+        self._pending = ""
+        self._scan_pos = 0
+        self._slide_start: Optional[int] = None
+        self._depth = 0
+
+        if self.output_file:
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.partial_file, 'w', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+    def write(self, text: str):
+        """Append a chunk of streamed text."""
+        if not text:
+            return
+        if self._closed:
+            raise ValueError("write to closed HTMLStreamSink")
+
+        self._chunks.append(text)
+        self._text = None
+        self.bytes_received += len(text.encode('utf-8'))
+
+        if self._file:
+            self._file.write(text)
+            self._file.flush()
+
+        self._scan(text)
+        self._log_progress()
+
+    def consume(self, stream: Iterable) -> str:
+        """
+        Drain an Anthropic message stream into the sink.
+
+        Args:
+            stream: Iterable of streaming events (content_block_delta events carry text;
+                message_start/message_delta carry token usage, collected in self.usage)
+
+        Returns:
+            The complete generated text
+        """
+        for event in stream:
+            if event.type == "content_block_delta":
+                self.write(getattr(event.delta, 'text', ''))
+            elif event.type in ("message_start", "message_delta"):
+                self._update_usage(event)
+        self.close()
+        return self.getvalue()
+
+    def _update_usage(self, event):
+        message = getattr(event, 'message', None)
+        usage = getattr(message, 'usage', None) if message is not None else getattr(event, 'usage', None)
+        if usage is None:
+            return
+        for name in ('input_tokens', 'cache_read_input_tokens', 'cache_creation_input_tokens', 'output_tokens'):
+            value = getattr(usage, name, None)
+            if value is not None:
+                self.usage[name] = value
+
+    def getvalue(self) -> str:
+        """Return everything received so far."""
+        if self._text is None:
+            self._text = ''.join(self._chunks)
+            self._chunks = [self._text] if self._text else []
+        return self._text
+
+    def close(self):
+        """Finish the stream: move the (cleaned) text from the .partial file to the output file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._file:
+            self._file.close()
+            self._file = None
+            if self.clean:
+                self.partial_file.write_text(self.clean(self.getvalue()), encoding='utf-8')
+            os.replace(self.partial_file, self.output_file)
+
+    def discard(self):
+        """Abandon an unfinished stream: remove the .partial file and leave the output file untouched."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._file:
+            self._file.close()
+            self._file = None
+            self.partial_file.unlink(missing_ok=True)
+
+    def _log_progress(self):
+        now = time.time()
+        if self.bytes_received >= self._next_progress_bytes or now - self._last_progress_time >= self.progress_interval:
+            logger.info(f"📝 Generated {self.bytes_received} bytes, {len(self.slides)} slides "
+                        f"({now - self.started_at:.1f}s)...")
+            while self._next_progress_bytes <= self.bytes_received:
+                self._next_progress_bytes += self.progress_bytes
+            self._last_progress_time = now
+
+    def _is_slide_tag(self, tag: str) -> bool:
+        match = CLASS_ATTR_PATTERN.search(tag)
+        return bool(match) and self.slide_class in match.group(1).split()
+
+    def _scan(self, text: str):
+        """Track div nesting to find complete top-level slide blocks."""
+        self._pending += text
+
+        for match in DIV_TAG_PATTERN.finditer(self._pending, self._scan_pos):
+            tag = match.group(0)
+            opening = not tag.startswith('</')
+            self._scan_pos = match.end()
+
+            if self._slide_start is None:
+                if opening and self._is_slide_tag(tag):
+                    self._slide_start = match.start()
+                    self._depth = 1
+                continue
+
+            self._depth += 1 if opening else -1
+            if self._depth == 0:
+                self._emit_slide(self._pending[self._slide_start:match.end()])
+                self._slide_start = None
+
+        if self._slide_start is None:
+            # Outside a slide only a trailing partial tag needs to be kept
+            tail = self._pending[self._scan_pos:]
+            lt = tail.rfind('<')
+            self._pending = tail[lt:] if lt != -1 and '>' not in tail[lt:] else ""
+            self._scan_pos = 0
+        elif self._slide_start > 0:
+            self._pending = self._pending[self._slide_start:]
+            self._scan_pos -= self._slide_start
+            self._slide_start = 0
+
+    def _emit_slide(self, slide_html: str):
+        index = len(self.slides)
+        self.slides.append(slide_html)
+        if self.first_slide_at is None:
+            self.first_slide_at = time.time()
+            logger.info(f"🎞️ First slide ready after {self.first_slide_at - self.started_at:.1f}s")
+
+        if self.on_slide:
+            try:
+                self.on_slide(index, slide_html)
+            except Exception as e:
+                logger.warning(f"⚠️ Slide consumer failed on slide {index + 1}: {e}")
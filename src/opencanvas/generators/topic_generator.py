@@ -3,16 +3,23 @@ import json
 import webbrowser
 import requests
 from pathlib import Path
-from anthropic import Anthropic
 from datetime import datetime
 from bs4 import BeautifulSoup
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait
 from urllib.parse import urljoin, urlparse
 import logging
 
 from opencanvas.generators.base import BaseGenerator
 from opencanvas.config import Config
+from opencanvas.generators.research_cache import ScrapeCache, SearchCache
+from opencanvas.generators.streaming import HTMLStreamSink
+from opencanvas.generators.incremental import IncrementalSlidePipeline
+from opencanvas.llm.transport import get_transport
+from opencanvas.llm.clients import get_anthropic_client
+from opencanvas.llm.prompt_cache import split_template, cached_system, cache_metrics
 from opencanvas.image_validation import ImageValidationPipeline
 
 logger = logging.getLogger(__name__)
@@ -36,12 +43,32 @@ def _import_tool_pipeline():
             logger.info(f"Evolution tool pipeline not available: {e}")
 
 class TopicGenerator(BaseGenerator):
-    def __init__(self, api_key, brave_api_key=None, enable_image_validation=True, enable_evolution_tools=True, prompt_version=None, skip_prompt_loading=False):
+    def __init__(self, api_key, brave_api_key=None, enable_image_validation=True, enable_evolution_tools=True, prompt_version=None, skip_prompt_loading=False, incremental=None):
         """Initialize the topic-based slide generator with Anthropic API key and optional Brave API key"""
         super().__init__(api_key)
-        self.client = Anthropic(api_key=api_key)
+        self.client = get_anthropic_client(api_key)
+        self.transport = get_transport(self.client)
         self.brave_api_key = brave_api_key or os.getenv('BRAVE_API_KEY')
         
+        # Post-process slides while they stream in (defaults to INCREMENTAL_PIPELINE)
+        self.incremental = Config.INCREMENTAL_PIPELINE if incremental is None else incremental
+        
+        # Persistent cache of scraped research pages
+        self.scrape_cache = None
+        if Config.SCRAPE_CACHE_ENABLED:
+            try:
+                self.scrape_cache = ScrapeCache()
+            except Exception as e:
+                logger.warning(f"⚠️ Scrape cache disabled due to error: {e}")
+        
+        # Persistent cache of web search results
+        self.search_cache = None
+        if Config.SEARCH_CACHE_ENABLED:
+            try:
+                self.search_cache = SearchCache()
+            except Exception as e:
+                logger.warning(f"⚠️ Search cache disabled due to error: {e}")
+        
         # Load the appropriate prompt (evolved or baseline) unless skipped
         if not skip_prompt_loading:
             self.generation_prompt = self._load_generation_prompt(prompt_version)
@@ -163,16 +190,6 @@ Note that there might be typos in the user input; please decide based on context
             return []
         
         try:
-            logger.info(f"🔍 Searching with Brave API: {query}")
-            
-            url = "https://api.search.brave.com/res/v1/web/search"
-            
-            headers = {
-                "Accept": "application/json",
-                "Accept-Encoding": "gzip",
-                "X-Subscription-Token": brave_api_key
-            }
-            
             params = {
                 "q": query,
                 "count": 10,  # Number of results to return
@@ -184,13 +201,33 @@ Note that there might be typos in the user input; please decide based on context
                 "spellcheck": True  # Enable spell checking
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            web_results = None
+            if self.search_cache:
+                web_results = self.search_cache.get(query, params["mkt"], params["freshness"])
+                if web_results is not None:
+                    logger.info(f"📦 Using cached search results for: {query}")
             
-            # Extract web results
-            web_results = data.get("web", {}).get("results", [])
+            if web_results is None:
+                logger.info(f"🔍 Searching with Brave API: {query}")
+                
+                url = "https://api.search.brave.com/res/v1/web/search"
+                
+                headers = {
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip",
+                    "X-Subscription-Token": brave_api_key
+                }
+                
+                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                # Extract web results
+                web_results = data.get("web", {}).get("results", [])
+                
+                if self.search_cache and web_results:
+                    self.search_cache.put(query, params["mkt"], params["freshness"], web_results)
             
             if not web_results:
                 logger.warning("❌ No search results found")
@@ -284,54 +321,212 @@ Respond with ONLY two numbers separated by a comma (e.g., "2,4") representing th
             return search_results[:2] if len(search_results) >= 2 else search_results
     
     def scrape_web_content(self, url):
-        """Scrape content from a web page"""
+        """Scrape content from a web page, serving and revalidating from the scrape cache"""
+        cached = self.scrape_cache.lookup(url) if self.scrape_cache else None
+        if cached and not cached['expired']:
+            logger.info(f"📦 Using cached content for: {url}")
+            return cached['value']
+        
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
+            if cached:
+                headers.update(self.scrape_cache.conditional_headers(cached))
             
             logger.info(f"🌐 Scraping content from: {url}")
             response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
             
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            if response.status_code == 304 and cached:
+                logger.info(f"📦 Cached content still valid for: {url}")
+                self.scrape_cache.refresh(url, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return cached['value']
             
-            # Try to find main content areas
-            content_selectors = [
-                'article', 'main', '.content', '#content', 
-                '.post-content', '.entry-content', '.article-content'
-            ]
-            
-            content_text = ""
-            for selector in content_selectors:
-                content_elements = soup.select(selector)
-                if content_elements:
-                    content_text = content_elements[0].get_text()
-                    break
-            
-            # If no specific content area found, get all text
-            if not content_text:
-                content_text = soup.get_text()
+            response.raise_for_status()
             
-            # Clean up the text
-            lines = (line.strip() for line in content_text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            content_text = ' '.join(chunk for chunk in chunks if chunk)
+            content_text = self._extract_clean_text(response.content)
             
-            # Limit content length to avoid token limits
-            if len(content_text) > 8000:
-                content_text = content_text[:8000] + "..."
+            if self.scrape_cache and content_text:
+                self.scrape_cache.store(url, content_text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
             
             return content_text
             
         except Exception as e:
             logger.error(f"Error scraping content: {e}")
+            if cached:
+                logger.info(f"📦 Falling back to stale cached content for: {url}")
+                return cached['value']
             return None
     
+    def _extract_clean_text(self, html):
+        """Extract the main readable text from a page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # Try to find main content areas
+        content_selectors = [
+            'article', 'main', '.content', '#content', 
+            '.post-content', '.entry-content', '.article-content'
+        ]
+        
+        content_text = ""
+        for selector in content_selectors:
+            content_elements = soup.select(selector)
+            if content_elements:
+                content_text = content_elements[0].get_text()
+                break
+        
+        # If no specific content area found, get all text
+        if not content_text:
+            content_text = soup.get_text()
+        
+        # Clean up the text
+        lines = (line.strip() for line in content_text.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        content_text = ' '.join(chunk for chunk in chunks if chunk)
+        
+        # Limit content length to avoid token limits
+        if len(content_text) > 8000:
+            content_text = content_text[:8000] + "..."
+        
+        return content_text
+
+    def research_topic(self, user_text):
+        """
+        Run the knowledge assessment and the web research branch concurrently.
+
+        The search query is generated speculatively while the assessment is in
+        flight; if the assessment comes back SUFFICIENT the research branch is
+        cancelled and its results are discarded.
+
+        Args:
+            user_text: Topic text provided by the user
+
+        Returns:
+            Tuple of (knowledge_assessment, additional_context or None)
+        """
+        deadline = time.monotonic() + Config.RESEARCH_DEADLINE_SECONDS
+        cancel_event = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="research")
+        try:
+            assessment_future = executor.submit(self.assess_knowledge_depth, user_text)
+
+            # Research is pointless without a search key, so only speculate when we have one
+            research_future = None
+            if self.brave_api_key:
+                research_future = executor.submit(self._run_research_branch, user_text, cancel_event, deadline)
+
+            knowledge_assessment = assessment_future.result()
+            logger.info(f"📊 Knowledge assessment: {knowledge_assessment}")
+
+            if knowledge_assessment != "INSUFFICIENT":
+                if research_future is not None:
+                    cancel_event.set()
+                    research_future.cancel()
+                    logger.info("⏹️ Cancelled speculative research branch")
+                return knowledge_assessment, None
+
+            logger.info("\n🔍 Insufficient knowledge detected. Waiting for web research...")
+            if research_future is None:
+                logger.warning("⚠️  Brave API key not provided. Set BRAVE_API_KEY environment variable or pass it as parameter.")
+                return knowledge_assessment, None
+
+            try:
+                additional_context = research_future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                logger.warning(f"⏰ Research deadline of {Config.RESEARCH_DEADLINE_SECONDS:.0f}s exceeded, continuing without research")
+                cancel_event.set()
+                additional_context = None
+
+            return knowledge_assessment, additional_context
+        finally:
+            # Never block on a cancelled or timed-out branch; drop anything not yet started
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_research_branch(self, user_text, cancel_event, deadline):
+        """Search, rank and scrape sources for a topic, honouring cancellation and the shared deadline"""
+        search_query = self.generate_search_query(user_text)
+        if cancel_event.is_set():
+            return None
+        logger.info(f"🔎 Search query: {search_query}")
+
+        search_results = self.web_search(search_query, self.brave_api_key)
+        # Stop before any scrape is started if the branch was cancelled during the search
+        if cancel_event.is_set():
+            logger.info("⏹️ Research branch cancelled before scraping")
+            return None
+        if not search_results:
+            logger.warning("❌ Web search returned no results")
+            return None
+
+        # Scrape every candidate the credibility ranking can pick while the ranking runs
+        candidates = search_results[:5]
+        scrape_executor = ThreadPoolExecutor(
+            max_workers=max(1, min(Config.RESEARCH_MAX_WORKERS, len(candidates))),
+            thread_name_prefix="scrape"
+        )
+        try:
+            scrape_futures = {
+                source.get('link'): scrape_executor.submit(self._scrape_unless_cancelled, source.get('link'), cancel_event)
+                for source in candidates if source.get('link')
+            }
+
+            best_sources = self.assess_source_credibility(search_results)
+            if cancel_event.is_set():
+                return None
+            if not best_sources:
+                logger.warning("❌ No suitable sources found for research")
+                return None
+
+            selected = best_sources[:2]  # Ensure we only process 2 sources
+            for source in selected:
+                link = source.get('link')
+                if link and link not in scrape_futures:
+                    scrape_futures[link] = scrape_executor.submit(self._scrape_unless_cancelled, link, cancel_event)
+
+            # Drop candidates that were not selected and have not started yet
+            selected_links = {source.get('link') for source in selected}
+            for link, future in scrape_futures.items():
+                if link not in selected_links:
+                    future.cancel()
+
+            selected_futures = [scrape_futures[s.get('link')] for s in selected if s.get('link') in scrape_futures]
+            wait(selected_futures, timeout=max(0.0, deadline - time.monotonic()))
+
+            additional_context_parts = []
+            for i, source in enumerate(selected):
+                logger.info(f"🏆 Selected source {i+1}: {source.get('title', 'N/A')}")
+                logger.info(f"🔗 URL: {source.get('link', 'N/A')}")
+
+                future = scrape_futures.get(source.get('link'))
+                scraped_content = future.result() if future is not None and future.done() and not future.cancelled() else None
+
+                if scraped_content:
+                    additional_context_parts.append(f"Source {i+1} - {source.get('title', 'Unknown')}:\n{scraped_content}")
+                    logger.info(f"✅ Successfully gathered content from source {i+1} ({len(scraped_content)} characters)")
+                else:
+                    logger.warning(f"❌ Failed to scrape content from source {i+1}")
+
+            if not additional_context_parts:
+                logger.warning("❌ Failed to gather content from any selected sources")
+                return None
+
+            logger.info(f"✅ Combined additional context from {len(additional_context_parts)} sources")
+            return "\n\n" + "="*50 + "\n\n".join(additional_context_parts)
+        finally:
+            # Queued scrapes are dropped; running ones stop at their request timeout
+            scrape_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _scrape_unless_cancelled(self, url, cancel_event):
+        """Scrape a research source unless the research branch has been cancelled"""
+        if cancel_event.is_set():
+            return None
+        return self.scrape_web_content(url)
+
     def generate_blog(self, user_text, additional_context=None):
         """Generate educational blog content from user text, optionally with additional context"""
         
@@ -379,7 +574,7 @@ Please write a complete educational blog post that stays focused on the user's t
             """
         
         try:
-            response = self.client.messages.create(
+            response = self.transport.create(
                 model="claude-3-7-sonnet-20250219",
                 max_tokens=4000,
                 temperature=0.2,
@@ -637,37 +832,42 @@ IMPORTANT: Output ONLY the complete HTML code. Start with <!DOCTYPE html> and en
             logger.warning(f"Could not load evolved prompt: {e}")
             return None
     
-    def generate_slides_html(self, blog_content, purpose, theme):
-        """Generate HTML slide deck from blog content"""
-        
-        # Use the prompt loaded during initialization
-        slide_prompt = self.generation_prompt.format(
-            blog_content=blog_content,
-            purpose=purpose,
-            theme=theme
-        )
+    def generate_slides_html(self, blog_content, purpose, theme, stream_to=None, on_slide=None):
+        """
+        Generate HTML slide deck from blog content
+
+        Args:
+            blog_content: Blog text the slides are based on
+            purpose: Presentation purpose
+            theme: Visual theme
+            stream_to: Optional file the HTML is written to while it streams in
+            on_slide: Optional callback on_slide(index, slide_html) for each completed slide
+        """
+        
+        # Static instructions form a cacheable system prefix; the blog, purpose and theme come last
+        instructions, slide_inputs = split_template(self.generation_prompt, {
+            'blog_content': blog_content,
+            'purpose': purpose,
+            'theme': theme
+        })
         try:
             logger.info("📡 Using streaming for slide generation...")
             
             # Use streaming for long operations
-            stream = self.client.messages.create(
+            stream = self.transport.stream(
                 model="claude-3-7-sonnet-20250219",
                 max_tokens=50000,
                 temperature=0.5,
-                stream=True,
-                messages=[{"role": "user", "content": slide_prompt}]
+                system=cached_system(instructions),
+                messages=[{"role": "user", "content": slide_inputs}]
             )
             
             # Collect the streamed response
-            html_content = ""
-            for chunk in stream:
-                if chunk.type == "content_block_delta":
-                    html_content += chunk.delta.text
-                    # Log progress every 1000 characters
-                    if len(html_content) % 1000 == 0:
-                        logger.info(f"📝 Generated {len(html_content)} characters...")
+            with HTMLStreamSink(output_file=stream_to, on_slide=on_slide, clean=self.clean_html_content) as sink:
+                html_content = sink.consume(stream)
             
-            logger.info(f"✅ Completed generation: {len(html_content)} characters")
+            logger.info(f"✅ Completed generation: {len(html_content)} characters, {len(sink.slides)} slides")
+            cache_metrics.record(sink.usage, label="topic slides")
             
             # Clean up HTML if wrapped in code blocks
             return self.clean_html_content(html_content)
@@ -675,9 +875,26 @@ IMPORTANT: Output ONLY the complete HTML code. Start with <!DOCTYPE html> and en
             logger.error(f"Error generating slides: {e}")
             return None
     
-    def generate_from_topic(self, user_text, purpose, theme="professional blue", output_dir=str(Config.OUTPUT_DIR)):
-        """Generate presentation from a topic/text with organized file structure"""
-        from opencanvas.utils.file_utils import generate_topic_slug, organize_pipeline_outputs
+    def _create_incremental_pipeline(self, stream_path):
+        """Build the per-slide validation/rendering pipeline for incremental mode"""
+        renderer = None
+        if Config.INCREMENTAL_RENDER:
+            try:
+                from opencanvas.conversion.slide_renderer import SlideRenderer
+                renderer = SlideRenderer(stream_path.parent, zoom_factor=Config.DEFAULT_ZOOM,
+                                         output_name=stream_path.with_suffix('.pdf').name)
+            except Exception as e:
+                logger.warning(f"⚠️ Incremental rendering disabled: {e}")
+        
+        return IncrementalSlidePipeline(
+            image_validator=self.image_validator if self.enable_image_validation else None,
+            renderer=renderer,
+            stream_file=stream_path
+        )
+    
+    def generate_from_topic(self, user_text, purpose, theme="professional blue", output_dir=str(Config.OUTPUT_DIR), open_browser=True):
+        """Generate presentation from a topic/text with organized file structure (open_browser=False for unattended runs)"""
+        from opencanvas.utils.file_utils import generate_topic_slug, organize_pipeline_outputs, create_organized_output_structure
         from opencanvas.config import Config
         
         logger.info(f"🚀 Starting topic-based presentation generation...")
@@ -693,54 +910,11 @@ IMPORTANT: Output ONLY the complete HTML code. Start with <!DOCTYPE html> and en
         logger.info(f"📂 Topic slug: {topic_slug}")
         logger.info(f"📁 Output directory: {output_path}")
         
-        # Step 1: Assess knowledge depth
-        logger.info("\n🧠 Assessing knowledge depth...")
-        knowledge_assessment = self.assess_knowledge_depth(user_text)
-        logger.info(f"📊 Knowledge assessment: {knowledge_assessment}")
-        
-        additional_context = None
-        
-        # Step 2: If insufficient knowledge, perform web research
-        if knowledge_assessment == "INSUFFICIENT":
-            logger.info("\n🔍 Insufficient knowledge detected. Initiating web research...")
-            
-            # Generate search query
-            search_query = self.generate_search_query(user_text)
-            logger.info(f"🔎 Search query: {search_query}")
-            
-            # Perform web search
-            search_results = self.web_search(search_query, self.brave_api_key)
-            
-            if search_results:
-                # Assess source credibility and select best sources
-                best_sources = self.assess_source_credibility(search_results)
-                
-                if best_sources:
-                    additional_context_parts = []
-                    
-                    for i, source in enumerate(best_sources[:2]):  # Ensure we only process 2 sources
-                        logger.info(f"🏆 Selected source {i+1}: {source.get('title', 'N/A')}")
-                        logger.info(f"🔗 URL: {source.get('link', 'N/A')}")
-                        
-                        # Scrape content from each source
-                        scraped_content = self.scrape_web_content(source.get('link'))
-                        
-                        if scraped_content:
-                            additional_context_parts.append(f"Source {i+1} - {source.get('title', 'Unknown')}:\n{scraped_content}")
-                            logger.info(f"✅ Successfully gathered content from source {i+1} ({len(scraped_content)} characters)")
-                        else:
-                            logger.warning(f"❌ Failed to scrape content from source {i+1}")
-                    
-                    if additional_context_parts:
-                        additional_context = "\n\n" + "="*50 + "\n\n".join(additional_context_parts)
-                        logger.info(f"✅ Combined additional context from {len(additional_context_parts)} sources")
-                    else:
-                        logger.warning("❌ Failed to gather content from any selected sources")
-                else:
-                    logger.warning("❌ No suitable sources found for research")
-            else:
-                logger.warning("❌ Web search returned no results")
-        else:
+        # Steps 1-2: Assess knowledge depth while speculatively researching the topic
+        logger.info("\n🧠 Assessing knowledge depth (research runs concurrently)...")
+        knowledge_assessment, additional_context = self.research_topic(user_text)
+
+        if knowledge_assessment != "INSUFFICIENT":
             logger.info("✅ Sufficient knowledge available. Proceeding without additional research.")
         
         # Step 3: Generate blog content
@@ -759,25 +933,52 @@ IMPORTANT: Output ONLY the complete HTML code. Start with <!DOCTYPE html> and en
                 context
             )
         
-        # Step 4: Generate HTML slides
+        # Step 4: Generate HTML slides (streamed into the output folder as they arrive)
         logger.info("🎭 Creating HTML slide deck...")
-        html_content = self.generate_slides_html(blog_content, purpose, theme)
+        paths = create_organized_output_structure(output_path, topic_slug, timestamp)
+        stream_path = paths['slides'] / "presentation.html"
+        incremental_pipeline = self._create_incremental_pipeline(stream_path) if self.incremental else None
+        
+        html_content = self.generate_slides_html(
+            blog_content, purpose, theme,
+            stream_to=stream_path,
+            on_slide=incremental_pipeline.on_slide if incremental_pipeline else None
+        )
         if not html_content:
             logger.error("❌ Failed to generate slides")
+            if incremental_pipeline:
+                incremental_pipeline.close()
             return None
         
+        # Collect slides validated/rendered during streaming
+        validation_report = None
+        pdf_file = None
+        if incremental_pipeline:
+            html_content, validation_report = incremental_pipeline.finish(
+                html_content,
+                pdf_path=paths['slides'] / "presentation.pdf"
+            )
+            pdf_file = validation_report.get('pdf_file')
+        
         # Apply evolution tools to HTML content if available
         if self.enable_evolution_tools and self.tool_pipeline:
             context = {'topic': user_text, 'purpose': purpose, 'theme': theme}
-            html_content = self.tool_pipeline.execute_stage(
+            processed_html = self.tool_pipeline.execute_stage(
                 ToolStage.POST_HTML,
                 html_content,
                 context
             )
+            if pdf_file and processed_html != html_content:
+                # Slides rendered during streaming no longer match the deck
+                logger.info("🔄 HTML tools changed the deck; discarding incrementally rendered PDF")
+                Path(pdf_file).unlink(missing_ok=True)
+                pdf_file = None
+            html_content = processed_html
         
         # Step 4.5: Validate and fix images
-        validation_report = None
-        if self.enable_image_validation:
+        if incremental_pipeline:
+            logger.info("🖼️ Images were validated slide by slide during generation")
+        elif self.enable_image_validation:
             logger.info("🖼️ Validating and fixing images...")
             try:
                 # Convert HTML to slide format for validation
@@ -814,7 +1015,7 @@ IMPORTANT: Output ONLY the complete HTML code. Start with <!DOCTYPE html> and en
         )
         
         # Step 6: Open in browser (use the organized HTML file)
-        if 'html' in organized_files:
+        if open_browser and 'html' in organized_files:
             logger.info(f"🌐 Opening slides in browser...")
             self.open_in_browser(str(organized_files['html']))
         
@@ -827,7 +1028,8 @@ IMPORTANT: Output ONLY the complete HTML code. Start with <!DOCTYPE html> and en
             'organized_files': organized_files,
             'topic_slug': topic_slug,
             'timestamp': timestamp,
-            'image_validation_report': validation_report
+            'image_validation_report': validation_report,
+            'pdf_file': pdf_file
         }
         
         # Print organized file summary
@@ -7,13 +7,15 @@ import json
 import time
 import re
 import os
+import threading
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
-import anthropic
 
 from opencanvas.image_validation.url_validator import URLValidator
 from opencanvas.image_validation.topic_image_cache import TopicImageCache
 from opencanvas.config import Config
+from opencanvas.llm.clients import get_anthropic_client
+from opencanvas.llm.rate_limit import estimate_message_tokens, get_rate_limiter, usage_tokens
 
 
 class ClaudeImageRetriever:
@@ -42,7 +44,7 @@ class ClaudeImageRetriever:
         
         print(f"  🔑 API key loaded successfully (length: {len(anthropic_api_key)})")
         
-        self.client = anthropic.Anthropic(api_key=anthropic_api_key)
+        self.client = get_anthropic_client(anthropic_api_key)
         self.validator = URLValidator()
         self.cache = cache or TopicImageCache()
         
@@ -106,17 +108,21 @@ QUALITY REQUIREMENTS:
         
         # Track performance
         self.prompt_stats = {k: {"attempts": 0, "successes": 0} for k in self.prompt_templates}
+        self._stats_lock = threading.Lock()  # Slides are validated on several threads
         self.current_strategy = "v2_improved"
     
     def get_best_strategy(self) -> str:
         """Select the best performing prompt strategy."""
         # Calculate success rates
         rates = {}
-        for strategy, stats in self.prompt_stats.items():
-            if stats["attempts"] > 0:
-                rates[strategy] = stats["successes"] / stats["attempts"]
-            else:
-                rates[strategy] = 0.5  # Default rate for untested
+        attempts = {}
+        with self._stats_lock:
+            for strategy, stats in self.prompt_stats.items():
+                attempts[strategy] = stats["attempts"]
+                if stats["attempts"] > 0:
+                    rates[strategy] = stats["successes"] / stats["attempts"]
+                else:
+                    rates[strategy] = 0.5  # Default rate for untested
         
         # If current strategy has > 70% success, keep it
         if rates.get(self.current_strategy, 0) > 0.7:
@@ -124,7 +130,7 @@ QUALITY REQUIREMENTS:
         
         # Otherwise pick the best performer with at least 5 attempts
         tested_strategies = {k: v for k, v in rates.items() 
-                           if self.prompt_stats[k]["attempts"] >= 5}
+                           if attempts[k] >= 5}
         
         if tested_strategies:
             return max(tested_strategies, key=tested_strategies.get)
@@ -245,13 +251,17 @@ QUALITY REQUIREMENTS:
                 # Call Claude
                 print(f"    📝 Prompt preview: {user_prompt[:100]}...")
                 start_time = time.time()
-                message = self.client.messages.create(
-                    model="claude-3-haiku-20240307",  # Fast model for simple tasks
-                    max_tokens=500,
-                    temperature=0.3,  # Lower temperature for more consistent IDs
-                    system=template["system"],
-                    messages=[{"role": "user", "content": user_prompt}]
-                )
+                request = {
+                    "model": "claude-3-haiku-20240307",  # Fast model for simple tasks
+                    "max_tokens": 500,
+                    "temperature": 0.3,  # Lower temperature for more consistent IDs
+                    "system": template["system"],
+                    "messages": [{"role": "user", "content": user_prompt}]
+                }
+                limiter = get_rate_limiter("anthropic", request["model"])
+                with limiter.acquire(estimate_message_tokens(request)) as lease:
+                    message = self.client.messages.create(**request)
+                    lease.settle(usage_tokens(message.usage))
                 response_time = (time.time() - start_time) * 1000
                 
                 # Extract URLs
@@ -276,9 +286,10 @@ QUALITY REQUIREMENTS:
                                 valid_images.append((img_id, confidence))
                     
                     # Update strategy stats
-                    self.prompt_stats[strategy]["attempts"] += 1
-                    if valid_images:
-                        self.prompt_stats[strategy]["successes"] += 1
+                    with self._stats_lock:
+                        self.prompt_stats[strategy]["attempts"] += 1
+                        if valid_images:
+                            self.prompt_stats[strategy]["successes"] += 1
                 
             except Exception as e:
                 print(f"    ❌ Error generating images with {strategy}: {e}")
@@ -345,12 +356,13 @@ QUALITY REQUIREMENTS:
     def get_prompt_stats(self) -> Dict:
         """Get statistics about prompt performance."""
         stats = {}
-        for strategy, data in self.prompt_stats.items():
-            if data["attempts"] > 0:
-                stats[strategy] = {
-                    "attempts": data["attempts"],
-                    "successes": data["successes"],
-                    "success_rate": data["successes"] / data["attempts"],
-                    "is_current": strategy == self.current_strategy
-                }
+        with self._stats_lock:
+            for strategy, data in self.prompt_stats.items():
+                if data["attempts"] > 0:
+                    stats[strategy] = {
+                        "attempts": data["attempts"],
+                        "successes": data["successes"],
+                        "success_rate": data["successes"] / data["attempts"],
+                        "is_current": strategy == self.current_strategy
+                    }
         return stats
\ No newline at end of file
@@ -1,15 +1,22 @@
 """
 Topic-based image cache using DuckDB for efficient storage and retrieval.
 Stores topic-ID pairs instead of full URLs for memory efficiency.
+
+A DuckDB connection must not be used from several threads at once, so each
+thread queries through its own cursor on the shared connection, and writes
+are serialized to avoid write-write conflicts on the metric counters.
 """
 
 import hashlib
 import time
+import threading
 from typing import List, Optional, Tuple, Dict
 from pathlib import Path
 import duckdb
 from datetime import datetime, timedelta
 
+from opencanvas.image_validation.config import ImageValidationConfig
+
 
 class TopicImageCache:
     """Efficient topic-to-image-ID cache using DuckDB."""
@@ -17,10 +24,13 @@ class TopicImageCache:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize the cache with DuckDB connection."""
         if db_path is None:
-            db_path = str(Path(__file__).parent / "topic_images.duckdb")
+            db_path = ImageValidationConfig.DEFAULT_CACHE_DB_PATH
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        self.con = duckdb.connect(db_path)
-        self.con.execute("SET memory_limit='256MB'")
+        self._connection = duckdb.connect(db_path)
+        self._connection.execute("SET memory_limit='256MB'")
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
         self._init_schema()
         
         # Common stopwords for topic normalization
@@ -30,6 +40,14 @@ class TopicImageCache:
             'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did'
         }
     
+    @property
+    def con(self):
+        """DuckDB cursor owned by the calling thread."""
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self._connection.cursor()
+        return cursor
+    
     def _init_schema(self):
         """Initialize database schema."""
         # Main cache table
@@ -142,11 +160,12 @@ class TopicImageCache:
             
             # Increment usage count
             image_ids = [r[0] for r in results]
-            self.con.execute("""
-                UPDATE image_cache
-                SET usage_count = usage_count + 1
-                WHERE topic_hash = ? AND image_id = ANY(?)
-            """, [topic_hash, image_ids])
+            with self._write_lock:
+                self.con.execute("""
+                    UPDATE image_cache
+                    SET usage_count = usage_count + 1
+                    WHERE topic_hash = ? AND image_id = ANY(?)
+                """, [topic_hash, image_ids])
             
             return [(r[0], r[1]) for r in results]
         
@@ -167,19 +186,20 @@ class TopicImageCache:
         topic_hash = self.get_topic_hash(topic_text)
         normalized = self.normalize_topic(topic_text)
         
-        # Store topic mapping if new
-        self.con.execute("""
-            INSERT OR IGNORE INTO topic_mappings (topic_hash, topic_text, normalized_text)
-            VALUES (?, ?, ?)
-        """, [topic_hash, topic_text, normalized])
-        
-        # Insert images
-        for image_id, source, valid, confidence in images:
+        with self._write_lock:
+            # Store topic mapping if new
             self.con.execute("""
-                INSERT OR REPLACE INTO image_cache 
-                (topic_hash, image_id, source, valid, last_validated, confidence_score)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, [topic_hash, image_id, source, valid, datetime.now(), confidence])
+                INSERT OR IGNORE INTO topic_mappings (topic_hash, topic_text, normalized_text)
+                VALUES (?, ?, ?)
+            """, [topic_hash, topic_text, normalized])
+            
+            # Insert images
+            for image_id, source, valid, confidence in images:
+                self.con.execute("""
+                    INSERT OR REPLACE INTO image_cache 
+                    (topic_hash, image_id, source, valid, last_validated, confidence_score)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [topic_hash, image_id, source, valid, datetime.now(), confidence])
     
     def find_similar_topics(
         self, 
@@ -298,36 +318,40 @@ class TopicImageCache:
         """Remove entries not used in specified days."""
         cutoff = datetime.now() - timedelta(days=days)
         
-        deleted = self.con.execute("""
-            DELETE FROM image_cache
-            WHERE last_validated < ?
-            AND usage_count < 5
-        """, [cutoff]).fetchone()
+        with self._write_lock:
+            deleted = self.con.execute("""
+                DELETE FROM image_cache
+                WHERE last_validated < ?
+                AND usage_count < 5
+            """, [cutoff]).fetchone()
         
         return deleted[0] if deleted else 0
     
     def _record_lookup(self):
         """Record a cache lookup."""
-        self.con.execute("""
-            INSERT INTO cache_metrics (metric_date, total_lookups)
-            VALUES (CURRENT_DATE, 1)
-            ON CONFLICT (metric_date) 
-            DO UPDATE SET total_lookups = total_lookups + 1
-        """)
+        with self._write_lock:
+            self.con.execute("""
+                INSERT INTO cache_metrics (metric_date, total_lookups)
+                VALUES (CURRENT_DATE, 1)
+                ON CONFLICT (metric_date) 
+                DO UPDATE SET total_lookups = total_lookups + 1
+            """)
     
     def _record_cache_hit(self):
         """Record a cache hit."""
-        self.con.execute("""
-            UPDATE cache_metrics
-            SET cache_hits = cache_hits + 1
-            WHERE metric_date = CURRENT_DATE
-        """)
+        with self._write_lock:
+            self.con.execute("""
+                UPDATE cache_metrics
+                SET cache_hits = cache_hits + 1
+                WHERE metric_date = CURRENT_DATE
+            """)
     
     def record_claude_call(self):
         """Record when Claude is called for image generation."""
-        self.con.execute("""
-            INSERT INTO cache_metrics (metric_date, claude_calls)
-            VALUES (CURRENT_DATE, 1)
-            ON CONFLICT (metric_date)
-            DO UPDATE SET claude_calls = claude_calls + 1
-        """)
\ No newline at end of file
+        with self._write_lock:
+            self.con.execute("""
+                INSERT INTO cache_metrics (metric_date, claude_calls)
+                VALUES (CURRENT_DATE, 1)
+                ON CONFLICT (metric_date)
+                DO UPDATE SET claude_calls = claude_calls + 1
+            """)
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""LLM request plumbing shared by generators and evaluators"""
+
+from opencanvas.llm.transport import (
+    DirectTransport,
+    MessageBatchTransport,
+    BatchRequestError,
+    get_transport,
+    message_text,
+)
+from opencanvas.llm.clients import (
+    close_clients,
+    get_anthropic_client,
+    get_http_client,
+)
+from opencanvas.llm.rate_limit import (
+    RateLimiter,
+    get_rate_limiter,
+    get_rate_limit_stats,
+)
+from opencanvas.llm.prompt_cache import (
+    PromptCacheMetrics,
+    cache_metrics,
+    cached_system,
+    split_template,
+)
+
+__all__ = [
+    'DirectTransport',
+    'MessageBatchTransport',
+    'BatchRequestError',
+    'get_transport',
+    'message_text',
+    'close_clients',
+    'get_anthropic_client',
+    'get_http_client',
+    'RateLimiter',
+    'get_rate_limiter',
+    'get_rate_limit_stats',
+    'PromptCacheMetrics',
+    'cache_metrics',
+    'cached_system',
+    'split_template',
+]
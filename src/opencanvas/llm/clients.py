@@ -0,0 +1,86 @@
+"""
+Shared Anthropic client registry.
+
+Every component used to build its own Anthropic client, so each generator,
+evaluator, editor and agent opened (and TLS-negotiated) its own connections.
+get_anthropic_client() hands out one client per API key, and all clients send
+their requests through a single pooled HTTP client with keep-alive, so
+connections are reused across components and requests. Retries use the SDK's
+exponential backoff (which honours retry-after headers) with one process-wide
+retry count.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+import logging
+
+import anthropic
+import httpx
+
+from opencanvas.config import Config
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_clients: Dict[Tuple[str, Optional[str]], anthropic.Anthropic] = {}
+
+
+def get_http_client() -> httpx.Client:
+    """Return the pooled HTTP client shared by all Anthropic clients."""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = _create_http_client()
+        return _http_client
+
+
+def _create_http_client() -> httpx.Client:
+    limits = httpx.Limits(
+        max_connections=Config.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=Config.LLM_KEEPALIVE_SECONDS,
+    )
+    logger.info(f"🔌 LLM connection pool: {Config.LLM_MAX_CONNECTIONS} connections, "
+                f"{Config.LLM_MAX_KEEPALIVE_CONNECTIONS} keep-alive")
+    return anthropic.DefaultHttpxClient(limits=limits, timeout=Config.LLM_TIMEOUT_SECONDS)
+
+
+def get_anthropic_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> anthropic.Anthropic:
+    """
+    Return the shared Anthropic client for an API key.
+
+    Args:
+        api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+        base_url: Optional API base URL override
+
+    Returns:
+        Anthropic client using the shared connection pool and retry policy
+    """
+    api_key = api_key or Config.ANTHROPIC_API_KEY
+    if not api_key:
+        raise ValueError("No Anthropic API key found. Check Config.ANTHROPIC_API_KEY or provide key directly.")
+
+    http_client = get_http_client()
+    with _lock:
+        client = _clients.get((api_key, base_url))
+        if client is None:
+            client = anthropic.Anthropic(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=http_client,
+                max_retries=Config.LLM_MAX_RETRIES,
+                timeout=Config.LLM_TIMEOUT_SECONDS,
+            )
+            _clients[(api_key, base_url)] = client
+        return client
+
+
+def close_clients():
+    """Close the shared connection pool and forget all clients."""
+    global _http_client
+    with _lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
@@ -0,0 +1,122 @@
+"""
+Prompt-cache-aware request construction.
+
+Generation prompts are long, mostly static instruction templates with a few
+placeholders ({blog_content}, {purpose}, {theme}, ...). Interpolating the
+values into the template makes every request unique from the first variable
+onwards, so nothing can be served from the prompt cache. split_template()
+instead turns the template into a static instruction block in which every
+placeholder becomes a reference to a tagged input (<theme>, ...), and moves the
+values into a separate block that is sent last. The static block is sent as a
+system prompt carrying a cache_control marker.
+"""
+
+import threading
+from string import Formatter
+from typing import Any, Dict, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def split_template(template: str, variables: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Split a str.format template into static instructions and variable inputs.
+
+    Args:
+        template: Prompt template with {name} placeholders (literal braces doubled)
+        variables: Values for the placeholders
+
+    Returns:
+        Tuple of (static_instructions, variable_inputs). The static part only
+        depends on the template, so it is identical across requests.
+    """
+    static_parts = []
+    fields = []
+    for literal, field_name, _, _ in Formatter().parse(template):
+        static_parts.append(literal)
+        if field_name is not None:
+            static_parts.append(f"<{field_name}>")
+            if field_name not in fields:
+                fields.append(field_name)
+
+    missing = [name for name in fields if name not in variables]
+    if missing:
+        raise KeyError(f"Missing prompt variables: {', '.join(missing)}")
+
+    static = ''.join(static_parts)
+    if fields:
+        tags = ', '.join(f"<{name}>" for name in fields)
+        static += f"\n\nThe inputs referenced above as {tags} are provided in the user message."
+
+    inputs = "\n\n".join(f"<{name}>\n{variables[name]}\n</{name}>" for name in fields)
+    return static, inputs
+
+
+def cached_system(text: str) -> List[Dict[str, Any]]:
+    """Wrap static instructions as a system prompt block marked for prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+class PromptCacheMetrics:
+    """Thread-safe accumulator of prompt cache usage across requests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.input_tokens = 0
+        self.cache_read_input_tokens = 0
+        self.cache_creation_input_tokens = 0
+        self.output_tokens = 0
+
+    def record(self, usage, label: str = "request") -> Dict[str, int]:
+        """
+        Record the usage block of one response.
+
+        Args:
+            usage: Usage object (or dict) from a Messages API response
+            label: Name used in the log line
+
+        Returns:
+            The token counts recorded for this request
+        """
+        if usage is None:
+            return {}
+
+        def read(name):
+            value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+            return value or 0
+
+        counts = {
+            'input_tokens': read('input_tokens'),
+            'cache_read_input_tokens': read('cache_read_input_tokens'),
+            'cache_creation_input_tokens': read('cache_creation_input_tokens'),
+            'output_tokens': read('output_tokens'),
+        }
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += counts['input_tokens']
+            self.cache_read_input_tokens += counts['cache_read_input_tokens']
+            self.cache_creation_input_tokens += counts['cache_creation_input_tokens']
+            self.output_tokens += counts['output_tokens']
+
+        logger.info(f"💾 Prompt cache ({label}): read {counts['cache_read_input_tokens']}, "
+                    f"wrote {counts['cache_creation_input_tokens']}, uncached {counts['input_tokens']} input tokens")
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return totals and the share of prompt tokens served from cache."""
+        with self._lock:
+            prompt_tokens = self.input_tokens + self.cache_read_input_tokens + self.cache_creation_input_tokens
+            return {
+                'requests': self.requests,
+                'input_tokens': self.input_tokens,
+                'cache_read_input_tokens': self.cache_read_input_tokens,
+                'cache_creation_input_tokens': self.cache_creation_input_tokens,
+                'output_tokens': self.output_tokens,
+                'cache_read_ratio': self.cache_read_input_tokens / prompt_tokens if prompt_tokens else 0.0,
+            }
+
+
+# Process-wide totals for all generation requests
+cache_metrics = PromptCacheMetrics()
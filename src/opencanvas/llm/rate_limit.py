@@ -0,0 +1,300 @@
+"""
+Process-wide rate limiting for LLM provider calls.
+
+Every call to a provider goes through the RateLimiter for its provider/model,
+which enforces requests-per-minute and tokens-per-minute with token buckets,
+optionally caps the number of calls in flight, and admits waiting callers in
+FIFO order so that nobody is starved while the quota refills. Token costs are
+estimated before a call and corrected with the real usage afterwards.
+
+Limits come from LLM_RATE_LIMITS, a comma separated list of
+"provider[/model]=RPM:TPM[:CONCURRENCY]" entries (0 means unlimited), e.g.
+
+    LLM_RATE_LIMITS=anthropic=50:40000:8,gemini=60:1000000,openai/gpt-4.1=500:30000
+
+A provider/model entry takes precedence over the provider entry. Limits are
+shared by all threads of one process; separate processes have separate quotas.
+"""
+
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from opencanvas.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Rough token estimates used before the real usage is known
+CHARS_PER_TOKEN = 4
+ATTACHMENT_TOKENS = 1600
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to one minute of quota."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be taken (requests larger than the bucket wait for a full bucket)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        needed = min(amount, self.capacity)
+        return 0.0 if self.level >= needed else (needed - self.level) / self.rate
+
+    def take(self, amount: float):
+        if not self.unlimited:
+            self._refill()
+            self.level -= amount
+
+    def give_back(self, amount: float):
+        if not self.unlimited:
+            self._refill()
+            self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimitLease:
+    """Handle for one admitted call, used to report the tokens actually used."""
+
+    def __init__(self, limiter: 'RateLimiter', reserved_tokens: int):
+        self.limiter = limiter
+        self.reserved_tokens = reserved_tokens
+        self.settled = False
+
+    def settle(self, actual_tokens: Optional[int]):
+        """Replace the estimated token cost with the real one."""
+        if actual_tokens is None or self.settled:
+            return
+        self.settled = True
+        self.limiter._settle(self.reserved_tokens, actual_tokens)
+
+
+class RateLimiter:
+    """Requests/tokens per minute and concurrency limits with FIFO admission."""
+
+    def __init__(self, name: str, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_concurrency: int = 0):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Name used in logs and metrics (e.g. "anthropic/claude-sonnet-4")
+            requests_per_minute: Request quota (0 for unlimited)
+            tokens_per_minute: Token quota (0 for unlimited)
+            max_concurrency: Maximum calls in flight (0 for unlimited)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._condition = threading.Condition()
+        self._queue = deque()
+
+        self.active = 0
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.total_wait_seconds = 0.0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    @contextmanager
+    def acquire(self, tokens: int = 0):
+        """
+        Wait for a slot, then hold it for the duration of the with block.
+
+        Args:
+            tokens: Estimated token cost of the call
+
+        Yields:
+            RateLimitLease whose settle() reports the real token usage
+        """
+        ticket = object()
+        started = time.monotonic()
+        with self._condition:
+            self._queue.append(ticket)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+
+            admitted = False
+            try:
+                while True:
+                    if self._queue[0] is ticket:
+                        wait = self._admission_wait(tokens)
+                        if wait == 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                admitted = True
+            finally:
+                # An interrupted waiter must not block the callers queued behind it
+                if not admitted:
+                    self._queue.remove(ticket)
+                    self._condition.notify_all()
+
+            self._queue.popleft()
+            self._requests.take(1)
+            self._tokens.take(tokens)
+            self.active += 1
+            self.total_requests += 1
+            self.total_tokens += tokens
+            waited = time.monotonic() - started
+            self.total_wait_seconds += waited
+            self._condition.notify_all()
+
+        if waited >= 1:
+            logger.info(f"⏳ {self.name}: waited {waited:.1f}s for rate limit ({len(self._queue)} still queued)")
+
+        try:
+            yield RateLimitLease(self, tokens)
+        finally:
+            with self._condition:
+                self.active -= 1
+                self._condition.notify_all()
+
+    def _admission_wait(self, tokens: int) -> Optional[float]:
+        """Seconds the head of the queue must wait; None while the concurrency cap is reached."""
+        if self.max_concurrency and self.active >= self.max_concurrency:
+            return None
+        return max(self._requests.wait_time(1), self._tokens.wait_time(tokens))
+
+    def _settle(self, reserved_tokens: int, actual_tokens: int):
+        with self._condition:
+            difference = actual_tokens - reserved_tokens
+            if difference > 0:
+                self._tokens.take(difference)
+            else:
+                self._tokens.give_back(-difference)
+            self.total_tokens += difference
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue depth and throughput metrics."""
+        with self._condition:
+            return {
+                'name': self.name,
+                'queue_depth': len(self._queue),
+                'max_queue_depth': self.max_queue_depth,
+                'active': self.active,
+                'requests': self.total_requests,
+                'tokens': self.total_tokens,
+                'total_wait_seconds': self.total_wait_seconds,
+                'requests_per_minute': self.requests_per_minute,
+                'tokens_per_minute': self.tokens_per_minute,
+                'max_concurrency': self.max_concurrency,
+            }
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[float, float, int]]:
+    """
+    Parse an LLM_RATE_LIMITS value.
+
+    Args:
+        spec: Comma separated "provider[/model]=RPM:TPM[:CONCURRENCY]" entries
+
+    Returns:
+        Dict mapping "provider" or "provider/model" to (rpm, tpm, concurrency)
+    """
+    limits = {}
+    for entry in filter(None, (part.strip() for part in (spec or '').split(','))):
+        key, _, values = entry.partition('=')
+        numbers = values.split(':')
+        if not key or not 2 <= len(numbers) <= 3:
+            raise ValueError(f"Invalid rate limit '{entry}' (expected provider[/model]=RPM:TPM[:CONCURRENCY])")
+        concurrency = int(numbers[2]) if len(numbers) == 3 else 0
+        limits[key.strip().lower()] = (float(numbers[0]), float(numbers[1]), concurrency)
+    return limits
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+_configured_limits: Optional[Dict[str, Tuple[float, float, int]]] = None
+
+
+def get_rate_limiter(provider: str, model: Optional[str] = None) -> RateLimiter:
+    """
+    Return the process-wide limiter for a provider/model.
+
+    Args:
+        provider: 'anthropic', 'openai' or 'gemini'
+        model: Model name; models without their own entry share the provider limits
+    """
+    global _configured_limits
+    provider = provider.lower()
+    with _limiters_lock:
+        if _configured_limits is None:
+            _configured_limits = parse_rate_limits(Config.LLM_RATE_LIMITS)
+
+        model_key = f"{provider}/{model.lower()}" if model else None
+        key = model_key if model_key in _configured_limits else provider
+        limiter = _limiters.get(key)
+        if limiter is None:
+            rpm, tpm, concurrency = _configured_limits.get(key, (0, 0, 0))
+            limiter = RateLimiter(key, rpm, tpm, concurrency)
+            _limiters[key] = limiter
+        return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Return metrics for every limiter created so far."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.get_stats() for limiter in limiters}
+
+
+def estimate_tokens(*texts: str, attachments: int = 0, max_tokens: int = 0) -> int:
+    """Estimate the token cost of a call from its text, attachment count and output budget."""
+    chars = sum(len(text) for text in texts if text)
+    return chars // CHARS_PER_TOKEN + attachments * ATTACHMENT_TOKENS + max_tokens
+
+
+def estimate_message_tokens(params: Dict[str, Any]) -> int:
+    """Estimate the token cost of an Anthropic Messages API request."""
+    texts = []
+    attachments = 0
+
+    def collect(content):
+        nonlocal attachments
+        if isinstance(content, str):
+            texts.append(content)
+            return
+        for block in content or []:
+            if block.get('type') == 'text':
+                texts.append(block.get('text', ''))
+            else:
+                attachments += 1
+
+    collect(params.get('system'))
+    for message in params.get('messages', []):
+        collect(message.get('content'))
+    return estimate_tokens(*texts, attachments=attachments, max_tokens=params.get('max_tokens', 0))
+
+
+def usage_tokens(usage) -> Optional[int]:
+    """Total tokens (input, cached input and output) in an Anthropic usage object or dict."""
+    if usage is None:
+        return None
+    names = ('input_tokens', 'cache_read_input_tokens', 'cache_creation_input_tokens', 'output_tokens')
+    read = usage.get if isinstance(usage, dict) else lambda name: getattr(usage, name, None)
+    return sum(read(name) or 0 for name in names)
@@ -0,0 +1,229 @@
+"""
+Pluggable transports for Anthropic Messages API calls.
+
+DirectTransport sends each request immediately (the default, interactive path),
+subject to the provider rate limits in opencanvas.llm.rate_limit.
+MessageBatchTransport collects requests issued concurrently by many callers,
+submits them together as a Message Batch, polls until the batch has ended and
+hands every result back to the caller that issued it. Callers keep their
+synchronous code: create() simply blocks until the batch containing the
+request has finished. Batches trade latency for higher throughput limits and
+lower cost, so they are meant for offline jobs (batch generation, evolution,
+bulk evaluation).
+"""
+
+import time
+import threading
+import itertools
+import weakref
+from concurrent.futures import Future
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+
+from opencanvas.config import Config
+from opencanvas.llm.rate_limit import estimate_message_tokens, get_rate_limiter, usage_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequestError(RuntimeError):
+    """A request inside a message batch did not succeed"""
+
+
+def message_text(message) -> str:
+    """Concatenate the text blocks of a Messages API response."""
+    return ''.join(getattr(block, 'text', '') for block in message.content if getattr(block, 'type', 'text') == 'text')
+
+
+class DirectTransport:
+    """Sends every request straight to the Messages API."""
+
+    name = "direct"
+
+    def __init__(self, client):
+        self.client = client
+
+    def create(self, **params):
+        """Send one request and return the Message."""
+        limiter = get_rate_limiter("anthropic", params.get('model'))
+        with limiter.acquire(estimate_message_tokens(params)) as lease:
+            message = self.client.messages.create(**params)
+            lease.settle(usage_tokens(getattr(message, 'usage', None)))
+        return message
+
+    def stream(self, **params) -> Iterator:
+        """Send one request and yield its stream of events."""
+        limiter = get_rate_limiter("anthropic", params.get('model'))
+        with limiter.acquire(estimate_message_tokens(params)) as lease:
+            usage = {}
+            for event in self.client.messages.create(stream=True, **params):
+                event_usage = getattr(getattr(event, 'message', None), 'usage', None) or getattr(event, 'usage', None)
+                for name in ('input_tokens', 'cache_read_input_tokens', 'cache_creation_input_tokens', 'output_tokens'):
+                    value = getattr(event_usage, name, None)
+                    if value is not None:
+                        usage[name] = value
+                yield event
+            lease.settle(usage_tokens(usage) if usage else None)
+
+    def close(self):
+        pass
+
+
+class MessageBatchTransport:
+    """Aggregates concurrent requests into Message Batches."""
+
+    name = "batch"
+
+    def __init__(self, client, max_batch_size: int = None, max_wait_seconds: float = None,
+                 poll_interval: float = None, timeout: float = 24 * 3600):
+        """
+        Initialize the batch transport.
+
+        Args:
+            client: Anthropic client (must expose client.messages.batches)
+            max_batch_size: Submit as soon as this many requests are waiting
+            max_wait_seconds: Submit at most this long after the first request is queued
+            poll_interval: Seconds between batch status checks
+            timeout: Give up on a batch after this many seconds
+        """
+        if not hasattr(getattr(client, 'messages', None), 'batches'):
+            raise RuntimeError("This anthropic SDK version does not support message batches")
+
+        self.client = client
+        self.max_batch_size = max_batch_size or Config.LLM_BATCH_MAX_SIZE
+        self.max_wait_seconds = Config.LLM_BATCH_MAX_WAIT_SECONDS if max_wait_seconds is None else max_wait_seconds
+        self.poll_interval = Config.LLM_BATCH_POLL_SECONDS if poll_interval is None else poll_interval
+        self.timeout = timeout
+
+        self._ids = itertools.count(1)
+        self._pending: List[Tuple[str, Dict[str, Any], Future]] = []
+        self._first_pending_at: Optional[float] = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="message-batch-flusher", daemon=True)
+        self._flusher.start()
+
+    def create(self, **params):
+        """Queue one request and block until its batch has produced a result."""
+        return self.submit(**params).result()
+
+    def submit(self, **params) -> Future:
+        """Queue one request; the returned Future resolves to the Message."""
+        params.pop('stream', None)
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MessageBatchTransport is closed")
+            custom_id = f"req-{next(self._ids)}"
+            self._pending.append((custom_id, params, future))
+            if self._first_pending_at is None:
+                self._first_pending_at = time.time()
+            self._condition.notify_all()
+        return future
+
+    def stream(self, **params) -> Iterator:
+        """
+        Batch equivalent of a streaming call.
+
+        Batches do not stream, so the complete text is delivered as a single
+        content_block_delta event once the batch has ended.
+        """
+        message = self.create(**params)
+        yield SimpleNamespace(type="message_start", message=message)
+        yield SimpleNamespace(
+            type="content_block_delta",
+            index=0,
+            delta=SimpleNamespace(type="text_delta", text=message_text(message))
+        )
+        yield SimpleNamespace(type="message_stop")
+
+    def _flush_loop(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed and not self._pending:
+                    return
+
+                # Give other callers a chance to join this batch
+                while (not self._closed and len(self._pending) < self.max_batch_size
+                       and time.time() - self._first_pending_at < self.max_wait_seconds):
+                    self._condition.wait(self.max_wait_seconds - (time.time() - self._first_pending_at))
+
+                batch = self._pending[:self.max_batch_size]
+                self._pending = self._pending[self.max_batch_size:]
+                self._first_pending_at = time.time() if self._pending else None
+
+            threading.Thread(target=self._run_batch, args=(batch,), name="message-batch", daemon=True).start()
+
+    def _run_batch(self, batch: List[Tuple[str, Dict[str, Any], Future]]):
+        futures = {custom_id: future for custom_id, _, future in batch}
+        try:
+            message_batch = self.client.messages.batches.create(
+                requests=[{'custom_id': custom_id, 'params': params} for custom_id, params, _ in batch]
+            )
+            logger.info(f"📦 Submitted message batch {message_batch.id} with {len(batch)} requests")
+
+            deadline = time.time() + self.timeout
+            while message_batch.processing_status != "ended":
+                if time.time() > deadline:
+                    self.client.messages.batches.cancel(message_batch.id)
+                    raise TimeoutError(f"Message batch {message_batch.id} did not finish in {self.timeout:.0f}s")
+                time.sleep(self.poll_interval)
+                message_batch = self.client.messages.batches.retrieve(message_batch.id)
+
+            for entry in self.client.messages.batches.results(message_batch.id):
+                future = futures.pop(entry.custom_id, None)
+                if future is None:
+                    continue
+                result = entry.result
+                if result.type == "succeeded":
+                    future.set_result(result.message)
+                else:
+                    detail = getattr(result, 'error', None)
+                    future.set_exception(BatchRequestError(f"Batch request {entry.custom_id} {result.type}: {detail}"))
+
+            logger.info(f"✅ Message batch {message_batch.id} ended")
+        except Exception as e:
+            logger.error(f"Message batch failed: {e}")
+            for future in futures.values():
+                future.set_exception(e)
+            futures.clear()
+
+        for custom_id, future in futures.items():
+            future.set_exception(BatchRequestError(f"No result returned for batch request {custom_id}"))
+
+    def close(self):
+        """Submit anything still queued and stop the flusher thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._flusher.join()
+
+
+# One batch queue per client so every component using a client shares its batches
+_batch_transports = weakref.WeakKeyDictionary()
+_batch_transports_lock = threading.Lock()
+
+
+def get_transport(client, mode: Optional[str] = None):
+    """
+    Return the transport for a client.
+
+    Args:
+        client: Anthropic client
+        mode: 'direct' or 'batch' (defaults to LLM_TRANSPORT)
+    """
+    mode = (mode or Config.LLM_TRANSPORT).lower()
+    if mode == "direct":
+        return DirectTransport(client)
+    if mode != "batch":
+        raise ValueError(f"Unknown LLM transport '{mode}' (expected 'direct' or 'batch')")
+
+    with _batch_transports_lock:
+        transport = _batch_transports.get(client)
+        if transport is None:
+            transport = MessageBatchTransport(client)
+            _batch_transports[client] = transport
+        return transport
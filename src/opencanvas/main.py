@@ -36,9 +36,15 @@ Examples:
   # Evaluate presentation with GPT
   opencanvas evaluate ./test_data --model gpt-4.1-mini --eval_provider gpt
   
+  # Evaluate every presentation under a directory (resumable)
+  opencanvas evaluate-batch output/ --workers 8
+  
   # Full pipeline
   opencanvas pipeline "quantum computing" --purpose "pitch deck" --evaluate
   
+  # Batch generation from a JSONL manifest (resumable)
+  opencanvas batch topics.jsonl --workers 8 --provider-limit anthropic=4
+  
   # Start API server
   opencanvas api --host 0.0.0.0 --port 8000 --reload
   
@@ -78,6 +84,17 @@ Examples:
     eval_parser.add_argument('--output', help='Output JSON file path (optional)')
     eval_parser.add_argument('--model', default=Config.EVALUATION_MODEL, help='model for evaluation')
     eval_parser.add_argument('--eval_provider', default=Config.EVALUATION_PROVIDER, help='model provider for evaluation')
+    eval_parser.add_argument('--no-cache', action='store_true', help='Re-run evaluations even when EVALUATION_CACHE_ENABLED=true would reuse cached results (off by default)')
+    
+    # Evaluate-batch command
+    eval_batch_parser = subparsers.add_parser('evaluate-batch', help='Evaluate every presentation under a directory')
+    eval_batch_parser.add_argument('root', help='Directory searched for presentation.pdf (with optional source.pdf)')
+    eval_batch_parser.add_argument('--results', help='Results JSONL (default: <root>/evaluation_results.jsonl); rerun to resume')
+    eval_batch_parser.add_argument('--workers', type=int, default=Config.EVALUATION_BATCH_WORKERS, help='Concurrent evaluations')
+    eval_batch_parser.add_argument('--retries', type=int, default=Config.BATCH_MAX_RETRIES, help='Retries per failed presentation')
+    eval_batch_parser.add_argument('--model', default=Config.EVALUATION_MODEL, help='model for evaluation')
+    eval_batch_parser.add_argument('--eval_provider', default=Config.EVALUATION_PROVIDER, help='model provider for evaluation')
+    eval_batch_parser.add_argument('--no-cache', action='store_true', help='Re-run evaluations even when EVALUATION_CACHE_ENABLED=true would reuse cached results (off by default)')
     
     # Pipeline command (generate + convert + optionally evaluate)
     pipe_parser = subparsers.add_parser('pipeline', help='Complete pipeline: generate -> convert -> evaluate')
@@ -93,6 +110,16 @@ Examples:
                            default=Config.DEFAULT_CONVERSION_METHOD, help='Conversion method')
     pipe_parser.add_argument('--no-extract-images', action='store_true', help='Disable image extraction from PDF (PDF input only)')
     
+    # Batch command
+    batch_parser = subparsers.add_parser('batch', help='Generate many presentations from a JSONL manifest')
+    batch_parser.add_argument('manifest', help='JSONL file with one {"input": ..., "purpose": ..., "theme": ...} object per line')
+    batch_parser.add_argument('--output-dir', default=str(Config.OUTPUT_DIR), help='Base output directory (one folder per item)')
+    batch_parser.add_argument('--results', help='Results manifest (default: <output-dir>/batch_results.jsonl); rerun to resume')
+    batch_parser.add_argument('--workers', type=int, default=Config.BATCH_MAX_WORKERS, help='Concurrent generations')
+    batch_parser.add_argument('--retries', type=int, default=Config.BATCH_MAX_RETRIES, help='Retries per failed item')
+    batch_parser.add_argument('--provider-limit', action='append', default=[], metavar='PROVIDER=N',
+                              help='Maximum concurrent items per provider, e.g. anthropic=4 (repeatable)')
+    
     # API command
     api_parser = subparsers.add_parser('api', help='Start the REST API server')
     api_parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
@@ -132,8 +159,12 @@ Examples:
             return handle_convert(args, logger)
         elif args.command == 'evaluate':
             return handle_evaluate(args, logger)
+        elif args.command == 'evaluate-batch':
+            return handle_evaluate_batch(args, logger)
         elif args.command == 'pipeline':
             return handle_pipeline(args, logger)
+        elif args.command == 'batch':
+            return handle_batch(args, logger)
         elif args.command == 'api':
             return handle_api(args, logger)
         elif args.command == 'evolve':
@@ -213,10 +244,8 @@ def handle_convert(args, logger):
     print(f"📏 Zoom level: {args.zoom*100:.0f}%")
     return 0
 
-def handle_evaluate(args, logger):
-    """Handle evaluate command - uses Config for provider consistency"""
-    logger.info(f"📊 Evaluating presentation: {args.eval_folder}")
-    
+def resolve_evaluation_provider(args, logger):
+    """Resolve (provider, model, api_key) for evaluation from args and Config, or None if unusable"""
     # Use Config for provider consistency (same as pipeline)
     from opencanvas.config import Config
     
@@ -229,22 +258,22 @@ def handle_evaluate(args, logger):
         api_key = Config.ANTHROPIC_API_KEY
         if not api_key:
             logger.error("ANTHROPIC_API_KEY is required for Claude evaluation")
-            return 1
+            return None
             
     elif provider == "gpt":
         api_key = Config.OPENAI_API_KEY
         if not api_key:
             logger.error("OPENAI_API_KEY is required for GPT evaluation")
-            return 1
+            return None
             
     elif provider == "gemini":
         api_key = Config.GEMINI_API_KEY
         if not api_key:
             logger.error("GEMINI_API_KEY is required for Gemini evaluation")
-            return 1
+            return None
     else:
         logger.error(f"Unknown provider: {provider}. Use 'claude', 'gpt', or 'gemini'")
-        return 1
+        return None
     
     # Validate model matches provider
     model_provider_map = {
@@ -270,6 +299,17 @@ def handle_evaluate(args, logger):
     
     logger.info(f"Using {provider} provider with model {model} for evaluation")
     
+    return provider, model, api_key
+
+def handle_evaluate(args, logger):
+    """Handle evaluate command - uses Config for provider consistency"""
+    logger.info(f"📊 Evaluating presentation: {args.eval_folder}")
+    
+    resolved = resolve_evaluation_provider(args, logger)
+    if resolved is None:
+        return 1
+    provider, model, api_key = resolved
+    
     # Check if we have an organized structure or flat structure
     eval_path = Path(args.eval_folder)
     slides_folder = eval_path / "slides"
@@ -281,7 +321,8 @@ def handle_evaluate(args, logger):
         evaluator = PresentationEvaluator(
             api_key=api_key,
             model=model,
-            provider=provider  # Use resolved provider, not args
+            provider=provider,  # Use resolved provider, not args
+            use_cache=False if args.no_cache else None
         )
         
         # Find the files in organized structure
@@ -311,7 +352,8 @@ def handle_evaluate(args, logger):
         evaluator = PresentationEvaluator(
             api_key=api_key,
             model=model,
-            provider=provider  # Use resolved provider, not args
+            provider=provider,  # Use resolved provider, not args
+            use_cache=False if args.no_cache else None
         )
         
         result = evaluator.evaluate_presentation(args.eval_folder)
@@ -331,6 +373,47 @@ def handle_evaluate(args, logger):
     
     return 0
 
+def handle_evaluate_batch(args, logger):
+    """Handle evaluate-batch command - evaluate every presentation under a directory"""
+    from opencanvas.evaluation.batch import EvaluationBatchRunner, average_scores, find_presentations
+    
+    root = Path(args.root)
+    if not root.is_dir():
+        logger.error(f"Not a directory: {root}")
+        return 1
+    
+    resolved = resolve_evaluation_provider(args, logger)
+    if resolved is None:
+        return 1
+    provider, model, api_key = resolved
+    
+    items = find_presentations(root)
+    if not items:
+        logger.error(f"No presentation.pdf found under {root}")
+        return 1
+    logger.info(f"📊 Found {len(items)} presentations under {root}")
+    
+    results_path = Path(args.results) if args.results else root / "evaluation_results.jsonl"
+    
+    # One evaluator for the whole batch so every worker shares its clients, cache and rate limits
+    evaluator = PresentationEvaluator(
+        api_key=api_key,
+        model=model,
+        provider=provider,
+        use_cache=False if args.no_cache else None
+    )
+    runner = EvaluationBatchRunner(evaluator, max_workers=args.workers, max_retries=args.retries)
+    results = runner.run(items, results_path=results_path)
+    
+    failed = [result for result in results if result.status != 'success']
+    print(f"✅ Evaluation batch finished: {len(results) - len(failed)} evaluated, {len(failed)} failed")
+    for name, value in average_scores(results).items():
+        print(f"   {name}: {value:.2f}/5.0")
+    print(f"📄 Results: {results_path}")
+    for result in failed:
+        print(f"❌ {result.id}: {result.error}")
+    return 1 if failed else 0
+
 def handle_pipeline(args, logger):
     """Handle pipeline command - full workflow with organized outputs"""
     from opencanvas.utils.file_utils import organize_pipeline_outputs, get_file_summary
@@ -377,15 +460,20 @@ def handle_pipeline(args, logger):
         html_source = html_file
         pdf_output_dir = args.output_dir
     
-    converter = PresentationConverter(
-        html_file=html_source,
-        output_dir=str(pdf_output_dir),
-        method=args.method,
-        zoom_factor=args.zoom
-    )
-    
-    pdf_filename = "presentation.pdf"
-    pdf_path = converter.convert(output_filename=pdf_filename)
+    if gen_result.get('pdf_file') and args.method == 'playwright' and args.zoom == Config.DEFAULT_ZOOM:
+        # Incremental mode already rendered every slide while generating
+        pdf_path = gen_result['pdf_file']
+        logger.info("Slides were rendered during generation, skipping conversion")
+    else:
+        converter = PresentationConverter(
+            html_file=html_source,
+            output_dir=str(pdf_output_dir),
+            method=args.method,
+            zoom_factor=args.zoom
+        )
+
+        pdf_filename = "presentation.pdf"
+        pdf_path = converter.convert(output_filename=pdf_filename)
     print(f"✅ Step 2 complete: {pdf_path}")
     
     # Update organized files with PDF path
@@ -487,6 +575,51 @@ def handle_pipeline(args, logger):
     
     return 0
 
+def handle_batch(args, logger):
+    """Handle batch command - generate every item of a JSONL manifest"""
+    from opencanvas.generators.batch import load_manifest
+    
+    if not Config.ANTHROPIC_API_KEY:
+        logger.error("ANTHROPIC_API_KEY is required for generation")
+        return 1
+    
+    try:
+        items = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not read manifest: {e}")
+        return 1
+    
+    provider_limits = {}
+    for limit in args.provider_limit:
+        provider, _, value = limit.partition('=')
+        if not value.isdigit() or int(value) < 1:
+            logger.error(f"Invalid provider limit '{limit}' (expected PROVIDER=N)")
+            return 1
+        provider_limits[provider.strip().lower()] = int(value)
+    
+    results_path = Path(args.results) if args.results else Path(args.output_dir) / "batch_results.jsonl"
+    
+    # One router for the whole batch so every item shares the same API clients
+    router = GenerationRouter(
+        api_key=Config.ANTHROPIC_API_KEY,
+        brave_api_key=Config.BRAVE_API_KEY
+    )
+    results = router.generate_many(
+        items,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        max_retries=args.retries,
+        provider_limits=provider_limits,
+        results_path=results_path
+    )
+    
+    failed = [result for result in results if result.status != 'success']
+    print(f"✅ Batch finished: {len(results) - len(failed)} succeeded, {len(failed)} failed")
+    print(f"📄 Results manifest: {results_path}")
+    for result in failed:
+        print(f"❌ {result.id}: {result.error}")
+    return 1 if failed else 0
+
 def handle_api(args, logger):
     """Handle API command - start the REST API server"""
     logger.info(f"🚀 Starting OpenCanvas API Server")
@@ -0,0 +1,134 @@
+"""
+Resumable worker-pool runner shared by batch generation and batch evaluation.
+
+Items are processed on a thread pool; every finished item is appended to a
+JSONL results file immediately, so an interrupted run can be resumed by
+running it again with the same results file. Which recorded items count as
+done is decided by the caller through a skip predicate, and each attempt that
+raises is retried with exponential backoff.
+"""
+
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def load_successful_records(results_path) -> Dict[str, Dict[str, Any]]:
+    """Return {id: record} for the items recorded as successful in a JSONL results file (latest record wins)."""
+    completed = {}
+    path = Path(results_path)
+    if not path.exists():
+        return completed
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partially written line from an interrupted run
+            if record.get('status') == 'success':
+                completed[record.get('id')] = record
+    return completed
+
+
+class ResumableBatchRunner:
+    """Runs items on a worker pool with retries and a resumable JSONL results file"""
+
+    def __init__(self, max_workers: int, max_retries: int, retry_backoff: float = 5.0,
+                 thread_name_prefix: str = "batch"):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Number of items processed concurrently
+            max_retries: Extra attempts for an item whose attempt raised
+            retry_backoff: Base delay in seconds between attempts (doubles each retry)
+            thread_name_prefix: Name prefix of the worker threads
+        """
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.thread_name_prefix = thread_name_prefix
+        self._write_lock = threading.Lock()
+
+    def attempt(self, item_id: str, call: Callable[[], Any]) -> Tuple[Any, int, Optional[str]]:
+        """
+        Call until it succeeds or the retries are used up.
+
+        Args:
+            item_id: Item id used in log messages
+            call: Performs one attempt; raising marks the attempt as failed
+
+        Returns:
+            Tuple of (value of the successful call or None, attempts made, last error or None)
+        """
+        error = None
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                return call(), attempt, None
+            except Exception as e:
+                error = str(e)
+
+            logger.warning(f"⚠️ Item {item_id} failed (attempt {attempt}/{self.max_retries + 1}): {error}")
+            if attempt <= self.max_retries:
+                time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+        return None, self.max_retries + 1, error
+
+    def _record(self, results_path: Optional[Path], result):
+        if not results_path:
+            return
+        with self._write_lock:
+            with open(results_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+                f.flush()
+
+    def run_items(self, items: List, process: Callable[[Any], Any], results_path=None,
+                  is_done: Optional[Callable[[Any, Dict[str, Any]], bool]] = None,
+                  on_result: Optional[Callable[[Any, int, int], None]] = None, label: str = "items") -> List:
+        """
+        Process items, skipping those already recorded as done.
+
+        Args:
+            items: Items with an `id` attribute
+            process: Produces the result of one item; results need `id`, `status`
+                and `to_dict()`
+            results_path: JSONL results file every result is appended to
+            is_done: is_done(item, record) decides whether an item with a successful
+                record is skipped (default: always)
+            on_result: Called as on_result(result, finished, total) after each item
+            label: What the items are, for log messages
+
+        Returns:
+            Results for the items processed in this run
+        """
+        results_path = Path(results_path) if results_path else None
+        if results_path:
+            results_path.parent.mkdir(parents=True, exist_ok=True)
+            completed = load_successful_records(results_path)
+            pending = [
+                item for item in items
+                if item.id not in completed or (is_done and not is_done(item, completed[item.id]))
+            ]
+            if len(pending) < len(items):
+                logger.info(f"⏭️ Resuming batch: {len(items) - len(pending)} {label} already completed")
+            items = pending
+
+        logger.info(f"🚀 Processing {len(items)} {label} with {self.max_workers} workers")
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix) as executor:
+            futures = {executor.submit(process, item): item for item in items}
+            for future in as_completed(futures):
+                result = future.result()
+                self._record(results_path, result)
+                results.append(result)
+                if on_result:
+                    on_result(result, len(results), len(items))
+
+        succeeded = sum(1 for result in results if result.status == 'success')
+        logger.info(f"📦 Batch complete: {succeeded} succeeded, {len(results) - succeeded} failed")
+        return results
@@ -0,0 +1,302 @@
+"""
+Persistent on-disk cache shared by the research, conversion and evaluation caches.
+
+Each entry is stored as a small JSON record (value + metadata + expiry) with an
+optional binary payload next to it. Entries are addressed by the SHA-256 of their
+key, access times drive LRU eviction, and the total size is kept under a budget.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Content-addressed JSON/blob cache with TTL expiry and LRU size budget."""
+
+    RECORD_SUFFIX = ".json"
+    PAYLOAD_SUFFIX = ".bin"
+
+    def __init__(self, cache_dir, max_size_bytes: int = 100 * 1024 * 1024, default_ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries (created if missing)
+            max_size_bytes: Total size budget; least recently used entries are evicted beyond it
+            default_ttl: Default time-to-live in seconds (None = never expires)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl = default_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._lock = threading.Lock()
+        self._size = self._scan_size()
+
+    @staticmethod
+    def hash_key(key: str) -> str:
+        """Return the content address used for a key."""
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _record_path(self, key: str) -> Path:
+        return self.cache_dir / f"{self.hash_key(key)}{self.RECORD_SUFFIX}"
+
+    def _payload_path(self, key: str) -> Path:
+        return self.cache_dir / f"{self.hash_key(key)}{self.PAYLOAD_SUFFIX}"
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self.cache_dir.iterdir():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write a file atomically so concurrent readers never see partial entries."""
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str, include_expired: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+            include_expired: Return expired entries too (e.g. for HTTP revalidation);
+                such lookups are counted as stale, not as hits
+
+        Returns:
+            Record dict with 'value', 'metadata', 'created_at', 'expires_at' and
+            'expired' keys, or None if the key is not cached
+        """
+        record_path = self._record_path(key)
+        record = self._read_record(record_path)
+        if record is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if record['expired'] and not include_expired:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Access time drives LRU eviction
+        try:
+            os.utime(record_path, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            if record['expired']:
+                self.stale += 1
+            else:
+                self.hits += 1
+        return record
+
+    def mark_revalidated(self):
+        """Count a stale lookup the origin confirmed as unchanged (e.g. HTTP 304) as a hit."""
+        with self._lock:
+            if self.stale:
+                self.stale -= 1
+            self.hits += 1
+
+    @staticmethod
+    def _read_record(record_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(record_path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        expires_at = record.get('expires_at')
+        record['expired'] = expires_at is not None and expires_at <= time.time()
+        return record
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Return the binary payload of a fresh entry, or None."""
+        if self.get(key) is None:
+            return None
+        try:
+            return self._payload_path(key).read_bytes()
+        except OSError:
+            return None
+
+    def set(self, key: str, value: Any = None, ttl: Optional[float] = None,
+            metadata: Optional[Dict[str, Any]] = None, data: Optional[bytes] = None):
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds (falls back to default_ttl)
+            metadata: Extra JSON-serializable metadata (ETag, Last-Modified, ...)
+            data: Optional binary payload stored alongside the record
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        record = {
+            'key': key,
+            'value': value,
+            'metadata': metadata or {},
+            'created_at': now,
+            'expires_at': now + ttl if ttl is not None else None,
+        }
+        encoded = json.dumps(record, ensure_ascii=False).encode('utf-8')
+
+        record_path = self._record_path(key)
+        payload_path = self._payload_path(key)
+        previous = self._entry_size(record_path) + self._entry_size(payload_path)
+
+        try:
+            if data is not None:
+                self._write_atomic(payload_path, data)
+            elif payload_path.exists():
+                payload_path.unlink()
+            self._write_atomic(record_path, encoded)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry: {e}")
+            return
+
+        with self._lock:
+            self._size += len(encoded) + (len(data) if data is not None else 0) - previous
+            over_budget = self._size > self.max_size_bytes
+
+        if over_budget:
+            self.evict()
+
+    def touch(self, key: str, ttl: Optional[float] = None, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Renew an entry's expiry (and optionally merge metadata) without rewriting its payload."""
+        record_path = self._record_path(key)
+        record = self._read_record(record_path)
+        if record is None:
+            return False
+
+        ttl = self.default_ttl if ttl is None else ttl
+        record.pop('expired', None)
+        record['expires_at'] = time.time() + ttl if ttl is not None else None
+        if metadata:
+            record['metadata'].update(metadata)
+
+        try:
+            self._write_atomic(record_path, json.dumps(record, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not refresh cache entry: {e}")
+            return False
+        return True
+
+    def delete(self, key: str):
+        """Remove an entry if present."""
+        for path in (self._record_path(key), self._payload_path(key)):
+            size = self._entry_size(path)
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            with self._lock:
+                self._size -= size
+
+    def records(self, include_expired: bool = False) -> List[Dict[str, Any]]:
+        """Return every stored record (each includes its 'key'), without touching access times."""
+        records = []
+        for record_path in self.cache_dir.glob(f"*{self.RECORD_SUFFIX}"):
+            record = self._read_record(record_path)
+            if record is not None and (include_expired or not record['expired']):
+                records.append(record)
+        return records
+
+    def evict(self, target_ratio: float = 0.9) -> int:
+        """
+        Evict least recently used entries until the cache fits the budget.
+
+        Args:
+            target_ratio: Fraction of the budget to shrink down to
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for record_path in self.cache_dir.glob(f"*{self.RECORD_SUFFIX}"):
+            payload_path = record_path.with_suffix(self.PAYLOAD_SUFFIX)
+            try:
+                stat = record_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, record_path, payload_path,
+                            stat.st_size + self._entry_size(payload_path)))
+
+        entries.sort(key=lambda entry: entry[0])
+        total = sum(entry[3] for entry in entries)
+        target = self.max_size_bytes * target_ratio
+        removed = 0
+
+        for _, record_path, payload_path, size in entries:
+            if total <= target:
+                break
+            for path in (record_path, payload_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._size = total
+
+        if removed:
+            logger.info(f"🧹 Evicted {removed} cache entries from {self.cache_dir}")
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        for path in self.cache_dir.iterdir():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/stale counters and size information."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.stale
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size_bytes': self._size,
+                'max_size_bytes': self.max_size_bytes,
+                'cache_dir': str(self.cache_dir),
+            }
@@ -8,11 +8,11 @@ import os
 import json
 import logging
 import tempfile
-import base64
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from opencanvas.utils.pdf_document import PDFDocument, PDFSource
 from opencanvas.utils.plot_caption_extractor import PlotInfo
 
 logger = logging.getLogger(__name__)
@@ -79,12 +79,12 @@ class DoclingImageExtractor:
         
         logger.info(f"Initialized Docling extractor with DPI scale: {dpi_scale}")
     
-    def extract_from_pdf_data(self, pdf_data: str, output_dir: Path) -> Tuple[Dict, Optional[Path], List[PlotInfo]]:
+    def extract_from_pdf_data(self, pdf_data: PDFSource, output_dir: Path) -> Tuple[Dict, Optional[Path], List[PlotInfo]]:
         """
-        Extract images from base64 PDF data (compatible with existing interface)
+        Extract images from PDF data (compatible with existing interface)
         
         Args:
-            pdf_data: Base64 encoded PDF data
+            pdf_data: PDF document (or base64 encoded PDF data)
             output_dir: Directory to save extracted images
             
         Returns:
@@ -92,11 +92,9 @@ class DoclingImageExtractor:
             This matches the interface expected by pdf_generator.py
         """
         try:
-            # Decode base64 PDF data and save to temporary file
-            pdf_bytes = base64.b64decode(pdf_data)
-            
+            # Save PDF data to temporary file
             with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
-                temp_pdf.write(pdf_bytes)
+                temp_pdf.write(PDFDocument.coerce(pdf_data).data)
                 temp_pdf_path = temp_pdf.name
             
             try:
@@ -0,0 +1,146 @@
+"""
+In-memory PDF documents.
+
+PDFs used to travel through generation and evaluation as base64 text: every
+file was read and encoded up front, and paths that needed the bytes (Gemini,
+image extraction, uploads) decoded the same string again on every call.
+PDFDocument holds the raw bytes once (memory-mapped for large files) and
+produces the base64 text and the content hash lazily, at most once, for the
+providers that need them. It also wraps existing base64 text, decoding only
+if bytes are actually requested. Whoever loads a document from a file closes
+it (close() or a with block) so the memory map is not held until GC runs.
+"""
+
+import mmap
+import base64
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Union
+import logging
+
+from opencanvas.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Anything the evaluator and generators accept as a PDF: a document, raw bytes or base64 text
+PDFSource = Union["PDFDocument", bytes, str]
+
+
+class PDFDocument:
+    """Raw PDF bytes with lazily computed base64 text and SHA-256."""
+
+    def __init__(self, data: Union[bytes, mmap.mmap, None] = None, name: str = "document.pdf",
+                 base64_text: Optional[str] = None):
+        """
+        Initialize a document from its bytes and/or base64 text.
+
+        Args:
+            data: Raw PDF bytes (or a read-only memory map)
+            name: File name used for uploads and logging
+            base64_text: Base64 form, if already known
+        """
+        if data is None and base64_text is None:
+            raise ValueError("PDFDocument needs bytes or base64 text")
+        self.name = name
+        self._data = data
+        self._base64 = base64_text
+        self._sha256 = None
+        self._bytes = data if isinstance(data, bytes) else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path, mmap_threshold: Optional[int] = None) -> "PDFDocument":
+        """
+        Load a PDF from disk.
+
+        Args:
+            path: PDF file path
+            mmap_threshold: Files at least this large are memory-mapped instead of read
+                (defaults to PDF_MMAP_THRESHOLD_MB)
+        """
+        path = Path(path)
+        if mmap_threshold is None:
+            mmap_threshold = int(Config.PDF_MMAP_THRESHOLD_MB * 1024 * 1024)
+        size = path.stat().st_size
+        if mmap_threshold and size >= mmap_threshold:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            logger.debug(f"Memory-mapped {path.name} ({size / (1024 * 1024):.1f} MB)")
+            return cls(mapped, name=path.name)
+        return cls(path.read_bytes(), name=path.name)
+
+    @classmethod
+    def from_base64(cls, text: str, name: str = "document.pdf") -> "PDFDocument":
+        """Wrap base64 text (decoded only when bytes are requested)."""
+        return cls(name=name, base64_text=text)
+
+    @classmethod
+    def coerce(cls, value: PDFSource, name: str = "document.pdf") -> "PDFDocument":
+        """Return value as a PDFDocument (bytes are raw PDF data, strings are base64)."""
+        if isinstance(value, PDFDocument):
+            return value
+        if isinstance(value, str):
+            return cls.from_base64(value, name=name)
+        return cls(value, name=name)
+
+    @property
+    def data(self) -> Union[bytes, mmap.mmap]:
+        """Raw PDF data as a buffer (bytes or the memory map, without copying)."""
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._bytes = base64.b64decode(self._base64)
+        return self._data
+
+    def to_bytes(self) -> bytes:
+        """Raw PDF data as bytes (copied once from a memory map, for SDKs that require bytes)."""
+        if self._bytes is None:
+            data = self.data
+            with self._lock:
+                if self._bytes is None:
+                    self._bytes = bytes(data)
+        return self._bytes
+
+    @property
+    def base64(self) -> str:
+        """Base64 text of the PDF, encoded on first use."""
+        if self._base64 is None:
+            data = self.data
+            with self._lock:
+                if self._base64 is None:
+                    self._base64 = base64.b64encode(data).decode('utf-8')
+        return self._base64
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the raw PDF bytes."""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __bool__(self) -> bool:
+        if self._data is None:
+            return bool(self._base64)
+        return len(self._data) > 0
+
+    def write_to(self, path) -> Path:
+        """Write the PDF to a file."""
+        path = Path(path)
+        with open(path, 'wb') as f:
+            f.write(self.data)
+        return path
+
+    def close(self):
+        """Release the memory map, if any."""
+        if isinstance(self._data, mmap.mmap) and not self._data.closed:
+            self._data.close()
+
+    def __enter__(self) -> "PDFDocument":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
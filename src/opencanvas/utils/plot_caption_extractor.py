@@ -229,7 +229,9 @@ class PDFPlotCaptionExtractor:
                 raise ValueError(
                     "ANTHROPIC_API_KEY is required for Claude caption extraction"
                 )
-            self.client = Anthropic(api_key=self.api_key)
+            from opencanvas.llm.clients import get_anthropic_client
+
+            self.client = get_anthropic_client(self.api_key)
         else:
             raise ValueError("Provider must be 'gpt' or 'claude'")
 
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Conversion benchmark for OpenCanvas
+
+Generates synthetic decks in the OpenCanvas slide format (.slide/.active
+navigation, local images, SVG charts) and times every conversion method on
+them, once with a cold browser and once warm. Each method/deck size runs in
+its own process so that peak RSS is measured per case. Results are written
+as JSON for comparing runs and catching regressions.
+
+Usage:
+    python tests/benchmark_conversion.py [options]
+
+Options:
+    --sizes 5 20 50 100        Slide counts to generate
+    --methods playwright ...   Methods to time (default: all four)
+    --render-mode MODE         Playwright render mode (single_pass, per_slide, parallel)
+    --output FILE              Results file (default: output/benchmarks/conversion_<timestamp>.json)
+
+Examples:
+    python tests/benchmark_conversion.py
+    python tests/benchmark_conversion.py --sizes 20 --methods playwright --render-mode parallel
+"""
+
+import sys
+import json
+import time
+import resource
+import argparse
+import platform
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image, ImageDraw
+
+METHODS = ["playwright", "chrome_headless", "selenium_cdp", "selenium"]
+SIZES = [5, 20, 50, 100]
+PALETTE = [(37, 99, 235), (16, 185, 129), (245, 158, 11), (239, 68, 68), (139, 92, 246)]
+
+DECK_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Benchmark deck ({slide_count} slides)</title>
+    <style>
+        body {{ margin: 0; font-family: Georgia, serif; background: #0f172a; }}
+        .slide {{
+            width: 1920px; height: 1080px; box-sizing: border-box; padding: 80px;
+            display: none; flex-direction: column; gap: 32px;
+            background: linear-gradient(135deg, #f8fafc, #e2e8f0);
+            transition: opacity 0.3s ease;
+        }}
+        .slide.active {{ display: flex; }}
+        .slide h2 {{ font-size: 64px; margin: 0; color: #0f172a; }}
+        .slide .body {{ display: flex; gap: 48px; flex: 1; }}
+        .slide ul {{ font-size: 36px; line-height: 1.5; flex: 1; }}
+        .slide img {{ width: 720px; height: 405px; object-fit: cover; border-radius: 16px; }}
+        .controls {{ position: fixed; bottom: 20px; right: 20px; }}
+        .slide-number {{ position: fixed; bottom: 20px; left: 20px; color: #fff; }}
+    </style>
+</head>
+<body>
+{slides}
+    <div class="controls"><button onclick="previousSlide()">Prev</button><button onclick="nextSlide()">Next</button></div>
+    <div class="slide-number"><span id="current">1</span> / {slide_count}</div>
+    <script>
+        let currentSlide = 0;
+        const slides = document.querySelectorAll('.slide');
+        function showSlide(index) {{
+            slides[currentSlide].classList.remove('active');
+            currentSlide = Math.max(0, Math.min(index, slides.length - 1));
+            slides[currentSlide].classList.add('active');
+            document.getElementById('current').textContent = currentSlide + 1;
+        }}
+        function nextSlide() {{ showSlide(currentSlide + 1); }}
+        function previousSlide() {{ showSlide(currentSlide - 1); }}
+        document.addEventListener('keydown', (event) => {{
+            if (event.key === 'ArrowRight' || event.key === ' ') nextSlide();
+            if (event.key === 'ArrowLeft') previousSlide();
+        }});
+    </script>
+</body>
+</html>
+"""
+
+
+def chart_svg(number: int) -> str:
+    """Inline SVG bar chart with values derived from the slide number."""
+    bars = []
+    for position in range(6):
+        height = 60 + (number * 37 + position * 53) % 260
+        color = "#%02x%02x%02x" % PALETTE[(number + position) % len(PALETTE)]
+        bars.append(f'<rect x="{20 + position * 110}" y="{340 - height}" width="80" height="{height}" fill="{color}"/>')
+    return ('<svg width="720" height="360" viewBox="0 0 720 360" xmlns="http://www.w3.org/2000/svg">'
+            '<line x1="10" y1="340" x2="710" y2="340" stroke="#334155" stroke-width="2"/>'
+            + "".join(bars) + '</svg>')
+
+
+def generate_deck(slide_count: int, directory: Path) -> Path:
+    """
+    Write a synthetic deck with local images and charts.
+
+    Args:
+        slide_count: Number of slides
+        directory: Deck directory (images are written to directory/images)
+
+    Returns:
+        Path to the deck's HTML file
+    """
+    images_dir = directory / "images"
+    images_dir.mkdir(parents=True, exist_ok=True)
+    for index, color in enumerate(PALETTE):
+        image = Image.new("RGB", (1440, 810), color)
+        draw = ImageDraw.Draw(image)
+        for offset in range(0, 1440, 120):
+            draw.line([(offset, 0), (offset + 400, 810)], fill=(255, 255, 255), width=6)
+        image.save(images_dir / f"figure_{index + 1}.png")
+
+    slides = []
+    for number in range(1, slide_count + 1):
+        active = " active" if number == 1 else ""
+        if number % 3 == 0:
+            visual = chart_svg(number)
+        else:
+            visual = f'<img src="images/figure_{(number - 1) % len(PALETTE) + 1}.png" alt="Figure {number}">'
+        points = "".join(f"<li>Point {point} on slide {number}: throughput, latency and cost</li>"
+                         for point in range(1, 5))
+        slides.append(f'    <div class="slide{active}">\n'
+                      f'        <h2>Slide {number}: Benchmark section</h2>\n'
+                      f'        <div class="body"><ul>{points}</ul>{visual}</div>\n'
+                      f'    </div>')
+
+    html_file = directory / "presentation.html"
+    html_file.write_text(DECK_TEMPLATE.format(slide_count=slide_count, slides="\n".join(slides)), encoding="utf-8")
+    return html_file
+
+
+def peak_rss_mb(who: int) -> float:
+    """Peak resident set size of this process or its largest finished child, in MB."""
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if platform.system() == "Darwin" else 1024), 1)
+
+
+def run_case(method: str, html_file: str, output_dir: str, render_mode: str) -> List[Dict[str, Any]]:
+    """Convert one deck cold and warm with one method (runs in a fresh process)."""
+    from PyPDF2 import PdfReader
+    from opencanvas.conversion.browser_pool import close_browser_pool
+    from opencanvas.conversion.html_to_pdf import PresentationConverter
+
+    results = []
+    try:
+        for phase in ("cold", "warm"):
+            converter = PresentationConverter(html_file, output_dir=output_dir, method=method,
+                                              render_mode=render_mode, use_cache=False, prefetch_assets=False)
+            result = {"method": method, "phase": phase, "render_mode": render_mode if method == "playwright" else None}
+            if converter.method != method:
+                result["error"] = f"{method} unavailable (converter fell back to {converter.method})"
+                results.append(result)
+                break
+
+            started = time.perf_counter()
+            try:
+                pdf_path = Path(converter.convert(f"{method}_{phase}.pdf"))
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+                results.append(result)
+                break
+            elapsed = time.perf_counter() - started
+
+            pages = len(PdfReader(str(pdf_path)).pages)
+            result.update({
+                "seconds": round(elapsed, 3),
+                "pages": pages,
+                "pages_per_second": round(pages / elapsed, 2) if elapsed else None,
+                "output_bytes": pdf_path.stat().st_size,
+            })
+            results.append(result)
+    finally:
+        close_browser_pool()
+
+    for result in results:
+        result["peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_SELF)
+        result["browser_peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+    return results
+
+
+def run_benchmark(sizes: List[int], methods: List[str], render_mode: str) -> List[Dict[str, Any]]:
+    """Run every method on every deck size, each case in its own process."""
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for slide_count in sizes:
+            deck_dir = Path(temp_dir) / f"deck_{slide_count}"
+            html_file = generate_deck(slide_count, deck_dir)
+            print(f"\n📊 {slide_count} slides")
+
+            for method in methods:
+                output_dir = deck_dir / f"output_{method}"
+                try:
+                    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                        case = executor.submit(run_case, method, str(html_file), str(output_dir), render_mode).result()
+                except Exception as e:
+                    traceback.print_exc()
+                    case = [{"method": method, "phase": "cold", "error": f"{type(e).__name__}: {e}"}]
+
+                for result in case:
+                    result["slides"] = slide_count
+                    if "error" in result:
+                        print(f"  ❌ {method:<16} {result['phase']:<5} {result['error']}")
+                    else:
+                        print(f"  ✅ {method:<16} {result['phase']:<5} {result['seconds']:>8.2f}s "
+                              f"{result['pages_per_second']:>7.2f} pages/s {result['output_bytes'] / 1024:>9.0f} KB "
+                              f"RSS {result['peak_rss_mb']:.0f} MB / browser {result['browser_peak_rss_mb']:.0f} MB")
+                results.extend(case)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML to PDF conversion methods")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Slide counts to generate")
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=METHODS, help="Conversion methods")
+    parser.add_argument("--render-mode", choices=["single_pass", "per_slide", "parallel"], default=None,
+                        help="Playwright render mode (defaults to PLAYWRIGHT_RENDER_MODE)")
+    parser.add_argument("--output", help="Results JSON file")
+    args = parser.parse_args()
+
+    from opencanvas.config import Config
+    render_mode = args.render_mode or Config.PLAYWRIGHT_RENDER_MODE
+
+    print("🏁 OpenCanvas conversion benchmark")
+    print(f"  Sizes: {args.sizes}")
+    print(f"  Methods: {args.methods}")
+    print(f"  Playwright render mode: {render_mode}")
+
+    results = run_benchmark(args.sizes, args.methods, render_mode)
+
+    output = Path(args.output) if args.output else (
+        Path("output") / "benchmarks" / f"conversion_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created_at": datetime.now().isoformat(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "render_mode": render_mode,
+            "browser_pool_size": Config.BROWSER_POOL_SIZE,
+            "results": results,
+        }, f, indent=2)
+    print(f"\n💾 Results saved to {output}")
+
+    return 1 if any("error" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from opencanvas.conversion import html_to_pdf
+from opencanvas.conversion.conversion_cache import SLIDE_SOURCES_SCRIPT
+
+
+class FakeSlidePage:
+    """Playwright page stand-in for a deck: tracks the active slide and what was printed"""
+
+    def __init__(self, slides=None, count=3):
+        self.slides = list(slides) if slides is not None else [f"slide {i}" for i in range(count)]
+        self.active = 0
+        self.printed = []
+        self.media = "screen"
+        self.viewport_size = {"width": 1280, "height": 720}
+
+    def query_selector_all(self, selector):
+        return [object()] * len(self.slides)
+
+    def evaluate(self, script, arg=None):
+        if script == SLIDE_SOURCES_SCRIPT:
+            return {"context": "<html><head></head><body></body></html>", "slides": list(self.slides)}
+        if script == html_to_pdf.GOTO_SLIDE_SCRIPT:
+            self.active = arg
+
+    def emulate_media(self, media):
+        self.media = media
+
+    def set_viewport_size(self, size):
+        self.viewport_size = size
+
+    def pdf(self, path, **kwargs):
+        Path(path).write_text(self.slides[self.active])
+        self.printed.append(self.active)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class InlinePool:
+    """Browser pool stand-in that runs each job immediately on a page from make_page"""
+
+    def __init__(self, make_page):
+        self.make_page = make_page
+        self.pages = []
+
+    def run(self, job):
+        page = self.make_page()
+        self.pages.append(page)
+        return job(page)
+
+    def submit(self, job):
+        future = Future()
+        try:
+            future.set_result(self.run(job))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.fixture
+def inline_browser_pool(monkeypatch):
+    """Make html_to_pdf use an InlinePool; call it with a page factory to install one"""
+
+    def install(make_page):
+        pool = InlinePool(make_page)
+        monkeypatch.setattr(html_to_pdf, "get_browser_pool", lambda: pool)
+        return pool
+
+    return install
@@ -0,0 +1,126 @@
+import io
+import time
+import hashlib
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from opencanvas.conversion import html_to_pdf
+from opencanvas.conversion.asset_prefetch import AssetPrefetcher, find_remote_assets
+from opencanvas.conversion.html_to_pdf import PresentationConverter
+
+
+def encode_image(size, image_format):
+    output = io.BytesIO()
+    Image.new("RGB", size, (200, 40, 40)).save(output, format=image_format)
+    return output.getvalue()
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    """Serves a wide PNG and a small JPEG, 404 for anything else"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        assets = {
+            "/wide.png": (encode_image((3000, 300), "PNG"), "image/png"),
+            "/small.jpg?w=1350&q=80": (encode_image((200, 100), "JPEG"), "image/jpeg"),
+        }
+        if self.path not in assets:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body, content_type = assets[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def asset_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AssetHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+class TestAssetPrefetch:
+    """Test cases for prefetching remote slide assets"""
+
+    def deck(self, server):
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        return (f'<div class="slide"><img src="{base}/wide.png" alt="chart"></div>'
+                f'<div class="slide" style="background: url(&quot;{base}/small.jpg?w=1350&amp;q=80&quot;)"></div>'
+                f'<div class="slide"><img src="{base}/missing.png"><img src="images/local.png"></div>')
+
+    def test_localize_downloads_once_and_rewrites(self, asset_server):
+        html = self.deck(asset_server)
+        assert len(find_remote_assets(html)) == 3
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            prefetcher = AssetPrefetcher(cache_dir, max_width=1920, max_workers=4)
+            localized = prefetcher.localize_html(html)
+
+            local_files = sorted(Path(cache_dir, "files").iterdir())
+            assert len(local_files) == 2
+            for path in local_files:
+                assert path.as_uri() in localized
+                assert path.stem == hashlib.sha256(path.read_bytes()).hexdigest()
+            wide = next(path for path in local_files if path.suffix == ".png")
+            with Image.open(wide) as image:
+                assert image.size == (1920, 192)
+
+            # Unavailable and local references are left alone
+            assert "/missing.png" in localized and 'src="images/local.png"' in localized
+            assert prefetcher.get_stats()["failures"] == 1
+
+            # A fresh prefetcher (e.g. another process) serves known URLs from disk
+            asset_server.requests.clear()
+            assert AssetPrefetcher(cache_dir, max_width=1920).localize_html(html) == localized
+            assert asset_server.requests == ["/missing.png"]
+
+    def test_prune_drops_expired_entries_and_their_files(self, asset_server):
+        html = self.deck(asset_server)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            AssetPrefetcher(cache_dir, max_width=1920, ttl_seconds=0.2).localize_html(html)
+            assert len(list(Path(cache_dir, "files").iterdir())) == 2
+            time.sleep(0.3)
+
+            prefetcher = AssetPrefetcher(cache_dir, max_width=1920, ttl_seconds=60)
+            prefetcher.fetch(f"http://127.0.0.1:{asset_server.server_address[1]}/wide.png")
+            assert prefetcher.prune() == 1
+
+            remaining = list(Path(cache_dir, "files").iterdir())
+            assert [path.suffix for path in remaining] == [".png"]
+            assert len(prefetcher.index.records(include_expired=True)) == 1
+
+    def test_converter_renders_prepared_copy(self, asset_server):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "deck.html"
+            html_file.write_text(self.deck(asset_server), encoding="utf-8")
+            converter = PresentationConverter(str(html_file), output_dir=str(Path(temp_dir) / "out"),
+                                              use_cache=False, prefetch_assets=True)
+            converter_prefetcher = AssetPrefetcher(Path(temp_dir) / "assets")
+
+            original = html_to_pdf.get_asset_prefetcher
+            html_to_pdf.get_asset_prefetcher = lambda: converter_prefetcher
+            try:
+                prepared = converter._prepare_html()
+            finally:
+                html_to_pdf.get_asset_prefetcher = original
+
+            assert prepared.parent == html_file.parent and prepared != html_file
+            assert "/wide.png" not in prepared.read_text(encoding="utf-8")
+            converter._cleanup_temp_html()
+            assert not prepared.exists()
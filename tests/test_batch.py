@@ -0,0 +1,119 @@
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from opencanvas.generators.batch import BatchItem, BatchRunner, load_manifest
+from opencanvas.image_validation.topic_image_cache import TopicImageCache
+
+
+class FakeRouter:
+    """Stand-in for GenerationRouter that records calls"""
+
+    def __init__(self, failures=None, delay=0.0):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls = []
+        self.opened_browser = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def detect_input_type(self, input_source):
+        return 'pdf_file' if input_source.endswith('.pdf') else 'topic'
+
+    def generate(self, input_source, purpose, theme, output_dir, extract_images=False, open_browser=True):
+        with self._lock:
+            self.calls.append(input_source)
+            self.opened_browser.append(open_browser)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.failures.get(input_source, 0) > 0:
+                self.failures[input_source] -= 1
+                raise RuntimeError("API overloaded")
+            return {'html_file': str(Path(output_dir) / "presentation.html"), 'topic_slug': 'slug'}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class ImageCacheRouter(FakeRouter):
+    """FakeRouter whose items all look up and store images in one shared cache, like TopicGenerator"""
+
+    def __init__(self, cache):
+        super().__init__()
+        self.cache = cache
+
+    def generate(self, input_source, purpose, theme, output_dir, extract_images=False, open_browser=True):
+        self.cache.add_images_for_topic(input_source, [(f"photo-{len(input_source)}", 0, True, 0.9)])
+        if not self.cache.get_images_for_topic(input_source):
+            raise RuntimeError("cached images missing")
+        return super().generate(input_source, purpose, theme, output_dir, extract_images, open_browser)
+
+
+class TestBatchGeneration:
+    """Test cases for batch generation"""
+
+    def test_load_manifest(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest = Path(temp_dir) / "topics.jsonl"
+            manifest.write_text(
+                '{"input": "quantum computing", "theme": "clean minimalist"}\n'
+                '\n'
+                '# comment\n'
+                '{"id": "reef", "input": "coral reefs", "purpose": "academic presentation"}\n',
+                encoding="utf-8"
+            )
+            items = load_manifest(manifest)
+
+            assert [item.input for item in items] == ["quantum computing", "coral reefs"]
+            assert items[0].id and items[0].theme == "clean minimalist"
+            assert items[1].id == "reef"
+
+    def test_retries_and_resume(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_path = Path(temp_dir) / "results.jsonl"
+            items = [BatchItem(input="topic a"), BatchItem(input="topic b"), BatchItem(input="topic c")]
+
+            # "topic b" fails once (recovered by retry), "topic c" fails every attempt
+            router = FakeRouter(failures={"topic b": 1, "topic c": 10})
+            runner = BatchRunner(router, max_workers=2, max_retries=1, retry_backoff=0)
+            results = {result.input: result for result in runner.run(items, temp_dir, results_path)}
+
+            assert results["topic a"].status == "success" and results["topic a"].attempts == 1
+            assert results["topic b"].status == "success" and results["topic b"].attempts == 2
+            assert results["topic c"].status == "failed" and "overloaded" in results["topic c"].error
+            assert len(results_path.read_text().splitlines()) == 3
+
+            # Rerunning only retries the item that has not succeeded yet
+            router = FakeRouter()
+            resumed = BatchRunner(router, max_workers=2, retry_backoff=0).run(items, temp_dir, results_path)
+            assert router.calls == ["topic c"]
+            assert resumed[0].status == "success"
+
+            records = [json.loads(line) for line in results_path.read_text().splitlines()]
+            assert sum(record["status"] == "success" for record in records) == 3
+
+    def test_provider_limits_bound_concurrency(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            items = [BatchItem(input=f"topic {i}") for i in range(6)]
+            router = FakeRouter(delay=0.05)
+            runner = BatchRunner(router, max_workers=6, provider_limits={"anthropic": 2})
+            results = runner.run(items, temp_dir)
+
+            assert all(result.status == "success" for result in results)
+            assert router.max_active == 2
+            assert router.opened_browser == [False] * 6
+
+    def test_workers_share_image_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TopicImageCache(str(Path(temp_dir) / "images.duckdb"))
+            items = [BatchItem(input=f"ocean topic number{i}") for i in range(12)]
+            runner = BatchRunner(ImageCacheRouter(cache), max_workers=6, max_retries=0)
+            results = runner.run(items, temp_dir)
+
+            assert all(result.status == "success" for result in results), [r.error for r in results]
+            assert cache.get_stats()['total_topics'] == 12
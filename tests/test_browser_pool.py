@@ -0,0 +1,327 @@
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from opencanvas.conversion import async_converter, html_to_pdf
+from opencanvas.conversion.async_converter import AsyncPresentationConverter
+from opencanvas.conversion.browser_pool import AsyncBrowserPool, BrowserPool, _AsyncBrowser
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def new_page(self):
+        return FakePage(self.browser)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, number):
+        self.number = number
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.connected = False
+
+
+class FakeBrowserPool(BrowserPool):
+    """BrowserPool launching fake browsers instead of Chromium"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.browsers = []
+        self.threads = set()
+
+    def _start_playwright(self):
+        return object()
+
+    def _launch(self, playwright):
+        with self._lock:
+            self.launches += 1
+            browser = FakeBrowser(self.launches)
+            self.browsers.append(browser)
+        return browser
+
+
+class TestBrowserPool:
+    """Test cases for the shared browser pool"""
+
+    def test_jobs_reuse_warm_browsers(self):
+        pool = FakeBrowserPool(size=2, max_jobs_per_browser=0)
+        pool.warm()
+
+        def job(page):
+            pool.threads.add(threading.current_thread().name)
+            return page.browser.number
+
+        try:
+            results = [future.result(5) for future in [pool.submit(job) for _ in range(10)]]
+            assert set(results) <= {1, 2}
+            assert pool.launches == 2
+            assert all(name.startswith("browser-pool-") for name in pool.threads)
+            assert pool.get_stats()["jobs_completed"] == 10
+            # Every job gets its own context, closed once the job is done
+            contexts = [context for browser in pool.browsers for context in browser.contexts]
+            assert len(contexts) == 10 and all(context.closed for context in contexts)
+        finally:
+            pool.close()
+
+    def test_recycling_and_health_checks(self):
+        pool = FakeBrowserPool(size=1, max_jobs_per_browser=3)
+        try:
+            numbers = [pool.run(lambda page: page.browser.number) for _ in range(4)]
+            assert numbers == [1, 1, 1, 2]
+
+            # A crashed browser is replaced before the next job
+            pool.browsers[-1].connected = False
+            assert pool.run(lambda page: page.browser.number) == 3
+
+            def failing(page):
+                raise ValueError("render failed")
+
+            with pytest.raises(ValueError):
+                pool.run(failing)
+            assert pool.get_stats()["jobs_failed"] == 1
+        finally:
+            pool.close()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda page: None)
+
+
+class AsyncFakePage:
+    """Async Playwright page stand-in printing a two-slide deck"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.keyboard = self
+
+    async def query_selector_all(self, selector):
+        return [object(), object()]
+
+    async def pdf(self, path, **kwargs):
+        await asyncio.sleep(0.01)
+        self.browser.threads.add(threading.current_thread().name)
+        Path(path).write_bytes(b"%PDF-1.4")
+
+    async def close(self):
+        pass
+
+    def __getattr__(self, name):
+        async def noop(*args, **kwargs):
+            return None
+        return noop
+
+
+class AsyncFakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        return AsyncFakePage(self.browser)
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncFakeBrowser:
+    def __init__(self, number):
+        self.number = number
+        self.connected = True
+        self.threads = set()
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = AsyncFakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeAsyncBrowserPool(AsyncBrowserPool):
+    """AsyncBrowserPool launching fake browsers instead of Chromium"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.browsers = []
+        self.peak_pages = 0
+
+    async def _start_playwright(self):
+        return object()
+
+    async def _launch(self, playwright):
+        self.launches += 1
+        browser = AsyncFakeBrowser(self.launches)
+        self.browsers.append(browser)
+        return _AsyncBrowser(browser)
+
+    async def _checkout(self):
+        entry = await super()._checkout()
+        self.peak_pages = max(self.peak_pages, self.get_stats()["active_pages"])
+        return entry
+
+
+class TestAsyncBrowserPool:
+    """Test cases for the asyncio browser pool and converter"""
+
+    def test_pages_share_browsers_and_recycle(self):
+        async def scenario():
+            pool = FakeAsyncBrowserPool(size=2, max_jobs_per_browser=0, pages_per_browser=3)
+
+            async def job(page):
+                await asyncio.sleep(0.01)
+                return page.browser.number
+
+            numbers = await asyncio.gather(*[pool.run(job) for _ in range(12)])
+            assert set(numbers) == {1, 2}
+            assert pool.launches == 2
+            assert pool.peak_pages == 6
+            contexts = [context for browser in pool.browsers for context in browser.contexts]
+            assert len(contexts) == 12 and all(context.closed for context in contexts)
+
+            recycling = FakeAsyncBrowserPool(size=1, max_jobs_per_browser=2, pages_per_browser=1)
+            numbers = [await recycling.run(job) for _ in range(3)]
+            assert numbers == [1, 1, 2]
+            recycling.browsers[-1].connected = False
+            assert await recycling.run(job) == 3
+
+            await pool.close()
+            with pytest.raises(RuntimeError):
+                await pool.run(job)
+
+        asyncio.run(scenario())
+
+    def test_concurrent_conversions_on_event_loop(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "deck.html"
+            html_file.write_text('<div class="slide">1</div><div class="slide">2</div>', encoding="utf-8")
+            pool = FakeAsyncBrowserPool(size=2, max_jobs_per_browser=0, pages_per_browser=4)
+
+            async def scenario():
+                converters = [
+                    AsyncPresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                               render_mode="single_pass", use_cache=False)
+                    for _ in range(8)
+                ]
+                for converter in converters:
+                    converter.method = "playwright"  # Even where Playwright is not installed
+                return await asyncio.gather(*[
+                    converter.convert(f"deck_{number}.pdf") for number, converter in enumerate(converters)
+                ])
+
+            monkeypatch.setattr(async_converter, "get_async_browser_pool", lambda: pool)
+            paths = asyncio.run(scenario())
+
+            assert all(Path(path).exists() for path in paths)
+            assert pool.launches == 2
+            assert pool.peak_pages == 8
+            assert {name for browser in pool.browsers for name in browser.threads} == {"MainThread"}
+
+    def test_screenshot_capture_pools(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "deck.html"
+            html_file.write_text('<div class="slide">1</div><div class="slide">2</div>', encoding="utf-8")
+            converter = html_to_pdf.PresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                                          use_cache=False)
+            expected = [str(Path(temp_dir) / f"slide_0{number}.png") for number in (1, 2)]
+
+            # A pool passed in by the caller stays warm across captures
+            pool = FakeAsyncBrowserPool(size=1, max_jobs_per_browser=0, pages_per_browser=2)
+
+            async def warm_scenario():
+                return [await converter.capture_slides_playwright(parallel_pages=parallel, pool=pool)
+                        for parallel in (2, 2, 1)]
+
+            assert asyncio.run(warm_scenario()) == [expected] * 3
+            assert pool.launches == 1
+            assert pool.get_stats()["jobs_completed"] == 5
+
+            # Without one, each call launches and closes its own browser
+            scoped = []
+
+            class ScopedPool(FakeAsyncBrowserPool):
+                def __init__(self, *args, **kwargs):
+                    super().__init__(*args, **kwargs)
+                    scoped.append(self)
+
+            monkeypatch.setattr(html_to_pdf, "AsyncBrowserPool", ScopedPool)
+            assert asyncio.run(converter.capture_slides_playwright(parallel_pages=2)) == expected
+            assert asyncio.run(converter.capture_slides_playwright(parallel_pages=1)) == expected
+            assert [entry.launches for entry in scoped] == [1, 1]
+            assert all(entry._closed and not entry.browsers[0].connected for entry in scoped)
+
+    def test_slide_cache_io_runs_off_event_loop(self):
+        class SlideSourcesPage(AsyncFakePage):
+            async def evaluate(self, script, arg=None):
+                if script == async_converter.SLIDE_SOURCES_SCRIPT:
+                    return {'context': '<head></head>', 'slides': ['<div>1</div>', '<div>2</div>']}
+                return None
+
+        class RecordingCache:
+            def __init__(self):
+                self.threads = []
+
+            def _record(self):
+                self.threads.append(threading.current_thread().name)
+
+            def context_key(self, *args):
+                self._record()
+                return "context"
+
+            def slide_key(self, context_key, slide_html):
+                return f"{context_key}|{slide_html}"
+
+            def restore(self, key, path):
+                self._record()
+                return False
+
+            def put(self, key, path):
+                self._record()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "deck.html"
+            html_file.write_text('<div class="slide">1</div><div class="slide">2</div>', encoding="utf-8")
+            converter = AsyncPresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                                   render_mode="parallel", use_cache=False)
+            converter.cache = RecordingCache()
+            browser = AsyncFakeBrowser(1)
+
+            rendered = asyncio.run(converter._render_share_async(
+                SlideSourcesPage(browser), html_file, Path(temp_dir) / "deck.pdf", 0, 1
+            ))
+
+            assert [index for index, _ in rendered] == [0, 1]
+            # context key + a restore and a put per slide, none of them on the event loop thread
+            assert len(converter.cache.threads) == 5
+            assert "MainThread" not in converter.cache.threads
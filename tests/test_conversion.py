@@ -193,6 +193,94 @@ class TestPresentationConverter:
         if len(file_sizes) > 1:
             assert all(size > 0 for size in file_sizes)
 
+    def test_single_pass_render_mode(self):
+        """Test that single-pass mode prints the whole deck with one page.pdf call"""
+        class RecordingPage:
+            def __init__(self):
+                self.calls = []
+                self.keyboard = self
+
+            def __getattr__(self, name):
+                def record(*args, **kwargs):
+                    self.calls.append((name, args, kwargs))
+                    return [object()] * 3 if name == "query_selector_all" else None
+                return record
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "test_presentation.html"
+            html_file.write_text(SAMPLE_HTML, encoding='utf-8')
+
+            with pytest.raises(ValueError):
+                PresentationConverter(str(html_file), output_dir=temp_dir, render_mode="fast")
+
+            converter = PresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                              zoom_factor=1.0, render_mode="single_pass")
+            page = RecordingPage()
+            converter._render_playwright_page(page, html_file, Path(temp_dir) / "out.pdf")
+
+            names = [name for name, _, _ in page.calls]
+            assert names.count("pdf") == 1
+            assert "press" not in names
+            styles = [kwargs["content"] for name, _, kwargs in page.calls if name == "add_style_tag"]
+            assert any("height: 8.6in" in style for style in styles)
+            assert not list(Path(temp_dir).glob("temp_*slide_*.pdf"))
+
+    def test_parallel_render_mode(self, inline_browser_pool, monkeypatch):
+        """Test that parallel mode splits slides across pages and merges them in order"""
+        from opencanvas.conversion.html_to_pdf import split_slides
+        from tests.conftest import FakeSlidePage
+
+        assert split_slides(7, 3) == [[0, 1, 2], [3, 4], [5, 6]]
+        assert split_slides(2, 4) == [[0], [1]]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "test_presentation.html"
+            html_file.write_text(SAMPLE_HTML, encoding='utf-8')
+            converter = PresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                              zoom_factor=1.0, render_mode="parallel", use_cache=False)
+
+            pool = inline_browser_pool(lambda: FakeSlidePage(count=5))
+            monkeypatch.setattr(Config, "PARALLEL_CAPTURE_PAGES", 2)
+            merged = []
+            page_names = []
+
+            def combine(paths, output):
+                page_names.extend(Path(path).name for path in paths)
+                merged.extend(Path(path).read_text() for path in paths)
+            converter._combine_pdfs = combine
+            converter._render_playwright_parallel(html_file, Path(temp_dir) / "out.pdf")
+
+            assert [page.printed for page in pool.pages] == [[0, 1, 2], [3, 4]]
+            assert merged == [f"slide {i}" for i in range(5)]
+            # Per-slide files are named after the output so conversions sharing a directory do not collide
+            assert page_names == [f"temp_out_slide_{i:02d}.pdf" for i in range(1, 6)]
+            assert not list(Path(temp_dir).glob("temp_*slide_*.pdf"))
+
+    def test_parallel_render_failure_removes_slide_pdfs(self, inline_browser_pool, monkeypatch):
+        """Test that a failing share leaves no per-slide PDFs behind"""
+        from tests.conftest import FakeSlidePage
+
+        class FailingPage(FakeSlidePage):
+            def pdf(self, path, **kwargs):
+                if self.active == 4:
+                    raise RuntimeError("page crashed")
+                super().pdf(path, **kwargs)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "test_presentation.html"
+            html_file.write_text(SAMPLE_HTML, encoding='utf-8')
+            converter = PresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                              zoom_factor=1.0, render_mode="parallel", use_cache=False)
+
+            pool = inline_browser_pool(lambda: FailingPage(count=5))
+            monkeypatch.setattr(Config, "PARALLEL_CAPTURE_PAGES", 2)
+            with pytest.raises(RuntimeError):
+                converter._render_playwright_parallel(html_file, Path(temp_dir) / "out.pdf")
+
+            assert [page.printed for page in pool.pages] == [[0, 1, 2], [3]]
+            assert not list(Path(temp_dir).glob("temp_*slide_*.pdf"))
+
+
 def run_conversion_tests():
     """Run conversion tests and return results"""
     results = {}
@@ -0,0 +1,108 @@
+import tempfile
+from pathlib import Path
+
+from opencanvas.config import Config
+from opencanvas.conversion.conversion_cache import ConversionCache, asset_fingerprint
+from opencanvas.conversion.html_to_pdf import PresentationConverter
+from tests.conftest import FakeSlidePage
+
+DECK_HTML = """<html><head><style>.slide { background: url('images/bg.png'); }</style></head>
+<body>
+<div class="slide active"><img src="images/chart.png"><img src="https://example.com/remote.png"></div>
+<div class="slide"><h2>Two</h2></div>
+</body></html>"""
+
+
+class TestConversionCache:
+    """Test cases for the conversion result cache"""
+
+    def make_deck(self, temp_dir):
+        deck = Path(temp_dir) / "deck"
+        (deck / "images").mkdir(parents=True)
+        (deck / "images" / "chart.png").write_bytes(b"chart-v1")
+        (deck / "images" / "bg.png").write_bytes(b"background")
+        html_file = deck / "presentation.html"
+        html_file.write_text(DECK_HTML, encoding="utf-8")
+        return html_file
+
+    def test_key_covers_html_assets_and_settings(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = self.make_deck(temp_dir)
+            settings = {"method": "playwright", "zoom_factor": 1.2}
+            key = ConversionCache.document_key(html_file, settings)
+
+            assert ConversionCache.document_key(html_file, dict(settings)) == key
+            assert ConversionCache.document_key(html_file, {**settings, "zoom_factor": 1.0}) != key
+
+            fingerprint = asset_fingerprint(DECK_HTML, html_file.parent)
+            (html_file.parent / "images" / "chart.png").write_bytes(b"chart-v2")
+            assert asset_fingerprint(DECK_HTML, html_file.parent) != fingerprint
+            assert ConversionCache.document_key(html_file, settings) != key
+
+    def test_convert_serves_identical_conversions_from_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = self.make_deck(temp_dir)
+            converter = PresentationConverter(str(html_file), output_dir=str(Path(temp_dir) / "out"),
+                                              method="playwright", use_cache=True)
+            converter.cache = ConversionCache(Path(temp_dir) / "cache")
+
+            calls = []
+
+            def fake_convert(output_filename):
+                calls.append(output_filename)
+                pdf_path = converter.output_dir / output_filename
+                pdf_path.write_bytes(b"%PDF-1.4 deck")
+                return str(pdf_path)
+
+            converter.convert_with_playwright = fake_convert
+            first = converter.convert("first.pdf")
+            second = converter.convert("second.pdf")
+
+            assert calls == ["first.pdf"]
+            assert Path(second).read_bytes() == Path(first).read_bytes()
+            assert converter.cache.get_stats()["hits"] == 1
+
+    def test_degraded_conversions_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = self.make_deck(temp_dir)
+            converter = PresentationConverter(str(html_file), output_dir=str(Path(temp_dir) / "out"),
+                                              method="playwright", use_cache=True)
+            converter.cache = ConversionCache(Path(temp_dir) / "cache", ttl_seconds=60)
+
+            calls = []
+
+            def fake_convert(output_filename):
+                calls.append(output_filename)
+                converter.degraded.append("slide PDFs could not be merged")
+                pdf_path = converter.output_dir / output_filename
+                pdf_path.write_bytes(b"%PDF-1.4 first slide only")
+                return str(pdf_path)
+
+            converter.convert_with_playwright = fake_convert
+            converter.convert("first.pdf")
+            converter.convert("second.pdf")
+
+            assert calls == ["first.pdf", "second.pdf"]
+            assert converter.cache.get_stats()["hits"] == 0
+
+    def test_only_changed_slides_are_rerendered(self, inline_browser_pool, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = self.make_deck(temp_dir)
+            converter = PresentationConverter(str(html_file), output_dir=str(Path(temp_dir) / "out"),
+                                              method="playwright", render_mode="parallel", use_cache=True)
+            converter.cache = ConversionCache(Path(temp_dir) / "cache")
+            merged = []
+            converter._combine_pdfs = lambda paths, output: merged.append([Path(p).read_text() for p in paths])
+            monkeypatch.setattr(Config, "PARALLEL_CAPTURE_PAGES", 1)
+
+            first = FakeSlidePage(["<div>one</div>", "<div>two</div>", "<div>three</div>"])
+            inline_browser_pool(lambda: first)
+            converter._render_playwright_parallel(html_file, Path(temp_dir) / "a.pdf")
+
+            variant = FakeSlidePage(["<div>one</div>", "<div>TWO</div>", "<div>three</div>"])
+            inline_browser_pool(lambda: variant)
+            converter._render_playwright_parallel(html_file, Path(temp_dir) / "b.pdf")
+
+            assert first.printed == [0, 1, 2]
+            assert variant.printed == [1]
+            assert merged[1] == ["<div>one</div>", "<div>TWO</div>", "<div>three</div>"]
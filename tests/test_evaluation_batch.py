@@ -0,0 +1,119 @@
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from opencanvas.evaluation.batch import EvaluationBatchRunner, average_scores, find_presentations
+from opencanvas.evaluation.evaluator import EvaluationResult
+
+
+class FakeEvaluator:
+    """Stand-in for PresentationEvaluator that records calls"""
+
+    def __init__(self, failures=None, delay=0.0):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def evaluate_presentation_with_sources(self, presentation_pdf_path, source_content_path=None, source_pdf_path=None):
+        with self._lock:
+            self.calls.append((presentation_pdf_path, source_content_path, source_pdf_path))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.failures.get(presentation_pdf_path, 0) > 0:
+                self.failures[presentation_pdf_path] -= 1
+                return EvaluationResult(visual_scores={"error": "rate limited"}, content_free_scores={},
+                                        overall_scores={"visual": 0.0})
+            return EvaluationResult(visual_scores={"overall_visual_score": 4.0},
+                                    content_free_scores={"overall_content_score": 3.0},
+                                    overall_scores={"visual": 4.0, "presentation_overall": 3.5})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_deck(folder, organized=False, source=False):
+    folder = Path(folder)
+    if organized:
+        (folder / "slides").mkdir(parents=True)
+        (folder / "slides" / "presentation.pdf").write_bytes(b"%PDF-1.4 " + folder.name.encode())
+        (folder / "sources").mkdir()
+        (folder / "sources" / "source_content.txt").write_text("source", encoding="utf-8")
+    else:
+        folder.mkdir(parents=True)
+        (folder / "presentation.pdf").write_bytes(b"%PDF-1.4 " + folder.name.encode())
+        if source:
+            (folder / "source.pdf").write_bytes(b"%PDF-1.4 paper")
+
+
+class TestEvaluationBatch:
+    """Test cases for bulk evaluation"""
+
+    def test_find_presentations(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            make_deck(root / "papers" / "attention", source=True)
+            make_deck(root / "topics" / "reefs", organized=True)
+            make_deck(root / "plain")
+
+            items = find_presentations(root)
+
+            assert [item.id for item in items] == ["papers/attention", "plain", "topics/reefs"]
+            assert items[0].source_pdf.endswith("source.pdf")
+            assert items[1].source_pdf is None and items[1].source_content is None
+            assert items[2].source_content.endswith("source_content.txt")
+            assert items[2].presentation_pdf.endswith(str(Path("slides") / "presentation.pdf"))
+
+    def test_parallel_retries_and_resume(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "decks"
+            for name in ("a", "b", "c", "d"):
+                make_deck(root / name)
+            items = find_presentations(root)
+            results_path = Path(temp_dir) / "results.jsonl"
+
+            evaluator = FakeEvaluator(failures={items[0].presentation_pdf: 1}, delay=0.2)
+            runner = EvaluationBatchRunner(evaluator, max_workers=4, max_retries=1, retry_backoff=0)
+            started = time.perf_counter()
+            results = runner.run(items, results_path=results_path)
+
+            assert time.perf_counter() - started < 0.7
+            assert evaluator.max_active == 4
+            assert all(result.status == 'success' for result in results)
+            assert {result.id: result.attempts for result in results}["a"] == 2
+            assert average_scores(results) == {"visual": 4.0, "presentation_overall": 3.5}
+
+            records = [json.loads(line) for line in results_path.read_text(encoding="utf-8").splitlines()]
+            assert sorted(record["id"] for record in records) == ["a", "b", "c", "d"]
+
+            # Rerunning skips finished decks unless their presentation changed
+            (root / "b" / "presentation.pdf").write_bytes(b"%PDF-1.4 revised")
+            rerun = FakeEvaluator()
+            results = EvaluationBatchRunner(rerun, max_workers=2).run(items, results_path=results_path)
+            assert [result.id for result in results] == ["b"]
+
+    def test_persistent_failures_are_recorded(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            make_deck(root / "broken")
+            items = find_presentations(root)
+            results_path = root / "results.jsonl"
+
+            evaluator = FakeEvaluator(failures={items[0].presentation_pdf: 5})
+            results = EvaluationBatchRunner(evaluator, max_workers=1, max_retries=1, retry_backoff=0).run(
+                items, results_path=results_path)
+
+            assert results[0].status == 'failed'
+            assert "rate limited" in results[0].error
+            assert len(evaluator.calls) == 2
+
+            # Failed decks are evaluated again on the next run
+            rerun = FakeEvaluator()
+            EvaluationBatchRunner(rerun, max_workers=1).run(items, results_path=results_path)
+            assert len(rerun.calls) == 1
@@ -0,0 +1,153 @@
+import mmap
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from opencanvas.config import Config
+from opencanvas.evaluation.evaluation_cache import EvaluationCache
+from opencanvas.evaluation.evaluator import PresentationEvaluator
+
+
+def make_evaluator(concurrent):
+    evaluator = PresentationEvaluator("test-key", model="claude-test", provider="claude",
+                                      concurrent=concurrent, use_cache=False, upload_files=False)
+    threads = set()
+
+    def fake_call(prompt, presentation_pdf_data, source_pdf_data=None):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.3)
+        if prompt == evaluator.prompts.visual:
+            return {"overall_visual_score": 4.0}
+        if prompt == evaluator.prompts.content_free:
+            return {"overall_content_score": 3.0}
+        assert source_pdf_data is not None
+        return {"overall_accuracy_coverage_score": 2.0}
+
+    evaluator.call_api_with_pdfs = fake_call
+    return evaluator, threads
+
+
+class TestPresentationEvaluator:
+    """Test cases for running the evaluation dimensions"""
+
+    def make_folder(self, temp_dir):
+        (Path(temp_dir) / "presentation.pdf").write_bytes(b"%PDF-1.4 slides")
+        (Path(temp_dir) / "source.pdf").write_bytes(b"%PDF-1.4 paper")
+        return temp_dir
+
+    def test_concurrent_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = self.make_folder(temp_dir)
+
+            evaluator, threads = make_evaluator(concurrent=True)
+            started = time.perf_counter()
+            concurrent_result = evaluator.evaluate_presentation(folder)
+            concurrent_seconds = time.perf_counter() - started
+
+            sequential_evaluator, _ = make_evaluator(concurrent=False)
+            sequential_result = sequential_evaluator.evaluate_presentation(folder)
+
+            assert concurrent_result == sequential_result
+            assert concurrent_result.overall_scores["content_combined"] == 2.5
+            assert concurrent_seconds < 0.8
+            assert len(threads) == 3
+
+    def test_with_sources_runs_concurrently(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(self.make_folder(temp_dir))
+            evaluator, threads = make_evaluator(concurrent=True)
+
+            started = time.perf_counter()
+            result = evaluator.evaluate_presentation_with_sources(
+                str(folder / "presentation.pdf"), source_pdf_path=str(folder / "source.pdf"))
+
+            assert time.perf_counter() - started < 0.8
+            assert result.content_required_scores == {"overall_accuracy_coverage_score": 2.0}
+            assert len(threads) == 3
+
+    def test_memory_mapped_documents_are_closed(self, monkeypatch):
+        monkeypatch.setattr(Config, "PDF_MMAP_THRESHOLD_MB", 1 / (1024 * 1024))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(self.make_folder(temp_dir))
+            evaluator, _ = make_evaluator(concurrent=True)
+            fake_call = evaluator.call_api_with_pdfs
+            documents = []
+
+            def recording_call(prompt, presentation_pdf_data, source_pdf_data=None):
+                documents.extend(document for document in (presentation_pdf_data, source_pdf_data) if document)
+                return fake_call(prompt, presentation_pdf_data, source_pdf_data)
+
+            evaluator.call_api_with_pdfs = recording_call
+            evaluator.evaluate_presentation(str(folder))
+            evaluator.evaluate_presentation_with_sources(
+                str(folder / "presentation.pdf"), source_pdf_path=str(folder / "source.pdf"))
+
+            def failing_call(prompt, presentation_pdf_data, source_pdf_data=None):
+                documents.append(presentation_pdf_data)
+                raise RuntimeError("provider down")
+
+            evaluator.call_api_with_pdfs = failing_call
+            with pytest.raises(RuntimeError):
+                evaluator.evaluate_presentation_with_sources(str(folder / "presentation.pdf"))
+
+            assert documents and all(isinstance(document._data, mmap.mmap) for document in documents)
+            assert all(document._data.closed for document in documents)
+
+
+class TestEvaluationCache:
+    """Test cases for reusing stored evaluation results"""
+
+    def make_evaluator(self, cache_dir, responses=None):
+        evaluator = PresentationEvaluator("test-key", model="claude-test", provider="claude", use_cache=False,
+                                          upload_files=False)
+        evaluator.cache = EvaluationCache(cache_dir)
+        calls = []
+
+        def fake_provider(prompt, presentation_pdf_data, source_pdf_data=None):
+            calls.append(prompt)
+            return dict(responses or {"overall_visual_score": 4.0})
+
+        evaluator.call_claude_api_with_pdfs = fake_provider
+        return evaluator, calls
+
+    def test_repeat_evaluation_uses_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            (folder / "presentation.pdf").write_bytes(b"%PDF-1.4 slides")
+            (folder / "source.pdf").write_bytes(b"%PDF-1.4 paper")
+
+            evaluator, calls = self.make_evaluator(folder / "cache")
+            first = evaluator.evaluate_presentation(str(folder))
+            assert len(calls) == 3
+
+            second_evaluator, second_calls = self.make_evaluator(folder / "cache")
+            second = second_evaluator.evaluate_presentation(str(folder))
+            assert second_calls == []
+            assert second.visual_scores == first.visual_scores
+
+            (folder / "presentation.pdf").write_bytes(b"%PDF-1.4 revised slides")
+            second_evaluator.evaluate_presentation(str(folder))
+            assert len(second_calls) == 3
+
+    def test_key_covers_prompt_model_and_sources(self):
+        key = EvaluationCache.make_key("claude", "model-a", "prompt", b"slides", b"paper")
+        assert key == EvaluationCache.make_key("claude", "model-a", "prompt", b"slides", b"paper")
+        assert key != EvaluationCache.make_key("claude", "model-b", "prompt", b"slides", b"paper")
+        assert key != EvaluationCache.make_key("claude", "model-a", "other prompt", b"slides", b"paper")
+        assert key != EvaluationCache.make_key("claude", "model-a", "prompt", b"slides", b"other paper")
+        assert key != EvaluationCache.make_key("claude", "model-a", "prompt", b"slides")
+
+    def test_errors_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            evaluator, calls = self.make_evaluator(temp_dir, responses={"error": "rate limited"})
+            evaluator.call_api_with_pdfs("prompt", "c2xpZGVz")
+            evaluator.call_api_with_pdfs("prompt", "c2xpZGVz")
+            assert len(calls) == 2
+
+    def test_bypass_flag_disables_cache(self):
+        evaluator = PresentationEvaluator("test-key", model="claude-test", provider="claude", use_cache=False,
+                                          upload_files=False)
+        assert evaluator.cache is None
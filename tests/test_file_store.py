@@ -0,0 +1,136 @@
+import base64
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from opencanvas.evaluation.evaluator import PresentationEvaluator
+from opencanvas.evaluation.file_store import ANTHROPIC_FILES_BETA, FileStore, LocalFileStore
+
+
+class SlowLocalFileStore(LocalFileStore):
+    def _upload(self, pdf_bytes, filename):
+        threading.Event().wait(0.1)
+        return super()._upload(pdf_bytes, filename)
+
+
+class ShortLivedLocalFileStore(LocalFileStore):
+    ttl_seconds = 0.05
+
+
+class FakeTransport:
+    name = "direct"
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **params):
+        self.requests.append(params)
+        return SimpleNamespace(content=[SimpleNamespace(text='{"overall_visual_score": 4.0}')])
+
+
+class TestFileStore:
+    """Test cases for upload-once document handles"""
+
+    def test_uploads_each_document_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = LocalFileStore(temp_dir)
+            pdf = b"%PDF-1.4 slides"
+
+            file_id = store.file_id(pdf, "presentation.pdf")
+            assert store.file_id(base64.b64encode(pdf).decode('utf-8')) == file_id
+            assert store.read(file_id) == pdf
+            assert store.uploads == 1
+
+            # The index survives restarts
+            assert LocalFileStore(temp_dir).file_id(pdf) == file_id
+
+    def test_concurrent_requests_share_one_upload(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SlowLocalFileStore(temp_dir)
+            ids = []
+            threads = [threading.Thread(target=lambda: ids.append(store.file_id(b"%PDF-1.4 slides")))
+                       for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(set(ids)) == 1
+            assert store.uploads == 1
+
+    def test_forget_and_accounts(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = LocalFileStore(temp_dir)
+            store.file_id(b"%PDF-1.4 slides")
+            store.forget(b"%PDF-1.4 slides")
+            store.file_id(b"%PDF-1.4 slides")
+            assert store.uploads == 2
+
+            other_account = LocalFileStore(temp_dir, account="other-key")
+            other_account.file_id(b"%PDF-1.4 slides")
+            assert other_account.uploads == 1
+
+    def test_evaluator_references_uploaded_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            (folder / "presentation.pdf").write_bytes(b"%PDF-1.4 slides")
+            (folder / "source.pdf").write_bytes(b"%PDF-1.4 paper")
+
+            evaluator = PresentationEvaluator("test-key", model="claude-test", provider="claude", use_cache=False,
+                                              upload_files=False)
+            evaluator.transport = FakeTransport()
+            evaluator.file_store = LocalFileStore(folder / "files")
+            evaluator.evaluate_presentation(str(folder))
+
+            assert evaluator.file_store.uploads == 2
+            documents = [block for params in evaluator.transport.requests
+                         for block in params["messages"][0]["content"] if block["type"] == "document"]
+            assert len(documents) == 4
+            assert all(block["source"]["type"] == "file" for block in documents)
+            assert all(params["extra_headers"]["anthropic-beta"] == ANTHROPIC_FILES_BETA
+                       for params in evaluator.transport.requests)
+
+    def test_only_missing_file_errors_forget_uploads(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = LocalFileStore(temp_dir)
+            file_id = store.file_id(b"%PDF-1.4 slides")
+
+            for error in ("Error code: 429 - rate_limit_error", "Request timed out", "Failed to parse JSON response"):
+                assert store.forget_missing(error, b"%PDF-1.4 slides", None) == 0
+            store.file_id(b"%PDF-1.4 slides")
+            assert store.uploads == 1
+
+            assert store.forget_missing(f"Error code: 404 - File not found: {file_id}", b"%PDF-1.4 slides") == 1
+            # Only the index entry is dropped; the remote file is left for cleanup()
+            assert store.read(file_id) == b"%PDF-1.4 slides"
+            assert store.deletions == 0
+            store.file_id(b"%PDF-1.4 slides")
+            assert store.uploads == 2
+
+    def test_base_store_requires_upload(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(TypeError):
+                FileStore(cache_dir=temp_dir)
+
+    def test_expired_uploads_are_deleted(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = ShortLivedLocalFileStore(temp_dir)
+            first = store.file_id(b"%PDF-1.4 slides")
+            store.file_id(b"%PDF-1.4 paper")
+            time.sleep(0.1)
+
+            # An expired upload is deleted and the document uploaded again
+            assert store.file_id(b"%PDF-1.4 slides") == first
+            assert store.uploads == 3 and store.deletions == 1
+
+            # cleanup() removes the remaining expired upload, but only for this account
+            other_account = ShortLivedLocalFileStore(temp_dir, account="other-key")
+            other_id = other_account.file_id(b"%PDF-1.4 other")
+            time.sleep(0.1)
+            assert store.cleanup() == 2
+            assert [path.name for path in store.files_dir.iterdir()] == [other_id]
+            assert store.cleanup(expired_only=False) == 0
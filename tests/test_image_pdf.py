@@ -0,0 +1,51 @@
+import io
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+from PyPDF2 import PdfReader
+
+from opencanvas.conversion.html_to_pdf import PresentationConverter
+from opencanvas.conversion.image_pdf import ImagePDFWriter
+
+
+def screenshot(number, size=(1920, 1080)):
+    output = io.BytesIO()
+    Image.new("RGBA", size, (number * 4 % 256, 80, 160, 255)).save(output, format="PNG")
+    return output.getvalue()
+
+
+class TestImagePDFWriter:
+    """Test cases for streaming screenshot PDFs"""
+
+    def test_pages_stream_in_order_with_bounded_backlog(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "deck.pdf"
+            backlog = []
+            with ImagePDFWriter(pdf_path, zoom_factor=1.0, workers=2) as writer:
+                for number in range(55):
+                    writer.add(screenshot(number))
+                    backlog.append(len(writer._pending))
+
+            assert max(backlog) < writer.max_pending
+            reader = PdfReader(str(pdf_path))
+            assert len(reader.pages) == 55
+            assert {(float(page.mediabox.width), float(page.mediabox.height)) for page in reader.pages} == {(1920.0, 1080.0)}
+            assert b"/DCTDecode" in pdf_path.read_bytes()
+
+    def test_create_pdf_from_image_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "deck.html"
+            html_file.write_text('<div class="slide">1</div>', encoding="utf-8")
+            image_paths = []
+            for number in range(3):
+                path = Path(temp_dir) / f"slide_{number + 1:02d}.png"
+                path.write_bytes(screenshot(number, size=(1600, 1200)))
+                image_paths.append(str(path))
+
+            converter = PresentationConverter(str(html_file), output_dir=temp_dir, zoom_factor=1.0, use_cache=False)
+            pdf_path = converter.create_pdf_from_images(image_paths, "from_files.pdf")
+
+            page = PdfReader(pdf_path).pages[0]
+            assert round(float(page.mediabox.width), 2) == round(1200 * 16 / 9, 2)
+            assert float(page.mediabox.height) == 1200.0
@@ -0,0 +1,142 @@
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
+
+from opencanvas.generators.incremental import IncrementalSlidePipeline
+from opencanvas.generators.streaming import HTMLStreamSink
+from tests.test_streaming import SAMPLE_DECK, make_stream
+
+
+class FakeValidator:
+    """Pretends to replace an image on the second slide"""
+
+    def validate_and_fix_slides(self, slides):
+        html = slides[0]['html'].replace("<h2>Second</h2>", "<h2>Second (validated)</h2>")
+        changed = html != slides[0]['html']
+        return [{'html': html, 'id': slides[0]['id']}], {
+            'total_images_checked': 1,
+            'successful_replacements': int(changed),
+            'slides_with_changes': int(changed),
+        }
+
+
+class FakeRenderer:
+    """Records the standalone documents it is asked to render"""
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.documents = {}
+        self.closed = False
+
+    def submit(self, index, document_html):
+        self.documents[index] = document_html
+        page = self.output_dir / f"temp_slide_{index + 1:02d}.pdf"
+        page.write_bytes(b"%PDF-1.4")
+        future = Future()
+        future.set_result(str(page))
+        return future
+
+    def combine(self, page_paths, output_path):
+        Path(output_path).write_bytes(b"%PDF-1.4 combined")
+        return str(output_path)
+
+    def close(self):
+        self.closed = True
+
+
+class TestIncrementalSlidePipeline:
+    """Test cases for slide-by-slide post-processing"""
+
+    def test_validates_and_renders_slides_during_stream(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "presentation.html"
+            renderer = FakeRenderer(temp_dir)
+            pipeline = IncrementalSlidePipeline(
+                image_validator=FakeValidator(),
+                renderer=renderer,
+                stream_file=stream_file
+            )
+
+            with HTMLStreamSink(output_file=stream_file, on_slide=pipeline.on_slide) as sink:
+                html = sink.consume(make_stream(SAMPLE_DECK, 11))
+
+            html, report = pipeline.finish(html, pdf_path=Path(temp_dir) / "presentation.pdf")
+
+            assert "<h2>Second (validated)</h2>" in html
+            assert report['processed_slides'] == 2
+            assert report['successful_replacements'] == 1
+            assert report['pdf_file'] == str(Path(temp_dir) / "presentation.pdf")
+            assert report['time_to_first_slide'] is not None
+            assert renderer.closed
+
+            # Each slide is rendered as a standalone document with the deck's head
+            assert set(renderer.documents) == {0, 1}
+            second = renderer.documents[1]
+            assert second.startswith("<!DOCTYPE html>")
+            assert "<style>" in second
+            assert "Second (validated)" in second and "Title" not in second
+
+    def test_trailing_scripts_are_rendered_with_every_slide(self):
+        script = "<script>new Chart(document.getElementById('c'));</script>"
+        deck = SAMPLE_DECK.replace("</body>", script + "\n</body>")
+        assert deck != SAMPLE_DECK
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "presentation.html"
+            renderer = FakeRenderer(temp_dir)
+            pipeline = IncrementalSlidePipeline(renderer=renderer, stream_file=stream_file)
+
+            with HTMLStreamSink(output_file=stream_file, on_slide=pipeline.on_slide) as sink:
+                html = sink.consume(make_stream(deck, 11))
+
+            html, report = pipeline.finish(html, pdf_path=Path(temp_dir) / "presentation.pdf")
+
+            assert report['pdf_file'] == str(Path(temp_dir) / "presentation.pdf")
+            assert set(renderer.documents) == {0, 1}
+            for document in renderer.documents.values():
+                assert script in document
+                assert document.rstrip().endswith("</html>")
+
+    def test_validated_last_slide_with_head_script(self):
+        deck = SAMPLE_DECK.replace("</style>", "</style><script>window.deck = true;</script>")
+        assert deck != SAMPLE_DECK
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "presentation.html"
+            renderer = FakeRenderer(temp_dir)
+            pipeline = IncrementalSlidePipeline(
+                image_validator=FakeValidator(),
+                renderer=renderer,
+                stream_file=stream_file
+            )
+
+            with HTMLStreamSink(output_file=stream_file, on_slide=pipeline.on_slide) as sink:
+                html = sink.consume(make_stream(deck, 11))
+
+            html, report = pipeline.finish(html, pdf_path=Path(temp_dir) / "presentation.pdf")
+
+            # The last slide changed during validation; the head script is not a trailing one
+            assert "<h2>Second (validated)</h2>" in html
+            assert report['pdf_file'] == str(Path(temp_dir) / "presentation.pdf")
+            assert "window.deck" in renderer.documents[1]
+
+    def test_failed_merge_leaves_pdf_to_converter(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stream_file = Path(temp_dir) / "presentation.html"
+            renderer = FakeRenderer(temp_dir)
+            renderer.combine = lambda page_paths, output_path: None
+            pipeline = IncrementalSlidePipeline(renderer=renderer, stream_file=stream_file)
+
+            with HTMLStreamSink(output_file=stream_file, on_slide=pipeline.on_slide) as sink:
+                html = sink.consume(make_stream(SAMPLE_DECK, 11))
+
+            html, report = pipeline.finish(html, pdf_path=Path(temp_dir) / "presentation.pdf")
+
+            assert 'pdf_file' not in report
+
+    def test_without_renderer_only_validates(self):
+        pipeline = IncrementalSlidePipeline(image_validator=FakeValidator())
+        sink = HTMLStreamSink(on_slide=pipeline.on_slide)
+        html = sink.consume(make_stream(SAMPLE_DECK, 64))
+
+        html, report = pipeline.finish(html)
+        assert "Second (validated)" in html
+        assert 'pdf_file' not in report
@@ -0,0 +1,78 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from opencanvas.llm.clients import close_clients, get_anthropic_client, get_http_client
+
+
+class MessagesStandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive stand-in for the Messages endpoint that records client ports"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.client_ports.add(self.client_address[1])
+        self.server.requests += 1
+
+        if self.server.requests == 1:
+            # First request is rate limited and must be retried by the client
+            status, payload = 429, {"type": "error", "error": {"type": "rate_limit_error", "message": "slow down"}}
+        else:
+            status, payload = 200, {
+                "id": "msg_1", "type": "message", "role": "assistant", "model": "stand-in",
+                "content": [{"type": "text", "text": "ok"}],
+                "stop_reason": "end_turn", "stop_sequence": None,
+                "usage": {"input_tokens": 1, "output_tokens": 1}}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("retry-after-ms", "1")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def messages_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MessagesStandInHandler)
+    server.client_ports = set()
+    server.requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    close_clients()
+    yield
+    close_clients()
+
+
+class TestClientRegistry:
+    """Test cases for the shared Anthropic client registry"""
+
+    def test_clients_are_shared_per_key(self):
+        first = get_anthropic_client("key-a")
+        assert get_anthropic_client("key-a") is first
+        assert get_anthropic_client("key-b") is not first
+        assert get_anthropic_client("key-b")._client is first._client is get_http_client()
+
+    def test_requests_reuse_connections_and_retry(self, messages_server):
+        base_url = f"http://127.0.0.1:{messages_server.server_address[1]}"
+        request = {"model": "stand-in", "max_tokens": 10, "messages": [{"role": "user", "content": "hi"}]}
+
+        # Two components asking for a client get the same one and share its connection
+        for _ in range(2):
+            message = get_anthropic_client("test-key", base_url=base_url).messages.create(**request)
+            assert message.content[0].text == "ok"
+
+        assert messages_server.requests == 3  # one rate-limited attempt, then two successes
+        assert len(messages_server.client_ports) == 1
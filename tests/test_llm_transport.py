@@ -0,0 +1,167 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from anthropic import Anthropic
+
+from opencanvas.generators.streaming import HTMLStreamSink
+from opencanvas.generators.topic_generator import TopicGenerator
+from opencanvas.llm.prompt_cache import PromptCacheMetrics, cached_system, split_template
+from opencanvas.llm.transport import BatchRequestError, MessageBatchTransport, message_text
+
+
+class BatchStandInHandler(BaseHTTPRequestHandler):
+    """Minimal local stand-in for the Message Batches endpoints"""
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, payload, content_type="application/json"):
+        body = payload.encode("utf-8") if isinstance(payload, str) else json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _batch(self, batch_id):
+        state = self.server.batches[batch_id]
+        state["polls"] += 1
+        ended = state["polls"] > 1  # Report "in_progress" once before ending
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {"processing": 0, "succeeded": len(state["requests"]),
+                               "errored": 0, "canceled": 0, "expired": 0},
+            "created_at": "2024-01-01T00:00:00Z",
+            "expires_at": "2024-01-02T00:00:00Z",
+            "ended_at": "2024-01-01T00:01:00Z" if ended else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"http://{self.server.server_address[0]}:{self.server.server_address[1]}"
+                           f"/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        requests = json.loads(self.rfile.read(length))["requests"]
+        batch_id = f"msgbatch_{len(self.server.batches) + 1}"
+        self.server.batches[batch_id] = {"requests": requests, "polls": 0}
+        self._send_json(self._batch(batch_id))
+
+    def do_GET(self):
+        parts = self.path.split("?")[0].strip("/").split("/")
+        batch_id = parts[3]
+        if parts[-1] != "results":
+            self._send_json(self._batch(batch_id))
+            return
+
+        lines = []
+        # Return results out of order: callers must be matched by custom_id
+        for request in reversed(self.server.batches[batch_id]["requests"]):
+            prompt = request["params"]["messages"][0]["content"]
+            if prompt == "fail":
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "invalid_request_error", "message": "bad request"}}}
+            else:
+                result = {"type": "succeeded", "message": {
+                    "id": "msg_1", "type": "message", "role": "assistant", "model": "stand-in",
+                    "content": [{"type": "text", "text": f"echo: {prompt}"}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": 1, "output_tokens": 1}}}
+            lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}))
+        self._send_json("\n".join(lines) + "\n", content_type="application/binary")
+
+
+@pytest.fixture
+def batch_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BatchStandInHandler)
+    server.batches = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+def make_request(prompt):
+    return {"model": "stand-in", "max_tokens": 10, "messages": [{"role": "user", "content": prompt}]}
+
+
+class TestMessageBatchTransport:
+    """Test cases for the message batch transport"""
+
+    def test_concurrent_requests_share_one_batch(self, batch_server):
+        client = Anthropic(api_key="test-key", base_url=f"http://127.0.0.1:{batch_server.server_address[1]}")
+        transport = MessageBatchTransport(client, max_batch_size=5, max_wait_seconds=5, poll_interval=0.01)
+        try:
+            prompts = [f"prompt {i}" for i in range(5)]
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                messages = list(executor.map(lambda prompt: transport.create(**make_request(prompt)), prompts))
+
+            assert [message_text(message) for message in messages] == [f"echo: {prompt}" for prompt in prompts]
+            assert len(batch_server.batches) == 1
+        finally:
+            transport.close()
+
+    def test_errors_and_streaming(self, batch_server):
+        client = Anthropic(api_key="test-key", base_url=f"http://127.0.0.1:{batch_server.server_address[1]}")
+        transport = MessageBatchTransport(client, max_batch_size=10, max_wait_seconds=0.05, poll_interval=0.01)
+        try:
+            failing = transport.submit(**make_request("fail"))
+            sink = HTMLStreamSink()
+            text = sink.consume(transport.stream(stream=True, **make_request("<div class=\"slide\">x</div>")))
+
+            assert text == "echo: <div class=\"slide\">x</div>"
+            assert len(sink.slides) == 1
+            with pytest.raises(BatchRequestError):
+                failing.result(timeout=5)
+        finally:
+            transport.close()
+
+
+class TestPromptCache:
+    """Test cases for cache-aware prompt construction"""
+
+    def test_split_template_keeps_static_prefix_identical(self):
+        template = "Build slides from:\n\n{blog_content}\n\nTheme: {theme}\nUse the \"{theme}\" palette. CSS: a {{ color: red; }}"
+        first_static, first_inputs = split_template(template, {"blog_content": "Blog A", "theme": "ocean"})
+        second_static, second_inputs = split_template(template, {"blog_content": "Blog B", "theme": "forest"})
+
+        assert first_static == second_static
+        assert "<blog_content>" in first_static and "a { color: red; }" in first_static
+        assert "Blog A" not in first_static
+        assert first_inputs == "<blog_content>\nBlog A\n</blog_content>\n\n<theme>\nocean\n</theme>"
+        assert cached_system(first_static)[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_topic_prompt_is_cacheable(self):
+        generator = TopicGenerator(
+            "test-key",
+            enable_image_validation=False,
+            enable_evolution_tools=False
+        )
+        static, inputs = split_template(generator.generation_prompt, {
+            "blog_content": "Blog", "purpose": "pitch deck", "theme": "bold"
+        })
+        assert "{" not in static.split("<blog_content>")[0]
+        assert inputs.startswith("<blog_content>\nBlog")
+
+    def test_usage_metrics(self):
+        metrics = PromptCacheMetrics()
+        sink = HTMLStreamSink()
+        usage = SimpleNamespace(input_tokens=20, cache_read_input_tokens=3000,
+                                cache_creation_input_tokens=0, output_tokens=1)
+        sink.consume([
+            SimpleNamespace(type="message_start", message=SimpleNamespace(usage=usage)),
+            SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text="<html></html>")),
+            SimpleNamespace(type="message_delta", usage=SimpleNamespace(output_tokens=900)),
+        ])
+        metrics.record(sink.usage)
+
+        stats = metrics.get_stats()
+        assert stats["cache_read_input_tokens"] == 3000
+        assert stats["output_tokens"] == 900
+        assert stats["cache_read_ratio"] > 0.99
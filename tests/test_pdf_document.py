@@ -0,0 +1,69 @@
+import base64
+import hashlib
+import mmap
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from opencanvas.evaluation.evaluation_cache import content_hash
+from opencanvas.utils.pdf_document import PDFDocument
+
+PDF_BYTES = b"%PDF-1.4\n" + bytes(range(256)) * 64
+
+
+class TestPDFDocument:
+    """Test cases for the shared PDF document type"""
+
+    def write_pdf(self, temp_dir):
+        path = Path(temp_dir) / "presentation.pdf"
+        path.write_bytes(PDF_BYTES)
+        return path
+
+    def test_file_document_encodes_lazily_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            document = PDFDocument.from_file(self.write_pdf(temp_dir), mmap_threshold=0)
+
+            assert document.name == "presentation.pdf"
+            assert document._base64 is None
+            assert document.base64 == base64.b64encode(PDF_BYTES).decode("utf-8")
+            assert document.base64 is document.base64
+            assert document.to_bytes() is document.to_bytes() is document.data
+
+    def test_large_files_are_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            document = PDFDocument.from_file(self.write_pdf(temp_dir), mmap_threshold=1024)
+            try:
+                assert isinstance(document.data, mmap.mmap)
+                assert document.to_bytes() == PDF_BYTES
+                assert document.sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
+                assert len(document) == len(PDF_BYTES)
+            finally:
+                document.close()
+
+    def test_with_block_closes_memory_map(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with PDFDocument.from_file(self.write_pdf(temp_dir), mmap_threshold=1024) as document:
+                mapped = document.data
+                assert document.sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
+
+            assert mapped.closed
+            document.close()
+
+    def test_base64_documents_decode_only_on_demand(self):
+        text = base64.b64encode(PDF_BYTES).decode("utf-8")
+        document = PDFDocument.coerce(text)
+
+        assert document and document._data is None
+        assert document.base64 is text
+        assert document.data == PDF_BYTES
+        assert PDFDocument.coerce(document) is document
+
+    def test_hash_ignores_representation(self):
+        from_bytes = PDFDocument(PDF_BYTES)
+        from_text = PDFDocument.from_base64(base64.b64encode(PDF_BYTES).decode("utf-8"))
+        assert content_hash(from_bytes) == content_hash(from_text)
+
+    def test_requires_content(self):
+        with pytest.raises(ValueError):
+            PDFDocument()
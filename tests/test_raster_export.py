@@ -0,0 +1,65 @@
+import json
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+
+from opencanvas.conversion.html_to_pdf import PresentationConverter
+from opencanvas.conversion.raster_export import generate_thumbnails
+from tests.conftest import FakeSlidePage
+
+
+class DeckPage(FakeSlidePage):
+    """Slide page whose screenshots are real images in the slide's colour"""
+
+    def __init__(self):
+        super().__init__(count=3)
+        self.shots = []
+
+    def screenshot(self, path, **kwargs):
+        assert self.media == "screen"
+        size = (self.viewport_size["width"], self.viewport_size["height"])
+        Image.new("RGB", size, (self.active * 80, 0, 0)).save(path)
+        self.shots.append(self.active)
+
+
+class TestRasterExport:
+    """Test cases for slide images, thumbnails and the manifest"""
+
+    def test_pdf_images_and_manifest_from_one_session(self, inline_browser_pool):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "deck.html"
+            html_file.write_text("<div class='slide'>1</div>" * 3, encoding="utf-8")
+            converter = PresentationConverter(str(html_file), output_dir=temp_dir, method="playwright",
+                                              render_mode="single_pass", use_cache=False,
+                                              prefetch_assets=False, raster_export=True)
+            converter.method = "playwright"  # Even where Playwright is not installed
+            page = DeckPage()
+            inline_browser_pool(lambda: page)
+            pdf_path = converter.convert("presentation.pdf")
+
+            assert page.shots == [0, 1, 2]
+            assert page.viewport_size == {"width": 1280, "height": 720}
+            manifest = json.loads((Path(temp_dir) / "presentation_manifest.json").read_text())
+            assert manifest["pdf"] == "presentation.pdf" and Path(pdf_path).exists()
+            assert [slide["image"] for slide in manifest["slides"]] == [
+                f"presentation_slides/slide_0{number}.png" for number in (1, 2, 3)
+            ]
+            thumbnail = manifest["slides"][0]["thumbnail"]
+            assert (thumbnail["width"], thumbnail["height"]) == (480, 270)
+            with Image.open(Path(temp_dir) / thumbnail["path"]) as image:
+                assert image.format == "WEBP"
+
+    def test_thumbnails_on_process_pool(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_paths = []
+            for number in range(4):
+                path = Path(temp_dir) / f"slide_{number + 1:02d}.png"
+                Image.new("RGB", (1920, 1080), (0, number * 60, 0)).save(path)
+                image_paths.append(str(path))
+
+            thumbnails = generate_thumbnails(image_paths, Path(temp_dir) / "thumbs", width=320,
+                                             image_format="png", workers=2)
+
+            assert [Path(item["path"]).name for item in thumbnails] == [f"slide_0{n}.png" for n in (1, 2, 3, 4)]
+            assert all((item["width"], item["height"]) == (320, 180) for item in thumbnails)
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pytest
+
+from opencanvas.llm.rate_limit import RateLimiter, estimate_message_tokens, parse_rate_limits
+
+
+class TestRateLimiter:
+    """Test cases for the provider rate limiter"""
+
+    def test_parse_rate_limits(self):
+        limits = parse_rate_limits("anthropic=50:40000:8, openai/gpt-4.1=500:30000")
+        assert limits == {"anthropic": (50.0, 40000.0, 8), "openai/gpt-4.1": (500.0, 30000.0, 0)}
+        with pytest.raises(ValueError):
+            parse_rate_limits("anthropic=50")
+
+    def test_requests_per_minute(self):
+        # 600 rpm allows a burst of the full bucket, then one request every 0.1s
+        limiter = RateLimiter("test", requests_per_minute=600)
+        limiter._requests.level = 1
+        started = time.monotonic()
+        for _ in range(3):
+            with limiter.acquire():
+                pass
+        assert time.monotonic() - started >= 0.15
+        assert limiter.get_stats()["requests"] == 3
+
+    def test_tokens_are_settled_with_real_usage(self):
+        limiter = RateLimiter("test", tokens_per_minute=6000)
+        with limiter.acquire(5000) as lease:
+            lease.settle(1000)
+        assert limiter.get_stats()["tokens"] == 1000
+        assert limiter._tokens.wait_time(4500) == 0
+
+    def test_concurrency_and_fifo_order(self):
+        limiter = RateLimiter("test", max_concurrency=1)
+        order = []
+        release = threading.Event()
+
+        def hold():
+            with limiter.acquire():
+                release.wait(5)
+
+        def call(index):
+            with limiter.acquire():
+                order.append(index)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        while limiter.active == 0:
+            time.sleep(0.01)
+
+        waiters = []
+        for index in range(4):
+            thread = threading.Thread(target=call, args=(index,))
+            thread.start()
+            waiters.append(thread)
+            while limiter.queue_depth < index + 1:
+                time.sleep(0.01)
+
+        assert limiter.get_stats()["queue_depth"] == 4
+        release.set()
+        for thread in [holder] + waiters:
+            thread.join(5)
+
+        assert order == [0, 1, 2, 3]
+        assert limiter.get_stats()["max_queue_depth"] == 4
+
+    def test_interrupted_waiter_leaves_the_queue(self):
+        limiter = RateLimiter("test", max_concurrency=1)
+        admitted = threading.Event()
+
+        def interrupted(tokens):
+            raise KeyboardInterrupt
+
+        def call():
+            with limiter.acquire():
+                admitted.set()
+
+        with limiter.acquire():
+            limiter._admission_wait = interrupted
+            with pytest.raises(KeyboardInterrupt):
+                with limiter.acquire():
+                    pass
+            del limiter._admission_wait
+            assert limiter.queue_depth == 0
+
+            thread = threading.Thread(target=call, daemon=True)
+            thread.start()
+            while limiter.queue_depth == 0:
+                time.sleep(0.01)
+
+        assert admitted.wait(5)
+        assert limiter.get_stats()["requests"] == 2
+
+    def test_estimate_message_tokens(self):
+        params = {
+            "max_tokens": 100,
+            "system": [{"type": "text", "text": "x" * 400}],
+            "messages": [{"role": "user", "content": [
+                {"type": "document", "source": {}},
+                {"type": "text", "text": "y" * 40},
+            ]}],
+        }
+        assert estimate_message_tokens(params) == 100 + 1600 + 110
@@ -0,0 +1,56 @@
+from opencanvas.config import Config
+from opencanvas.conversion.readiness import (
+    READINESS_SCRIPT, SELENIUM_READINESS_SCRIPT, wait_for_driver, wait_for_page, wait_for_slide
+)
+
+
+class FakePage:
+    def __init__(self, result=120, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    def evaluate(self, script, options):
+        self.calls.append((script, options))
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class FakeDriver:
+    def __init__(self):
+        self.script_timeout = None
+        self.calls = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def execute_async_script(self, script, options):
+        self.calls.append((script, options))
+        return 80
+
+
+class TestReadiness:
+    """Test cases for event-driven readiness waits"""
+
+    def test_playwright_waits_use_caps(self):
+        page = FakePage()
+        assert wait_for_page(page) == 120
+        assert wait_for_slide(page, timeout_ms=250) == 120
+
+        (script, page_options), (_, slide_options) = page.calls
+        assert script == READINESS_SCRIPT
+        assert page_options == {'scope': 'document', 'timeout': Config.PAGE_READY_TIMEOUT_MS, 'quiet': 0}
+        assert slide_options == {'scope': 'slide', 'timeout': 250, 'quiet': 0}
+
+    def test_failed_check_does_not_raise(self):
+        assert wait_for_page(FakePage(error=RuntimeError("page closed"))) is None
+
+    def test_selenium_wait(self):
+        driver = FakeDriver()
+        assert wait_for_driver(driver, timeout_ms=2000) == 80
+
+        script, options = driver.calls[0]
+        assert script == SELENIUM_READINESS_SCRIPT
+        assert options == {'scope': 'document', 'timeout': 2000, 'quiet': Config.NETWORK_QUIET_MS}
+        assert driver.script_timeout > 2
@@ -0,0 +1,144 @@
+import threading
+import time
+
+from opencanvas.generators.topic_generator import TopicGenerator
+
+RESULTS = [{'title': f"Source {n}", 'link': f"https://example.com/{n}"} for n in range(1, 8)]
+
+
+def make_generator(brave_api_key=None):
+    generator = TopicGenerator(
+        "test-key",
+        enable_image_validation=False,
+        enable_evolution_tools=False,
+        skip_prompt_loading=True
+    )
+    generator.brave_api_key = brave_api_key
+    generator.generate_search_query = lambda user_text: f"query for {user_text}"
+    generator.web_search = lambda query, brave_api_key=None: list(RESULTS)
+    generator.assess_source_credibility = lambda results: results[:2]
+    generator.scrape_web_content = lambda url: f"content of {url}"
+    return generator
+
+
+class TestResearchTopic:
+    """Test cases for the concurrent knowledge assessment and research branch"""
+
+    def test_no_speculative_branch_without_brave_key(self):
+        generator = make_generator()
+        generator.assess_knowledge_depth = lambda user_text: "INSUFFICIENT"
+        started = []
+        generator._run_research_branch = lambda *args: started.append(args)
+
+        assert generator.research_topic("coral reefs") == ("INSUFFICIENT", None)
+        assert started == []
+
+    def test_speculative_branch_runs_alongside_assessment(self):
+        generator = make_generator(brave_api_key="brave-key")
+        branch_started = threading.Event()
+        original_query = generator.generate_search_query
+
+        def slow_assessment(user_text):
+            # The research branch starts before the assessment finishes
+            assert branch_started.wait(2)
+            return "INSUFFICIENT"
+
+        def query(user_text):
+            branch_started.set()
+            return original_query(user_text)
+
+        generator.assess_knowledge_depth = slow_assessment
+        generator.generate_search_query = query
+
+        assessment, context = generator.research_topic("coral reefs")
+        assert assessment == "INSUFFICIENT"
+        assert "content of https://example.com/1" in context
+        assert "content of https://example.com/2" in context
+
+    def test_sufficient_assessment_cancels_branch(self):
+        generator = make_generator(brave_api_key="brave-key")
+        branch_started = threading.Event()
+        searched = threading.Event()
+        scraped = []
+
+        def query(user_text):
+            branch_started.set()
+            return "query"
+
+        def search(query, brave_api_key=None):
+            # Still searching when the assessment comes back SUFFICIENT
+            searched.wait(2)
+            return list(RESULTS)
+
+        generator.generate_search_query = query
+        generator.web_search = search
+        generator.scrape_web_content = lambda url: scraped.append(url)
+
+        captured = {}
+        original_branch = generator._run_research_branch
+
+        def branch(user_text, cancel_event, deadline):
+            captured['event'] = cancel_event
+            captured['result'] = original_branch(user_text, cancel_event, deadline)
+            return captured['result']
+
+        generator._run_research_branch = branch
+        generator.assess_knowledge_depth = lambda user_text: "SUFFICIENT" if branch_started.wait(2) else None
+
+        assert generator.research_topic("coral reefs") == ("SUFFICIENT", None)
+        searched.set()
+        for _ in range(100):
+            if 'result' in captured:
+                break
+            time.sleep(0.02)
+
+        assert captured['event'].is_set()
+        assert captured['result'] is None
+        assert scraped == []
+
+
+class TestResearchBranch:
+    """Test cases for search, ranking and scraping inside the research branch"""
+
+    def test_cancel_event_stops_before_scraping(self):
+        generator = make_generator(brave_api_key="brave-key")
+        cancel_event = threading.Event()
+        scraped = []
+
+        def search(query, brave_api_key=None):
+            cancel_event.set()
+            return list(RESULTS)
+
+        generator.web_search = search
+        generator.scrape_web_content = lambda url: scraped.append(url)
+
+        assert generator._run_research_branch("coral reefs", cancel_event, time.monotonic() + 5) is None
+        assert scraped == []
+
+    def test_top_candidates_scraped_while_ranking(self):
+        generator = make_generator(brave_api_key="brave-key")
+        scraped = []
+        lock = threading.Lock()
+        all_started = threading.Event()
+
+        def scrape(url):
+            with lock:
+                scraped.append(url)
+                if len(scraped) == 5:
+                    all_started.set()
+            return f"content of {url}"
+
+        def rank(results):
+            # Ranking only finishes once the five top candidates are being scraped
+            assert all_started.wait(2)
+            return [results[3], results[0]]
+
+        generator.scrape_web_content = scrape
+        generator.assess_source_credibility = rank
+
+        context = generator._run_research_branch("coral reefs", threading.Event(), time.monotonic() + 5)
+
+        assert sorted(scraped) == sorted(result['link'] for result in RESULTS[:5])
+        # Selected sources keep the ranking order; unselected candidates are not used
+        assert context.index("content of https://example.com/4") < context.index("content of https://example.com/1")
+        assert "content of https://example.com/2" not in context
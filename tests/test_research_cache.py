@@ -0,0 +1,186 @@
+import os
+import time
+import pytest
+import tempfile
+from pathlib import Path
+
+from opencanvas.utils.disk_cache import DiskCache
+from opencanvas.generators.research_cache import ScrapeCache, SearchCache, normalize_url, normalize_query
+from opencanvas.generators.topic_generator import TopicGenerator
+
+SAMPLE_PAGE = b"""<html><body>
+<nav>Navigation</nav>
+<article><h1>Photosynthesis</h1><p>Plants convert light into chemical energy.</p></article>
+</body></html>"""
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class TestDiskCache:
+    """Test cases for the shared on-disk cache"""
+
+    def test_set_and_get(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.set("key", value={"a": 1}, metadata={"etag": "v1"}, data=b"payload")
+
+            record = cache.get("key")
+            assert record["value"] == {"a": 1}
+            assert record["metadata"]["etag"] == "v1"
+            assert cache.get_bytes("key") == b"payload"
+            assert cache.get("missing") is None
+
+            stats = cache.get_stats()
+            assert stats["hits"] >= 1
+            assert stats["misses"] == 1
+
+    def test_ttl_expiry_and_touch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir, default_ttl=0.05)
+            cache.set("key", value="text")
+            time.sleep(0.1)
+
+            assert cache.get("key") is None
+            stale = cache.get("key", include_expired=True)
+            assert stale["expired"] is True
+            stats = cache.get_stats()
+            assert (stats["hits"], stats["misses"], stats["stale"]) == (0, 1, 1)
+
+            assert cache.touch("key", ttl=60)
+            assert cache.get("key")["value"] == "text"
+
+    def test_lru_eviction(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir, max_size_bytes=3000)
+            for i in range(3):
+                cache.set(f"key{i}", data=b"x" * 800)
+                # Make access times distinguishable
+                past = time.time() - (10 - i)
+                os.utime(cache._record_path(f"key{i}"), (past, past))
+
+            # Touch the oldest entry so it becomes most recently used
+            assert cache.get("key0") is not None
+            cache.set("key3", data=b"x" * 800)
+
+            assert cache.get("key1") is None
+            assert cache.get("key0") is not None
+            assert cache.get("key3") is not None
+
+
+class TestScrapeCache:
+    """Test cases for research scrape caching"""
+
+    def test_normalize_url(self):
+        assert normalize_url("HTTPS://En.Wikipedia.org:443/wiki/Photosynthesis/#History") == \
+            "https://en.wikipedia.org/wiki/Photosynthesis"
+        assert normalize_url("https://example.gov/page?b=2&utm_source=x&a=1") == \
+            "https://example.gov/page?a=1&b=2"
+
+    def test_scrape_uses_cache_and_revalidates(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator = TopicGenerator(
+                "test-key",
+                enable_image_validation=False,
+                enable_evolution_tools=False,
+                skip_prompt_loading=True
+            )
+            generator.scrape_cache = ScrapeCache(cache_dir=Path(temp_dir), ttl_seconds=60)
+
+            calls = []
+
+            def fake_get(url, headers=None, timeout=None):
+                calls.append(headers or {})
+                if headers and headers.get("If-None-Match") == '"v1"':
+                    return FakeResponse(status_code=304)
+                return FakeResponse(content=SAMPLE_PAGE, headers={"ETag": '"v1"'})
+
+            monkeypatch.setattr("opencanvas.generators.topic_generator.requests.get", fake_get)
+
+            url = "https://example.edu/photosynthesis"
+            first = generator.scrape_web_content(url)
+            assert "chemical energy" in first
+            assert "Navigation" not in first
+
+            # Fresh hit: no HTTP request at all
+            assert generator.scrape_web_content(url + "#intro") == first
+            assert len(calls) == 1
+
+            # Stale entry: conditional GET answered with 304
+            generator.scrape_cache.cache.touch(normalize_url(url), ttl=0)
+            assert generator.scrape_web_content(url) == first
+            assert len(calls) == 2
+            assert calls[1]["If-None-Match"] == '"v1"'
+
+            # Only the fresh hit and the 304 refresh count as hits
+            stats = generator.scrape_cache.get_stats()
+            assert (stats["hits"], stats["stale"]) == (2, 0)
+
+
+class TestSearchCache:
+    """Test cases for Brave search result caching"""
+
+    def test_normalize_query(self):
+        assert normalize_query("The impact of AI on  Healthcare") == normalize_query("impact ai healthcare")
+        assert normalize_query("C++ templates") != normalize_query("C templates")
+        # Operators, quotes and term order change what a search returns
+        assert normalize_query("python -snake") != normalize_query("python snake")
+        assert normalize_query('"machine  learning" basics') == '"machine learning" basics'
+        assert normalize_query('"machine learning" basics') != normalize_query("machine learning basics")
+        assert normalize_query("healthcare AI impact") != normalize_query("impact AI healthcare")
+        assert normalize_query("cats OR dogs") == "cats OR dogs"
+        assert normalize_query("the of") == "the of"
+
+    def test_freshness_ttl_and_key(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SearchCache(cache_dir=Path(temp_dir))
+            results = [{"title": "Result", "url": "https://example.org", "description": "..."}]
+            cache.put("quantum computing", "en-US", "pw", results)
+
+            assert cache.get("Quantum Computing", "en-us", "pw") == results
+            assert cache.get("quantum computing", "en-US", "pd") is None
+            assert cache.ttl_for("pd") < cache.ttl_for("pw") < cache.ttl_for("py")
+
+            stats = cache.get_stats()
+            assert stats["hits"] == 1
+            assert stats["misses"] == 1
+
+    def test_web_search_uses_cache(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator = TopicGenerator(
+                "test-key",
+                enable_image_validation=False,
+                enable_evolution_tools=False,
+                skip_prompt_loading=True
+            )
+            generator.search_cache = SearchCache(cache_dir=Path(temp_dir))
+
+            calls = []
+
+            class SearchResponse(FakeResponse):
+                def json(self):
+                    return {"web": {"results": [
+                        {"title": "Photosynthesis", "url": "https://example.edu/p", "description": "Light"}
+                    ]}}
+
+            def fake_get(url, headers=None, params=None, timeout=None):
+                calls.append(params)
+                return SearchResponse()
+
+            monkeypatch.setattr("opencanvas.generators.topic_generator.requests.get", fake_get)
+
+            first = generator.web_search("photosynthesis in plants", "test-brave-key")
+            second = generator.web_search("Photosynthesis  plants", "test-brave-key")
+            assert first == second
+            assert first[0]["link"] == "https://example.edu/p"
+            assert len(calls) == 1
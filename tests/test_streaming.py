@@ -0,0 +1,86 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from opencanvas.generators.streaming import HTMLStreamSink
+
+SAMPLE_DECK = """<!DOCTYPE html>
+<html><head><style>.slide { display: none; }</style></head>
+<body>
+<div class="presentation">
+  <div id="slide-1" class="slide active">
+    <div class="slide-content"><h1>Title</h1><div class="bullets"><p>One</p></div></div>
+  </div>
+  <div id="slide-2" class="slide">
+    <div class="slide-content"><h2>Second</h2></div>
+  </div>
+</div>
+</body></html>"""
+
+
+def make_stream(text, chunk_size):
+    """Split text into fake content_block_delta events"""
+    yield SimpleNamespace(type="message_start")
+    for i in range(0, len(text), chunk_size):
+        yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text=text[i:i + chunk_size]))
+    yield SimpleNamespace(type="message_stop")
+
+
+class TestHTMLStreamSink:
+    """Test cases for the streaming HTML sink"""
+
+    def test_collects_stream_and_writes_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "slides" / "presentation.html"
+            with HTMLStreamSink(output_file=output_file) as sink:
+                html = sink.consume(make_stream(SAMPLE_DECK, 7))
+
+            assert html == SAMPLE_DECK
+            assert output_file.read_text(encoding="utf-8") == SAMPLE_DECK
+
+    def test_emits_complete_slides_across_chunk_boundaries(self):
+        for chunk_size in (1, 3, 16, len(SAMPLE_DECK)):
+            received = []
+            sink = HTMLStreamSink(on_slide=lambda index, slide: received.append((index, slide)))
+            sink.consume(make_stream(SAMPLE_DECK, chunk_size))
+
+            assert [index for index, _ in received] == [0, 1]
+            assert received[0][1].startswith('<div id="slide-1"')
+            assert received[0][1].endswith("</div>")
+            assert "<p>One</p>" in received[0][1]
+            assert "Second" in received[1][1] and "Title" not in received[1][1]
+            assert sink.slides == [slide for _, slide in received]
+
+    def test_publishes_cleaned_deck_only_after_stream_ends(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "presentation.html"
+            fenced = "```html\n" + SAMPLE_DECK + "\n```"
+            seen = []
+            sink = HTMLStreamSink(
+                output_file=output_file,
+                on_slide=lambda index, slide: seen.append(output_file.exists()),
+                clean=lambda text: text.strip()[7:-3].strip()
+            )
+            with sink:
+                sink.consume(make_stream(fenced, 16))
+
+            assert seen == [False, False]
+            assert output_file.read_text(encoding="utf-8") == SAMPLE_DECK
+            assert not sink.partial_file.exists()
+
+    def test_failed_stream_leaves_output_file_untouched(self):
+        def failing_stream():
+            yield from make_stream(SAMPLE_DECK[:120], 16)
+            raise RuntimeError("connection reset")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "presentation.html"
+            output_file.write_text("previous deck", encoding="utf-8")
+            try:
+                with HTMLStreamSink(output_file=output_file) as sink:
+                    sink.consume(failing_stream())
+            except RuntimeError:
+                pass
+
+            assert output_file.read_text(encoding="utf-8") == "previous deck"
+            assert not sink.partial_file.exists()
@@ -0,0 +1,44 @@
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from opencanvas.image_validation.topic_image_cache import TopicImageCache
+
+
+class TestTopicImageCache:
+    """Test cases for sharing the topic image cache between threads"""
+
+    def test_each_thread_uses_its_own_cursor(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TopicImageCache(str(Path(temp_dir) / "images.duckdb"))
+            cursors = {}
+
+            def grab(_):
+                cursors[threading.get_ident()] = cache.con
+                return cache.con is cursors[threading.get_ident()]
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                assert all(executor.map(grab, range(8)))
+            assert len({id(cursor) for cursor in cursors.values()}) == len(cursors)
+
+    def test_concurrent_lookups_and_inserts(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TopicImageCache(str(Path(temp_dir) / "images.duckdb"))
+            topics = [f"coral reef ecosystem number{i}" for i in range(8)]
+
+            def work(i):
+                topic = topics[i % len(topics)]
+                cache.add_images_for_topic(topic, [(f"id-{i}", 0, True, 0.9)])
+                cache.record_claude_call()
+                return cache.get_images_for_topic(topic)
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(work, range(40)))
+
+            assert all(results)
+            lookups, hits, claude_calls = cache.con.execute(
+                "SELECT total_lookups, cache_hits, claude_calls FROM cache_metrics"
+            ).fetchone()
+            assert (lookups, hits, claude_calls) == (40, 40, 40)
+            assert cache.get_stats()['total_images'] == 40